@@ -5,6 +5,9 @@ import path from "path";
 
 const SCRIPT_PATH = path.join(process.cwd(), "tools", "content_audit", "run_audit.py");
 const TIMEOUT_MS = 60_000;
+/** Run checks concurrently and return partial results (slow checks marked timed_out) well before TIMEOUT_MS. */
+const AUDIT_DEADLINE_S = 45;
+const SCRIPT_ARGS = ["--parallel", "--deadline", String(AUDIT_DEADLINE_S)];
 const PYTHON_CMDS = ["python3", "python"] as const;
 
 const UNAVAILABLE_MESSAGE =
@@ -20,7 +23,7 @@ function runWithPython(
 } {
   let py: ReturnType<typeof spawn> | null = null;
   const promise = new Promise<{ stdout: string; stderr: string; code: number | null }>((resolve, reject) => {
-    py = spawn(pythonCmd, [SCRIPT_PATH], {
+    py = spawn(pythonCmd, [SCRIPT_PATH, ...SCRIPT_ARGS], {
       stdio: ["pipe", "pipe", "pipe"],
       cwd: process.cwd(),
     });
@@ -53,12 +56,117 @@ function runWithPython(
   return { promise, kill };
 }
 
+/** Matches the start of run_audit.py's final {"event": "summary", ...} line. */
+const SUMMARY_LINE_RE = /^\{\s*"event"\s*:\s*"summary"/;
+
+/**
+ * Stream the audit as NDJSON (one {"event":"check",...} line per check as it completes, then
+ * {"event":"summary",...}). Falls back to the next Python command if spawning fails. The stream
+ * always ends with a summary line: if the script dies or times out without writing one, an
+ * ok:false summary is appended. Cancelling the response (client disconnect) kills the script.
+ */
+function streamAudit(payload: string): Response {
+  const encoder = new TextEncoder();
+  let finished = false;
+  let child: ReturnType<typeof spawn> | null = null;
+  let timeoutId: ReturnType<typeof setTimeout> | undefined;
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      // Whether the last byte forwarded was a newline, and the head of the current line
+      let atLineStart = true;
+      let lineHead = "";
+      let sawSummary = false;
+      const finish = (line?: Record<string, unknown>) => {
+        if (finished) return;
+        finished = true;
+        if (line) controller.enqueue(encoder.encode((atLineStart ? "" : "\n") + JSON.stringify(line) + "\n"));
+        controller.close();
+      };
+      const forward = (chunk: Buffer) => {
+        if (finished || chunk.length === 0) return;
+        controller.enqueue(new Uint8Array(chunk));
+        atLineStart = chunk[chunk.length - 1] === 0x0a;
+        // Only the first bytes of each line are needed to spot the summary; latin1 keeps them byte-exact
+        const lines = chunk.toString("latin1").split("\n");
+        lines.forEach((part, i) => {
+          if (lineHead.length < 64) lineHead = (lineHead + part).slice(0, 64);
+          if (i < lines.length - 1) {
+            if (SUMMARY_LINE_RE.test(lineHead)) sawSummary = true;
+            lineHead = "";
+          }
+        });
+      };
+
+      const attempt = (index: number) => {
+        const pythonCmd = PYTHON_CMDS[index];
+        const py = spawn(pythonCmd, [SCRIPT_PATH, ...SCRIPT_ARGS, "--stream"], {
+          stdio: ["pipe", "pipe", "pipe"],
+          cwd: process.cwd(),
+        });
+        child = py;
+        let started = false;
+        let retried = false;
+        let stderr = "";
+        const timer = setTimeout(() => {
+          py.kill("SIGKILL");
+          finish({ event: "summary", ok: false, error: "Content audit timed out." });
+        }, TIMEOUT_MS);
+        timeoutId = timer;
+
+        py.stdout.on("data", (chunk: Buffer) => {
+          started = true;
+          forward(chunk);
+        });
+        py.stderr.setEncoding("utf8");
+        py.stderr.on("data", (chunk: string) => {
+          stderr += chunk;
+        });
+        py.on("error", (err) => {
+          clearTimeout(timer);
+          if (!started && index + 1 < PYTHON_CMDS.length) {
+            retried = true;
+            attempt(index + 1);
+            return;
+          }
+          finish({ event: "summary", ok: false, error: UNAVAILABLE_MESSAGE, detail: err.message });
+        });
+        py.on("close", (code) => {
+          clearTimeout(timer);
+          if (retried) return;
+          // A summary without a trailing newline is still a summary
+          if (SUMMARY_LINE_RE.test(lineHead)) sawSummary = true;
+          if (started && code === 0 && sawSummary) finish();
+          else
+            finish({
+              event: "summary",
+              ok: false,
+              error: started ? "Content audit script exited before finishing." : "Content audit script failed.",
+              detail: stderr || `Exit code ${code}`,
+            });
+        });
+
+        py.stdin.write(payload);
+        py.stdin.end();
+      };
+      attempt(0);
+    },
+    cancel() {
+      finished = true;
+      clearTimeout(timeoutId);
+      child?.kill("SIGKILL");
+    },
+  });
+  return new Response(stream, {
+    headers: { "Content-Type": "application/x-ndjson; charset=utf-8", "Cache-Control": "no-store" },
+  });
+}
+
 export async function POST(request: NextRequest) {
   if (!(await isAuthenticated(request))) {
     return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
   }
 
-  let body: { title?: string; content?: string; html?: string };
+  let body: { title?: string; content?: string; html?: string; slug?: string; mode?: string; checks?: unknown };
   try {
     body = await request.json();
   } catch {
@@ -73,7 +181,19 @@ export async function POST(request: NextRequest) {
     return NextResponse.json({ error: "content is required" }, { status: 400 });
   }
 
-  const payload = JSON.stringify({ title, content, html });
+  const fields: Record<string, unknown> = { title, content, html };
+  // slug: the post's own entry in the site duplicate index is not reported as an overlap
+  if (typeof body.slug === "string" && body.slug.trim()) fields.slug = body.slug.trim();
+  // mode: "fast" samples long documents for the expensive checks (estimates with intervals)
+  if (body.mode === "fast") fields.mode = "fast";
+  // checks: run only these (the script skips loading models no selected check needs)
+  if (Array.isArray(body.checks) && body.checks.every((c) => typeof c === "string")) fields.checks = body.checks;
+  const payload = JSON.stringify(fields);
+
+  // ?stream=1: forward each check to the editor as soon as it completes
+  if (request.nextUrl.searchParams.get("stream") === "1") {
+    return streamAudit(payload);
+  }
 
   // Try python3 first, then python (e.g. Windows or some envs only have "python")
   let lastSpawnError: Error | null = null;
@@ -105,6 +225,7 @@ export async function POST(request: NextRequest) {
         ok?: boolean;
         error?: string;
         results?: unknown;
+        timed_out?: string[];
       };
       if (!data.ok && data.error) {
         return NextResponse.json({ error: data.error }, { status: 502 });
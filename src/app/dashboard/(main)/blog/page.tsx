@@ -46,7 +46,7 @@ type ContentAuditQualityResult = {
     skimmability?: { pass_fail: string; problematic_sections: { section_label: string; word_count: number; issue: string }[] } | { error: string };
     temporal_consistency?: { consistency_score: string; title_year?: number; stale_year_references: string[] } | { error: string };
     answer_first_structure?: { direct_answer_ratio: number; buried_answers: { heading_text: string; first_sentence: string; word_count: number }[]; total_questions: number } | { error: string };
-    entity_density?: { density_percent: number; top_entities: [string, string][]; unique_entity_count: number; skipped_reason?: string } | { error: string };
+    entity_density?: { density_percent: number; top_entities: [string, string][]; unique_entity_count: number; skipped_reason?: string; chunks?: number; truncated?: boolean; sampled?: boolean } | { error: string };
     readability_variance?: { variance_score: string; fatigue_sentences: string[]; monotony_detected: boolean } | { error: string };
     lazy_phrasing?: { score: number; found_transitions: string[]; found_hype: string[]; found_tells: string[] } | { error: string };
     sentence_starts?: { is_repetitive: boolean; repeating_word: string | null } | { error: string };
@@ -193,7 +193,12 @@ function EeatResultsDisplay({
             ? (r as { error: string }).error
             : (r as { skipped_reason?: string }).skipped_reason
               ? "Skipped (spacy not installed)"
-              : `${(r as { density_percent: number }).density_percent}%`,
+              : `${(r as { density_percent: number }).density_percent}%${
+                  (r as { truncated?: boolean; sampled?: boolean }).truncated ||
+                  (r as { truncated?: boolean; sampled?: boolean }).sampled
+                    ? " (partial text)"
+                    : ""
+                }`,
         detail: (r: unknown) =>
           isEeatError(r)
             ? null
@@ -933,7 +938,7 @@ export default function BlogMakerPage() {
   const eeatAutoRetryRef = useRef(0);
   /** Last (title, content) we sent to E-E-A-T successfully; used to debounce re-run on meta/content edits */
   const lastEeatInputRef = useRef<{ title: string; content: string } | null>(null);
-  const editingSnapshotRef = useRef<{ title: string; content: string }>({ title: "", content: "" });
+  const editingSnapshotRef = useRef<{ title: string; content: string; slug?: string }>({ title: "", content: "" });
   /** Track if we've auto-saved this generation to avoid duplicate saves */
   const autoSavedRef = useRef<string | null>(null);
   /** When we load from history or save, we get an id; use it for PATCH on subsequent saves */
@@ -1370,12 +1375,14 @@ export default function BlogMakerPage() {
     setEeatError(null);
     const title = editing.title;
     const content = editing.content;
+    // slug: lets the audit skip this post's own entry in the site duplicate index
+    const slug = editing.suggestedSlug;
     const doFetch = () =>
       fetch("/api/content-audit/quality", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         credentials: "include",
-        body: JSON.stringify({ title, content, html: content }),
+        body: JSON.stringify({ title, content, html: content, slug }),
       });
     doFetch()
       .then((res) => res.json())
@@ -1415,7 +1422,7 @@ export default function BlogMakerPage() {
   // Keep a snapshot of current editing for use in debounced E-E-A-T re-run
   useEffect(() => {
     if (editing) {
-      editingSnapshotRef.current = { title: editing.title, content: editing.content };
+      editingSnapshotRef.current = { title: editing.title, content: editing.content, slug: editing.suggestedSlug };
     }
   }, [editing]);
 
@@ -1439,6 +1446,7 @@ export default function BlogMakerPage() {
           title: current.title,
           content: current.content,
           html: current.content,
+          slug: current.slug,
         }),
       })
         .then((res) => res.json())
@@ -1609,6 +1617,7 @@ export default function BlogMakerPage() {
           title: editing.title,
           content: editing.content,
           html: editing.content,
+          slug: editing.suggestedSlug,
         }),
       });
       const data = await res.json();
@@ -2,7 +2,8 @@
 Content audit package: E-E-A-T and content integrity checks per Google Helpful Content guidelines.
 """
 
+from .document import AnalyzedDocument
 from .google_quality_auditor import GoogleQualityAuditor
 from .lazy_writing_auditor import LazyWritingAuditor
 
-__all__ = ["GoogleQualityAuditor", "LazyWritingAuditor"]
+__all__ = ["AnalyzedDocument", "GoogleQualityAuditor", "LazyWritingAuditor"]
@@ -0,0 +1,167 @@
+"""
+Lazy loading of heavy dependencies and explicit asset management.
+
+nltk, textblob, vaderSentiment, bs4 and spacy are imported on first use by the check that
+needs them, so `import content_audit` stays fast. numpy is optional and only speeds up
+MinHash signatures (duplicates.py); orjson is optional and only speeds up writing JSON
+(serialize.py). Nothing is downloaded implicitly: NLTK
+punkt data and the en_core_web_sm model are fetched only by `prefetch`, and `verify` fails
+fast (non-zero exit) when something is missing, e.g. at container build time:
+
+    python3 tools/content_audit/run_audit.py --prefetch-assets
+    python3 tools/content_audit/run_audit.py --verify-assets [--skip-spacy] [--import-budget-ms 150]
+
+`verify` also measures `import content_audit` in a fresh interpreter and fails if it takes
+longer than the budget or pulls in any heavy dependency; tests/test_assets.py asserts the same.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from functools import lru_cache
+from typing import Optional
+
+SPACY_MODEL = "en_core_web_sm"
+NLTK_RESOURCES = ("punkt_tab", "punkt")
+HEAVY_MODULES = ("nltk", "textblob", "vaderSentiment", "bs4", "spacy", "numpy")
+DEFAULT_IMPORT_BUDGET_MS = 150.0
+
+
+@lru_cache(maxsize=None)
+def load_nltk():
+    try:
+        import nltk
+    except ImportError:
+        return None
+    return nltk
+
+
+@lru_cache(maxsize=None)
+def load_textblob():
+    """TextBlob class, or None."""
+    try:
+        from textblob import TextBlob
+    except ImportError:
+        return None
+    return TextBlob
+
+
+@lru_cache(maxsize=None)
+def load_vader():
+    """vaderSentiment SentimentIntensityAnalyzer class, or None."""
+    try:
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    except ImportError:
+        return None
+    return SentimentIntensityAnalyzer
+
+
+@lru_cache(maxsize=None)
+def load_bs4():
+    """BeautifulSoup class, or None."""
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        return None
+    return BeautifulSoup
+
+
+@lru_cache(maxsize=None)
+def load_spacy():
+    try:
+        import spacy
+    except ImportError:
+        return None
+    return spacy
+
+
+@lru_cache(maxsize=None)
+def load_numpy():
+    """numpy module, or None (callers fall back to pure Python)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@lru_cache(maxsize=None)
+def load_orjson():
+    """orjson module, or None (serialize.py falls back to the stdlib json module)."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+@lru_cache(maxsize=None)
+def punkt_available() -> bool:
+    """True when nltk.sent_tokenize works (punkt / punkt_tab data is installed)."""
+    nltk = load_nltk()
+    if nltk is None:
+        return False
+    try:
+        nltk.sent_tokenize("Probe. Probe.")
+    except LookupError:
+        return False
+    return True
+
+
+def spacy_model_available() -> bool:
+    spacy = load_spacy()
+    return spacy is not None and spacy.util.is_package(SPACY_MODEL)
+
+
+def measure_import(module: str = "content_audit") -> dict:
+    """Import module in a fresh interpreter; report wall time and which heavy modules it loaded."""
+    tools_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = (
+        "import json, sys, time\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "ms = (time.perf_counter() - t) * 1000\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps({'import_ms': round(ms, 1), 'heavy_modules_loaded': heavy}))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [tools_dir, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, timeout=60)
+    if proc.returncode != 0:
+        return {"import_ms": None, "heavy_modules_loaded": [], "error": proc.stderr.strip()[-500:]}
+    return json.loads(proc.stdout)
+
+
+def verify(skip_spacy: bool = False, import_budget_ms: Optional[float] = DEFAULT_IMPORT_BUDGET_MS) -> dict:
+    """Check every dependency and data asset without downloading anything."""
+    checks = {
+        "nltk": load_nltk() is not None,
+        "nltk_punkt": punkt_available(),
+        "sentiment": load_textblob() is not None or load_vader() is not None,
+    }
+    if not skip_spacy:
+        checks["spacy"] = load_spacy() is not None
+        checks[SPACY_MODEL] = spacy_model_available()
+    report = {"ok": all(checks.values()), "checks": checks}
+    if import_budget_ms is not None:
+        timing = measure_import()
+        within = (
+            timing.get("import_ms") is not None
+            and timing["import_ms"] <= import_budget_ms
+            and not timing["heavy_modules_loaded"]
+        )
+        report["import"] = {**timing, "budget_ms": import_budget_ms, "ok": within}
+        report["ok"] = report["ok"] and within
+    return report
+
+
+def prefetch(skip_spacy: bool = False) -> dict:
+    """Download NLTK punkt data and the spacy model (needs network); returns verify() afterwards."""
+    nltk = load_nltk()
+    if nltk is not None:
+        for resource in NLTK_RESOURCES:
+            nltk.download(resource, quiet=True)
+        punkt_available.cache_clear()
+    if not skip_spacy and load_spacy() is not None and not spacy_model_available():
+        subprocess.run([sys.executable, "-m", "spacy", "download", SPACY_MODEL], check=False)
+    return verify(skip_spacy=skip_spacy, import_budget_ms=None)
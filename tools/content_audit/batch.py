@@ -0,0 +1,191 @@
+"""
+Batch corpus audit: run the full audit over every post in a directory or JSONL export.
+
+    cd tools && python -m content_audit.batch path/to/posts/ [--workers 8] [--max-in-flight 16]
+    cd tools && python -m content_audit.batch export.jsonl > results.jsonl
+    cd tools && python -m content_audit.batch export.jsonl --slug a-post --slug another-post
+    cd tools && python -m content_audit.batch export.jsonl --start 10000 --stop 20000
+
+Input is either a directory of .html/.htm/.md/.markdown files (slug = file name without
+extension; HTML pages are audited from their <article>, <main> or <body> with scripts,
+styles and navigation removed) or a JSONL file with one {slug, title, content, html} object per line.
+Posts are fanned out to a process pool whose workers each hold a warm AuditSession
+(auditors + spacy model). One JSON line per post is written as soon as it finishes, and
+at most --max-in-flight posts are read ahead, so memory stays flat on large corpora.
+--slug / --start / --stop read a JSONL export through its persistent slug index
+(corpus.py) and decode only the selected records.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import IO, Iterator, Optional
+
+from .cache import CACHE_DIR_ENV, ResultCache
+from .corpus import CorpusStore, decode_line
+from .document import main_content_html
+from .runner import AuditSession
+from .serialize import dumps
+
+HTML_EXTENSIONS = (".html", ".htm")
+MARKDOWN_EXTENSIONS = (".md", ".markdown")
+
+_HTML_TITLE_RE = re.compile(r"<(?:title|h1)[^>]*>(.*?)</(?:title|h1)>", re.I | re.S)
+_MD_TITLE_RE = re.compile(r"(?m)^#\s+(.+)$")
+
+# Per-process session, created by the pool initializer
+_session: Optional[AuditSession] = None
+
+
+def _init_worker(cache_dir: Optional[str] = None) -> None:
+    global _session
+    _session = AuditSession(cache=ResultCache(cache_dir) if cache_dir else None)
+
+
+def _audit_post(post: dict) -> dict:
+    """Audit one post in a pool worker; never raises so one bad post cannot stop the batch."""
+    start = time.perf_counter()
+    if post.get("error"):
+        record = {"ok": False, "error": post["error"]}
+    else:
+        try:
+            session = _session or AuditSession(preload_spacy=False)
+            record = session.audit(post)
+        except Exception as e:
+            record = {"ok": False, "error": str(e)}
+    return {
+        "slug": post.get("slug"),
+        "source": post.get("source"),
+        **record,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+
+
+def _post_from_file(path: str) -> dict:
+    with open(path, encoding="utf-8", errors="replace") as f:
+        text = f.read()
+    slug = os.path.splitext(os.path.basename(path))[0]
+    if path.lower().endswith(MARKDOWN_EXTENSIONS):
+        m = _MD_TITLE_RE.search(text)
+        return {"slug": slug, "source": path, "title": m.group(1).strip() if m else "", "markdown": text}
+    m = _HTML_TITLE_RE.search(text)
+    title = re.sub(r"<[^>]+>", "", m.group(1)).strip() if m else ""
+    # Audit the article, not the page around it (head, scripts, styles, navigation)
+    html = main_content_html(text)
+    return {"slug": slug, "source": path, "title": title, "content": html, "html": html}
+
+
+def iter_directory(root: str) -> Iterator[dict]:
+    """Yield one payload per HTML/Markdown file under root, in sorted path order."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if name.lower().endswith(HTML_EXTENSIONS + MARKDOWN_EXTENSIONS):
+                yield _post_from_file(os.path.join(dirpath, name))
+
+
+def iter_jsonl(path: str) -> Iterator[dict]:
+    """Yield one payload per JSONL line; malformed lines become error records."""
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            yield decode_line(line, f"{path}:{lineno}")
+
+
+def iter_export(
+    path: str, slugs: Optional[list[str]] = None, start: int = 0, stop: Optional[int] = None
+) -> Iterator[dict]:
+    """
+    Posts of a JSONL export read through its slug index: the given slugs (unknown ones become
+    error records), else records start..stop-1. Only those lines are decoded.
+    """
+    with CorpusStore(path) as store:
+        yield from store.get_many(slugs) if slugs else store.posts(start, stop)
+
+
+def iter_posts(path: str) -> Iterator[dict]:
+    if os.path.isdir(path):
+        return iter_directory(path)
+    return iter_jsonl(path)
+
+
+def run_batch(
+    posts: Iterator[dict],
+    out: IO[str],
+    workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> dict:
+    """
+    Audit posts across a process pool, writing one JSON line per post to out as each completes.
+    At most max_in_flight posts are submitted at once. Returns {"total", "ok", "failed"} counts.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max(max_in_flight or workers * 2, 1)
+    counts = {"total": 0, "ok": 0, "failed": 0}
+
+    def emit(done: set[Future]) -> None:
+        for fut in done:
+            result = fut.result()
+            counts["total"] += 1
+            counts["ok" if result.get("ok") else "failed"] += 1
+            out.write(dumps(result) + "\n")
+        out.flush()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(cache_dir,)) as pool:
+        pending: set[Future] = set()
+        for post in posts:
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                emit(done)
+            pending.add(pool.submit(_audit_post, post))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            emit(done)
+    return counts
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Audit every post in a directory or JSONL export.")
+    parser.add_argument("input", help="Directory of .html/.md files, or a JSONL export of {slug,title,content,html}")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--max-in-flight", type=int, default=None, help="Posts queued at once (default: 2 x workers)")
+    parser.add_argument("--output", "-o", default=None, help="Write JSONL results here instead of stdout")
+    parser.add_argument("--cache-dir", default=None, help="Share the SQLite result cache in this directory")
+    parser.add_argument("--slug", action="append", default=None, help="JSONL only: audit just this slug (repeatable)")
+    parser.add_argument("--start", type=int, default=None, help="JSONL only: first record to audit (0-based)")
+    parser.add_argument("--stop", type=int, default=None, help="JSONL only: stop before this record")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.input):
+        print(f"Input not found: {args.input}", file=sys.stderr)
+        return 1
+    selected = args.slug or args.start is not None or args.stop is not None
+    if selected and os.path.isdir(args.input):
+        parser.error("--slug/--start/--stop need a JSONL export")
+    if selected:
+        posts = iter_export(args.input, slugs=args.slug, start=args.start or 0, stop=args.stop)
+    else:
+        posts = iter_posts(args.input)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        counts = run_batch(
+            posts, out,
+            workers=args.workers, max_in_flight=args.max_in_flight,
+            cache_dir=args.cache_dir or os.environ.get(CACHE_DIR_ENV),
+        )
+    finally:
+        if args.output:
+            out.close()
+    print(json.dumps({"summary": counts}), file=sys.stderr)
+    return 0 if counts["failed"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
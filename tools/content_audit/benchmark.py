@@ -0,0 +1,328 @@
+"""
+Benchmark every audit check on deterministic synthetic articles (synthetic.py).
+
+    cd tools && python -m content_audit.benchmark [--sizes 1000,10000,50000] [--repeat 5]
+    cd tools && python -m content_audit.benchmark --save-baseline        # record current numbers
+    cd tools && python -m content_audit.benchmark --threshold 0.25 \\
+        --threshold-for entity_density=0.5                              # fail on regressions
+    cd tools && python -m content_audit.benchmark --titles 2000 --sizes ''   # title throughput only
+
+For each article size, every check runs --repeat times on a fresh AnalyzedDocument (so the
+artifacts it needs are included in its time), after one warm-up run. The report has
+p50/p90/p99/max latency per check and the check's peak traced allocation (tracemalloc,
+measured in a separate run so it does not skew latency).
+
+Title hyperbole is also measured as throughput (--titles, default 1000): titles per second
+scored one at a time with the polarity cache cleared before each (the cost without any
+sharing) and through check_title_hyperbole_many, once with all titles different and once
+with each title repeated about four times.
+
+With a baseline (default benchmark_baseline.json next to this file), a check regresses
+when its p50 is more than threshold slower than the baseline and more than
+--noise-floor-ms slower in absolute terms, or when its peak memory grows by more than
+--memory-threshold, or when batched title throughput drops by more than threshold.
+Regressions are listed and the exit code is 1. Baselines are only
+comparable on the same machine, article spec and dependency versions.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict
+from typing import Optional
+
+from .document import AnalyzedDocument
+from .google_quality_auditor import GoogleQualityAuditor
+from .lazy_writing_auditor import LazyWritingAuditor
+from .runner import check_calls
+from .synthetic import ArticleSpec, generate_article, generate_titles
+
+DEFAULT_SIZES = (1_000, 10_000, 50_000)
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.5
+DEFAULT_NOISE_FLOOR_MS = 2.0
+DEFAULT_TITLES = 1_000
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of values (pct in 0-100)."""
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def _run_check(
+    auditor: GoogleQualityAuditor, lazy_auditor: LazyWritingAuditor, text: str, html: str, title: str, name: str
+) -> None:
+    doc = AnalyzedDocument(text, html=html, title=title)
+    for check_name, fn, args in check_calls(auditor, lazy_auditor, doc):
+        if check_name == name:
+            fn(*args)
+            return
+    raise KeyError(name)
+
+
+def bench_check(
+    auditor: GoogleQualityAuditor,
+    lazy_auditor: LazyWritingAuditor,
+    text: str,
+    html: str,
+    title: str,
+    name: str,
+    repeat: int = DEFAULT_REPEAT,
+) -> dict:
+    """Latency percentiles (ms) and peak traced memory (KiB) of one check; {"error": ...} if it fails."""
+    try:
+        _run_check(auditor, lazy_auditor, text, html, title, name)  # warm-up: model loads, regex compiles
+    except Exception as e:
+        return {"error": str(e)}
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _run_check(auditor, lazy_auditor, text, html, title, name)
+        timings.append((time.perf_counter() - start) * 1000)
+    tracemalloc.start()
+    try:
+        _run_check(auditor, lazy_auditor, text, html, title, name)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": round(percentile(timings, 50), 2),
+        "p90_ms": round(percentile(timings, 90), 2),
+        "p99_ms": round(percentile(timings, 99), 2),
+        "max_ms": round(max(timings), 2),
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def bench_titles(count: int = DEFAULT_TITLES, distinct: Optional[int] = None, repeat: int = DEFAULT_REPEAT, seed: int = 0) -> dict:
+    """Titles per second (best of repeat runs): one at a time without cache vs check_title_hyperbole_many."""
+    titles = generate_titles(count, distinct=distinct, seed=seed)
+    auditor = GoogleQualityAuditor()
+    try:
+        auditor.check_title_hyperbole("Warm up")
+    except Exception as e:
+        return {"error": str(e)}
+    uncached, batched = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for title in titles:
+            auditor._polarity.cache_clear()
+            auditor.check_title_hyperbole(title)
+        uncached.append(time.perf_counter() - start)
+        auditor._polarity.cache_clear()
+        start = time.perf_counter()
+        auditor.check_title_hyperbole_many(titles)
+        batched.append(time.perf_counter() - start)
+    return {
+        "titles": count,
+        "distinct": len(set(titles)),
+        "uncached_per_s": round(count / min(uncached)),
+        "batched_per_s": round(count / min(batched)),
+        "speedup": round(min(uncached) / min(batched), 2),
+    }
+
+
+def run_benchmark(
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    checks: Optional[list[str]] = None,
+    spec: Optional[ArticleSpec] = None,
+    progress=None,
+    titles: int = DEFAULT_TITLES,
+) -> dict:
+    """Benchmark the selected checks (default: all) at each article size, plus title throughput."""
+    spec = spec or ArticleSpec()
+    auditor = GoogleQualityAuditor()
+    lazy_auditor = LazyWritingAuditor()
+    names = [n for n, _, _ in check_calls(auditor, lazy_auditor, AnalyzedDocument())]
+    unknown = set(checks or []) - set(names)
+    if unknown:
+        raise ValueError(f"Unknown checks: {', '.join(sorted(unknown))}")
+    names = [n for n in names if not checks or n in checks]
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "spec": {k: v for k, v in asdict(spec).items() if k != "words"},
+        },
+        "sizes": {},
+    }
+    for words in sizes:
+        article = generate_article(ArticleSpec(**{**asdict(spec), "words": words}))
+        text = article.text
+        results = {}
+        for name in names:
+            results[name] = bench_check(auditor, lazy_auditor, text, article.html, article.title, name, repeat)
+            if progress:
+                progress(words, name, results[name])
+        report["sizes"][str(words)] = {"words": len(text.split()), "checks": results}
+    if titles:
+        report["titles"] = {
+            "all_distinct": bench_titles(titles, repeat=repeat, seed=spec.seed),
+            "repeated": bench_titles(titles, distinct=max(titles // 4, 1), repeat=repeat, seed=spec.seed),
+        }
+    return report
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    check_thresholds: Optional[dict[str, float]] = None,
+    memory_threshold: float = DEFAULT_MEMORY_THRESHOLD,
+    noise_floor_ms: float = DEFAULT_NOISE_FLOOR_MS,
+) -> list[str]:
+    """Human-readable regressions of report against baseline (empty when within thresholds)."""
+    check_thresholds = check_thresholds or {}
+    regressions = []
+    for size, current in report["sizes"].items():
+        previous = baseline.get("sizes", {}).get(size)
+        if previous is None:
+            continue
+        for name, now in current["checks"].items():
+            before = previous["checks"].get(name)
+            if not before or "error" in now or "error" in before:
+                continue
+            limit = check_thresholds.get(name, threshold)
+            slower = now["p50_ms"] - before["p50_ms"]
+            if now["p50_ms"] > before["p50_ms"] * (1 + limit) and slower > noise_floor_ms:
+                regressions.append(
+                    f"{name} @ {size} words: p50 {before['p50_ms']} -> {now['p50_ms']} ms "
+                    f"(+{slower / max(before['p50_ms'], 1e-9):.0%}, limit {limit:.0%})"
+                )
+            if before["peak_kb"] and now["peak_kb"] > before["peak_kb"] * (1 + memory_threshold):
+                regressions.append(
+                    f"{name} @ {size} words: peak {before['peak_kb']} -> {now['peak_kb']} KiB "
+                    f"(limit +{memory_threshold:.0%})"
+                )
+    for scenario, now in report.get("titles", {}).items():
+        before = baseline.get("titles", {}).get(scenario)
+        if not before or "error" in now or "error" in before or now["titles"] != before["titles"]:
+            continue
+        if now["batched_per_s"] < before["batched_per_s"] / (1 + threshold):
+            regressions.append(
+                f"title_hyperbole_many ({scenario}): {before['batched_per_s']} -> {now['batched_per_s']} titles/s "
+                f"(limit -{threshold:.0%})"
+            )
+    return regressions
+
+
+def format_report(report: dict) -> str:
+    lines = []
+    for size, current in report["sizes"].items():
+        lines.append(f"== {size} words (actual {current['words']}) ==")
+        lines.append(f"{'check':<24}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}{'peak KiB':>12}")
+        for name, r in current["checks"].items():
+            if "error" in r:
+                lines.append(f"{name:<24}  error: {r['error']}")
+            else:
+                lines.append(
+                    f"{name:<24}{r['p50_ms']:>10}{r['p90_ms']:>10}{r['p99_ms']:>10}{r['max_ms']:>10}{r['peak_kb']:>12}"
+                )
+    if report.get("titles"):
+        lines.append("== title hyperbole throughput (titles/s) ==")
+        lines.append(f"{'scenario':<24}{'titles':>10}{'distinct':>10}{'uncached':>10}{'batched':>10}{'speedup':>12}")
+        for scenario, r in report["titles"].items():
+            if "error" in r:
+                lines.append(f"{scenario:<24}  error: {r['error']}")
+            else:
+                lines.append(
+                    f"{scenario:<24}{r['titles']:>10}{r['distinct']:>10}{r['uncached_per_s']:>10}"
+                    f"{r['batched_per_s']:>10}{r['speedup']:>11}x"
+                )
+    return "\n".join(lines)
+
+
+def _thresholds(values: list[str], parser: argparse.ArgumentParser) -> dict[str, float]:
+    out = {}
+    for value in values:
+        name, _, frac = value.partition("=")
+        try:
+            out[name] = float(frac)
+        except ValueError:
+            parser.error(f"--threshold-for expects NAME=FRACTION, got {value!r}")
+    return out
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark audit checks on synthetic articles.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated word counts")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timed runs per check and size")
+    parser.add_argument("--checks", default=None, help="Comma-separated check names (default: all)")
+    parser.add_argument("--headings", type=int, default=None, help="H2 sections (default: one per ~300 words)")
+    parser.add_argument("--faq-sections", type=int, default=ArticleSpec.faq_sections)
+    parser.add_argument("--numeric-density", type=float, default=ArticleSpec.numeric_density)
+    parser.add_argument("--lexicon-hit-rate", type=float, default=ArticleSpec.lexicon_hit_rate)
+    parser.add_argument("--seed", type=int, default=ArticleSpec.seed)
+    parser.add_argument("--titles", type=int, default=DEFAULT_TITLES, help="Titles for the throughput run (0 skips it)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON to compare against / save to")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed p50 slowdown (0.25 = 25%%)")
+    parser.add_argument(
+        "--threshold-for", action="append", default=[], metavar="NAME=FRACTION",
+        help="Per-check p50 slowdown limit (repeatable)",
+    )
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD)
+    parser.add_argument("--noise-floor-ms", type=float, default=DEFAULT_NOISE_FLOOR_MS)
+    parser.add_argument("--json", metavar="PATH", default=None, help="Also write the full report here")
+    args = parser.parse_args(argv)
+
+    spec = ArticleSpec(
+        headings=args.headings, faq_sections=args.faq_sections, numeric_density=args.numeric_density,
+        lexicon_hit_rate=args.lexicon_hit_rate, seed=args.seed,
+    )
+    sizes = tuple(int(s) for s in args.sizes.split(",") if s.strip())
+    checks = [c.strip() for c in args.checks.split(",")] if args.checks else None
+
+    def progress(words, name, result):
+        print(f"  {words:>7} words  {name:<24} {result.get('p50_ms', 'error')}", file=sys.stderr)
+
+    try:
+        report = run_benchmark(
+            sizes, repeat=max(args.repeat, 1), checks=checks, spec=spec, progress=progress, titles=args.titles
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("spec") != report["meta"]["spec"]:
+        print("Baseline was recorded with a different article spec; not comparing.")
+        return 0
+    regressions = compare(
+        report, baseline, threshold=args.threshold, check_thresholds=_thresholds(args.threshold_for, parser),
+        memory_threshold=args.memory_threshold, noise_floor_ms=args.noise_floor_ms,
+    )
+    if regressions:
+        print("Regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
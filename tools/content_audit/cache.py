@@ -0,0 +1,195 @@
+"""
+On-disk result cache for audit checks (SQLite, LRU-bounded).
+
+Entries are keyed by sha256(check name, check version, relevant inputs): the title for
+title_hyperbole, plain text and/or HTML for the rest. A check's version fingerprints
+the constants it reads (CLICKBAIT_WORDS, lexicons, heading regexes, ...) and the
+source of its method, so editing one check or its word list invalidates only that
+check's entries. Bump CHECK_REVISIONS to force invalidation for other reasons.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from . import assets
+from . import google_quality_auditor as gqa
+from . import lazy_writing_auditor as lwa
+from . import phrase_matcher, rhythm, sampling, section_index, signal_scanner
+from .document import align_spans, chunk_spans
+from .serialize import dumps
+
+CACHE_DIR_ENV = "CONTENT_AUDIT_CACHE_DIR"
+CACHE_FILENAME = "audit_cache.sqlite3"
+DEFAULT_MAX_ENTRIES = 10_000
+
+# Manual revision per check; bump to invalidate cached results when behaviour changes
+# in a way the automatic fingerprint cannot see (e.g. a dependency upgrade).
+CHECK_REVISIONS = {
+    "experience_signals": 1,
+    "title_hyperbole": 1,
+    "data_density": 1,
+    "skimmability": 1,
+    "temporal_consistency": 1,
+    "answer_first_structure": 1,
+    "entity_density": 1,
+    "readability_variance": 1,
+    "lazy_phrasing": 1,
+    "sentence_starts": 1,
+}
+
+
+def _fingerprint(*parts: Any) -> str:
+    raw = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+
+
+def _source(fn) -> str:
+    try:
+        return inspect.getsource(fn)
+    except (OSError, TypeError):
+        return ""
+
+
+def _spacy_model_version() -> Optional[str]:
+    try:
+        from importlib.metadata import version
+
+        return version("en_core_web_sm")
+    except Exception:
+        return None
+
+
+def check_versions(auditor: "gqa.GoogleQualityAuditor", lazy_auditor: "lwa.LazyWritingAuditor") -> dict[str, str]:
+    """Version stamp per check name (as used in run_audit.py results)."""
+    G = gqa.GoogleQualityAuditor
+    L = lwa.LazyWritingAuditor
+    if assets.load_textblob() is not None:
+        sentiment_backend = "textblob"
+    else:
+        sentiment_backend = "vader" if auditor._vader is not None else None
+    inputs = {
+        "experience_signals": (
+            sorted(gqa.FIRST_PERSON_PRONOUNS), sorted(gqa.EXPERIENCE_PRONOUNS),
+            sorted(gqa.ACTION_PROOF_VERBS), gqa.EXPERIENCE_PHRASE_PATTERNS,
+            _source(G.check_experience_signals), _source(G._experience_sentences), _source(G._experience_result),
+            _source(align_spans), _source(gqa._stripped_hit), _source(G._phrase_sentences),
+            _source(gqa._signal_scanner), _source(signal_scanner),
+            _source(G._experience_score), _source(G._experience_sampled), _source(G._sample_plan), _source(sampling),
+        ),
+        "title_hyperbole": (
+            gqa.CLICKBAIT_WORDS, sentiment_backend,
+            _source(G.check_title_hyperbole), _source(G._title_result), _source(G._title_polarity),
+            _source(gqa._clickbait_trigger), _source(gqa._clickbait_matcher),
+        ),
+        "data_density": (
+            gqa.NUMERIC_DATA_PATTERNS, gqa.CITATION_PATTERNS, gqa.DATA_POINT_KINDS,
+            _source(G.check_data_density), _source(gqa._signal_scanner), _source(signal_scanner),
+        ),
+        "skimmability": (
+            G._FAQ_HEADING_RE.pattern, G._SUMMARY_HEADING_RE.pattern, G._STEP_HEADING_RE.pattern,
+            _source(G.check_skimmability), _source(G._skim_sections), _source(G._evaluate_skimmability),
+            _source(section_index),
+        ),
+        "temporal_consistency": (
+            G._YEAR_CONTEXT_RE.pattern, gqa.YEAR_PATTERN,
+            _source(G.check_temporal_consistency), _source(gqa._signal_scanner), _source(signal_scanner),
+        ),
+        "answer_first_structure": (
+            G._QUESTION_START_RE.pattern,
+            _source(G.check_answer_first_structure), _source(G._question_answers), _source(G._evaluate_answer_first),
+            _source(section_index),
+        ),
+        "entity_density": (
+            _spacy_model_version(), auditor.spacy_exclude, auditor.entity_chunk_chars, auditor.entity_max_chars,
+            sorted(gqa.ENTITY_LABELS), _source(gqa._collect_entities), _source(chunk_spans),
+            _source(G.check_entity_density), _source(G._entity_result), _source(G._entity_chunked),
+            _source(G._entity_sampled), _source(G._sample_plan), _source(sampling),
+        ),
+        "readability_variance": (
+            _source(G.check_readability_variance), _source(G._fatigue_sentences), _source(G._readability_result),
+            _source(align_spans), gqa.MONOTONY_WINDOW, gqa.MONOTONY_TOLERANCE, _source(rhythm),
+            _source(G._readability_sampled), _source(G._sample_plan), _source(sampling),
+        ),
+        "lazy_phrasing": (
+            lazy_auditor.robotic_transitions, lazy_auditor.hollow_hype, lazy_auditor.ai_tells,
+            sorted(lazy_auditor.phrase_variants.items()),
+            _source(L.check_lazy_phrasing), _source(L._phrasing_result), _source(phrase_matcher),
+        ),
+        "sentence_starts": (
+            sorted(L.EXEMPT_STARTS), assets.punkt_available(),
+            _source(L.audit_sentence_starts), _source(lwa._sentence_spans), _source(align_spans),
+        ),
+    }
+    return {name: f"{CHECK_REVISIONS.get(name, 1)}-{_fingerprint(parts)}" for name, parts in inputs.items()}
+
+
+class ResultCache:
+    """
+    SQLite-backed cache of JSON-ready check results with least-recently-used eviction.
+    Safe to share between threads; separate processes can share the same directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        directory = directory or os.environ.get(CACHE_DIR_ENV)
+        if not directory:
+            raise ValueError(f"Cache directory required (pass directory or set {CACHE_DIR_ENV})")
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, CACHE_FILENAME)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, check_name TEXT NOT NULL, value TEXT NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)")
+
+    @staticmethod
+    def key(check_name: str, version: str, *inputs: Optional[str]) -> str:
+        h = hashlib.sha256()
+        for part in (check_name, version, *inputs):
+            h.update((part or "").encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        return json.loads(row[0])
+
+    def put(self, key: str, check_name: str, value: Any) -> None:
+        payload = dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, check_name, value, last_used) VALUES (?, ?, ?, ?)",
+                (key, check_name, payload, time.time()),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+            if count > self.max_entries:
+                self._conn.execute(
+                    "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()
+        return {"hits": self.hits, "misses": self.misses, "entries": entries}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,288 @@
+"""
+Random access to JSONL exports: memory-maps the file and keeps a persistent slug -> byte
+offset index next to it, so auditing one post does not read the whole export.
+
+    cd tools && python -m content_audit.corpus index export.jsonl
+    cd tools && python -m content_audit.corpus get export.jsonl some-slug | python content_audit/run_audit.py
+    cd tools && python -m content_audit.corpus slugs export.jsonl [--start 1000 --stop 2000]
+
+The index is a SQLite file (export.jsonl.index.sqlite3 unless index_path is given) with one
+row per non-blank line: ordinal, top-level slug (NULL when the record has none), byte
+offset, length and line number. It is built on first use by one scan for line breaks and
+"slug" keys over the mapped file; a line is decoded only when its first "slug" key might be
+nested (e.g. "related": [{"slug": ...}]). The index remembers the export's
+size and mtime. An export that only grew (lines appended) is indexed from where the last
+scan stopped; any other change rebuilds the index. Reads decode only the requested lines.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from typing import Iterable, Iterator, Optional
+
+INDEX_SUFFIX = ".index.sqlite3"
+# Trailing bytes of the indexed region fingerprinted to recognise an append-only change
+_TAIL_BYTES = 4096
+# Rows inserted per executemany while indexing
+_INSERT_BATCH = 10_000
+
+# Bumped when the way slugs are read from lines changes; an index of another version is rebuilt
+INDEX_VERSION = 2
+
+# A "slug": "..." key (top-level or nested); the value is a JSON string literal body.
+# Starts with a literal so the regex engine can jump between candidates.
+_SLUG_RE = re.compile(rb'"slug"\s*:\s*"((?:[^"\\]|\\.)*)"')
+_NON_BLANK_RE = re.compile(rb"\S")
+_NESTING_RE = re.compile(rb"[\[{]")
+
+
+def post_payload(record: dict, source: str) -> dict:
+    """run_audit.py payload for one export record."""
+    return {
+        "slug": record.get("slug"),
+        "source": source,
+        "title": record.get("title") or "",
+        "content": record.get("content") or "",
+        "html": record.get("html") or "",
+    }
+
+
+def decode_line(line: bytes, source: str) -> dict:
+    """Payload for one JSONL line; malformed lines become error records."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return {"source": source, "error": f"Invalid JSON: {e}"}
+    if not isinstance(record, dict):
+        return {"source": source, "error": "Invalid JSON: record must be an object"}
+    return post_payload(record, source)
+
+
+def _line_slug(buf, start: int, end: int) -> Optional[str]:
+    """
+    Top-level slug of the line buf[start:end] (None when the record has none). The regex
+    match is trusted only when it is provably top-level: no "[" or "{" between the record's
+    opening brace and the key, so it cannot sit in a nested object. Otherwise the line is decoded.
+    """
+    # \"slug\" inside a string value is escaped, so a real key never follows a backslash
+    first = next((m for m in _SLUG_RE.finditer(buf, start, end) if buf[m.start() - 1 : m.start()] != b"\\"), None)
+    if first is None:
+        # No "slug" key anywhere in the line
+        return None
+    opening = buf.find(b"{", start, first.start())
+    if opening >= 0 and not _NON_BLANK_RE.search(buf, start, opening) and not _NESTING_RE.search(buf, opening + 1, first.start()):
+        try:
+            return json.loads(b'"' + first.group(1) + b'"')
+        except ValueError:
+            return None
+    try:
+        record = json.loads(buf[start:end])
+    except ValueError:
+        return None
+    slug = record.get("slug") if isinstance(record, dict) else None
+    return slug if isinstance(slug, str) else None
+
+
+class CorpusStore:
+    """
+    Memory-mapped JSONL export with a persistent slug index.
+    When a slug occurs on several lines, the last one wins (later lines supersede earlier ones).
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str, index_path: Optional[str] = None):
+        self.path = path
+        self.index_path = index_path or path + INDEX_SUFFIX
+        self.index_stats: dict = {}
+        self._lock = threading.Lock()
+        self._file = open(path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        # mmap cannot map an empty file
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS records ("
+            " ordinal INTEGER PRIMARY KEY, slug TEXT, offset INTEGER NOT NULL,"
+            " length INTEGER NOT NULL, lineno INTEGER NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS records_slug ON records (slug);"
+        )
+        self._refresh(size)
+
+    # ---------- index ----------
+
+    def _tail_hash(self, size: int) -> str:
+        return hashlib.sha256(self._mm[max(size - _TAIL_BYTES, 0) : size]).hexdigest()
+
+    def _refresh(self, size: int) -> None:
+        """Bring the index up to date with the file: reuse it, extend it after an append, or rebuild it."""
+        start = time.perf_counter()
+        mtime_ns = os.fstat(self._file.fileno()).st_mtime_ns
+        meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        indexed = int(meta.get("size", -1))
+        current = meta.get("version") == str(INDEX_VERSION)
+        if current and indexed == size and meta.get("mtime_ns") == str(mtime_ns):
+            mode = "reused"
+        elif (
+            current
+            and 0 < indexed < size
+            and self._mm[indexed - 1 : indexed] == b"\n"
+            and meta.get("tail_hash") == self._tail_hash(indexed)
+        ):
+            mode = "appended"
+            self._index_from(indexed, int(meta["lines"]), size, mtime_ns)
+        else:
+            mode = "rebuilt"
+            self._index_from(0, 0, size, mtime_ns)
+        self.index_stats = {
+            "index": mode,
+            "records": len(self),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+
+    def _index_from(self, offset: int, lines: int, size: int, mtime_ns: int) -> None:
+        """Index the lines in [offset, size); lines is the number of lines before offset."""
+        mm = self._mm
+        conn = self._conn
+        with self._lock:
+            conn.execute("BEGIN")
+            try:
+                if offset == 0:
+                    conn.execute("DELETE FROM records")
+                (ordinal,) = conn.execute("SELECT COALESCE(MAX(ordinal) + 1, 0) FROM records").fetchone()
+                rows = []
+                pos = offset
+                while pos < size:
+                    newline = mm.find(b"\n", pos)
+                    end = size if newline == -1 else newline
+                    lines += 1
+                    if _NON_BLANK_RE.search(mm, pos, end):
+                        rows.append((ordinal, _line_slug(mm, pos, end), pos, end - pos, lines))
+                        ordinal += 1
+                        if len(rows) >= _INSERT_BATCH:
+                            conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?)", rows)
+                            rows = []
+                    pos = end + 1
+                conn.executemany("INSERT INTO records VALUES (?, ?, ?, ?, ?)", rows)
+                meta = {
+                    "version": INDEX_VERSION, "size": size, "mtime_ns": mtime_ns,
+                    "lines": lines, "tail_hash": self._tail_hash(size),
+                }
+                conn.executemany(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", [(k, str(v)) for k, v in meta.items()]
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    # ---------- reads ----------
+
+    def _payload(self, offset: int, length: int, lineno: int) -> dict:
+        return decode_line(self._mm[offset : offset + length], f"{self.path}:{lineno}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM records").fetchone()
+        return count
+
+    def __contains__(self, slug: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM records WHERE slug = ? LIMIT 1", (slug,)).fetchone() is not None
+
+    def get(self, slug: str) -> Optional[dict]:
+        """Payload of the (last) record with this slug, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT offset, length, lineno FROM records WHERE slug = ? ORDER BY ordinal DESC LIMIT 1", (slug,)
+            ).fetchone()
+        return self._payload(*row) if row is not None else None
+
+    def get_many(self, slugs: Iterable[str]) -> Iterator[dict]:
+        """Payloads for slugs in the given order; unknown slugs become error records."""
+        for slug in slugs:
+            post = self.get(slug)
+            yield post if post is not None else {"slug": slug, "source": self.path, "error": "slug not found"}
+
+    def slugs(self, start: int = 0, stop: Optional[int] = None) -> list[Optional[str]]:
+        """Slugs of records start..stop-1 in file order (None for records without one)."""
+        return [slug for slug, _, _, _ in self._rows(start, stop)]
+
+    def posts(self, start: int = 0, stop: Optional[int] = None) -> Iterator[dict]:
+        """Payloads of records start..stop-1 (record = non-blank line), decoded lazily in file order."""
+        for _, offset, length, lineno in self._rows(start, stop):
+            yield self._payload(offset, length, lineno)
+
+    def __iter__(self) -> Iterator[dict]:
+        return self.posts()
+
+    def _rows(self, start: int, stop: Optional[int], page: int = 1_000) -> Iterator[tuple]:
+        """Index rows in ordinal order, fetched a page at a time."""
+        stop = len(self) if stop is None else stop
+        while start < stop:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT slug, offset, length, lineno FROM records"
+                    " WHERE ordinal >= ? AND ordinal < ? ORDER BY ordinal",
+                    (start, min(start + page, stop)),
+                ).fetchall()
+            yield from rows
+            start += page
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+            if self._mm:
+                self._mm.close()
+            self._file.close()
+
+    def __enter__(self) -> "CorpusStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Indexed, memory-mapped access to a JSONL export.")
+    parser.add_argument("--index", default=None, help=f"Index file (default: EXPORT{INDEX_SUFFIX})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    index = sub.add_parser("index", help="Build or refresh the slug index and print its stats")
+    index.add_argument("export")
+    get = sub.add_parser("get", help="Print the run_audit.py payload of each slug (one JSON line each)")
+    get.add_argument("export")
+    get.add_argument("slugs", nargs="+")
+    slugs = sub.add_parser("slugs", help="Print record slugs in file order")
+    slugs.add_argument("export")
+    slugs.add_argument("--start", type=int, default=0)
+    slugs.add_argument("--stop", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.export):
+        print(f"Export not found: {args.export}", file=sys.stderr)
+        return 1
+    with CorpusStore(args.export, index_path=args.index) as store:
+        if args.command == "index":
+            print(json.dumps(store.index_stats))
+            return 0
+        if args.command == "get":
+            missing = 0
+            for post in store.get_many(args.slugs):
+                missing += "error" in post
+                print(json.dumps(post))
+            return 2 if missing else 0
+        for slug in store.slugs(args.start, args.stop):
+            print(slug if slug is not None else "")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
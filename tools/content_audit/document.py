@@ -0,0 +1,231 @@
+"""
+AnalyzedDocument: one article, analyzed lazily and at most once per artifact.
+
+Every GoogleQualityAuditor / LazyWritingAuditor check accepts either raw text or an
+AnalyzedDocument. Passing the same AnalyzedDocument to all checks means a full audit
+tokenizes words once, runs nltk.sent_tokenize once, indexes the HTML sections once, scans
+for numeric / citation / year / experience signals once and runs the spacy pipeline once.
+Artifacts are safe to request from checks running in parallel threads: each one is
+computed by the first caller while the others wait for it.
+"""
+
+import re
+import threading
+from functools import cached_property
+from typing import Iterator, Optional, Union
+
+from . import assets
+from .section_index import SectionIndex, build_html_index, build_markdown_index
+
+# spacy's default max_length; longer input is truncated (see check_entity_density)
+SPACY_MAX_CHARS = 1_000_000
+# Chunk size for long texts fed to spacy piecewise (see chunk_spans)
+SPACY_CHUNK_CHARS = 100_000
+# Preferred chunk boundaries, best first: paragraph break, sentence end, any whitespace
+_CHUNK_BREAKS = (("\n\n",), (". ", "! ", "? ", ".\n", "!\n", "?\n"), (" ", "\n"))
+
+
+class _artifact(cached_property):
+    """cached_property that computes at most once when several threads ask at the same time."""
+
+    def __get__(self, instance, owner=None):
+        if instance is None or self.attrname in instance.__dict__:
+            return super().__get__(instance, owner)
+        with instance._artifact_lock(self.attrname):
+            return super().__get__(instance, owner)
+
+
+class AnalyzedDocument:
+    """
+    Plain text (and optional HTML / title) of one article with memoized analysis artifacts.
+    Artifacts are computed on first access, so checks that are never run cost nothing.
+    """
+
+    def __init__(self, text: str = "", html: Optional[str] = None, title: str = ""):
+        self.text = text or ""
+        self.html = html or None
+        self.title = title or ""
+        self._spacy_docs: dict[int, object] = {}
+        self._signal_hits: dict[int, list] = {}
+        self._samples: dict[int, object] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def _artifact_lock(self, name: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+    @_artifact
+    def words(self) -> list[str]:
+        """Whitespace-delimited tokens of the plain text."""
+        return re.findall(r"\S+", self.text)
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @_artifact
+    def sentence_spans(self) -> list[tuple[int, int]]:
+        """(start, end) offsets into text of each nltk punkt sentence; the one sentence segmenter."""
+        nltk = assets.load_nltk()
+        if nltk is None:
+            raise RuntimeError("nltk is required. Install with: pip install nltk")
+        if not assets.punkt_available():
+            raise RuntimeError("NLTK punkt data not found. Run: python3 tools/content_audit/run_audit.py --prefetch-assets")
+        return align_spans(self.text, nltk.sent_tokenize(self.text))
+
+    @_artifact
+    def sentences(self) -> list[str]:
+        """Text of each sentence span."""
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @_artifact
+    def sentence_word_counts(self) -> list[int]:
+        """Word count of each entry in sentences."""
+        return [len(re.findall(r"\S+", s)) for s in self.sentences]
+
+    @_artifact
+    def section_index(self) -> SectionIndex:
+        """H2/H3 section index: one html.parser pass over the HTML, else the ## / ### Markdown split."""
+        if self.html:
+            return build_html_index(self.html)
+        return build_markdown_index(self.text)
+
+    @_artifact
+    def soup(self):
+        """BeautifulSoup tree of the HTML (None when there is no HTML)."""
+        if not self.html:
+            return None
+        BeautifulSoup = assets.load_bs4()
+        if BeautifulSoup is None:
+            raise RuntimeError("beautifulsoup4 is required. pip install beautifulsoup4")
+        return BeautifulSoup(self.html, "html.parser")
+
+    @property
+    def spacy_doc(self):
+        """en_core_web_sm Doc (default pipeline) for the plain text, truncated to SPACY_MAX_CHARS."""
+        from . import google_quality_auditor as gqa
+
+        nlp = gqa._get_nlp()
+        if nlp is None:
+            raise RuntimeError("spacy model en_core_web_sm not found. Run: python3 tools/content_audit/run_audit.py --prefetch-assets")
+        return self.spacy(nlp)
+
+    def spacy(self, nlp):
+        """Doc for the plain text from a specific loaded pipeline (memoized per pipeline)."""
+        key = id(nlp)
+        if key not in self._spacy_docs:
+            with self._artifact_lock(f"spacy:{key}"):
+                if key not in self._spacy_docs:
+                    self._spacy_docs[key] = nlp(self.text[:SPACY_MAX_CHARS])
+        return self._spacy_docs[key]
+
+    def signals(self, scanner):
+        """SignalScanner hits over the plain text (memoized per scanner)."""
+        key = id(scanner)
+        if key not in self._signal_hits:
+            with self._artifact_lock(f"signals:{key}"):
+                if key not in self._signal_hits:
+                    self._signal_hits[key] = scanner.scan(self.text)
+        return self._signal_hits[key]
+
+    def sample(self, sample_words: int):
+        """
+        Fast-mode SamplePlan of the plain text (sampling.py), memoized per sample size;
+        None when the text has at most sample_words words and is analyzed in full.
+        """
+        from . import sampling
+
+        if sample_words not in self._samples:
+            with self._artifact_lock(f"sample:{sample_words}"):
+                if sample_words not in self._samples:
+                    self._samples[sample_words] = sampling.plan_sample(self.text, self.word_count, sample_words)
+        return self._samples[sample_words]
+
+
+TextOrDocument = Union[str, AnalyzedDocument]
+
+
+def align_spans(text: str, pieces: list[str]) -> list[tuple[int, int]]:
+    """
+    (start, end) of each piece in text, searching forward from the end of the previous one.
+    Tokenizers such as punkt return exact slices of text in order, so this is one linear scan.
+    A piece that cannot be found (a tokenizer that rewrote it) gets the next len(piece) chars.
+    """
+    spans = []
+    pos = 0
+    for piece in pieces:
+        start = text.find(piece, pos)
+        if start < 0:
+            start = pos
+        end = min(start + len(piece), len(text))
+        spans.append((start, end))
+        pos = end
+    return spans
+
+
+def chunk_spans(text: str, chunk_chars: int = SPACY_CHUNK_CHARS) -> Iterator[tuple[int, int]]:
+    """
+    (start, end) spans covering text in order, each at most chunk_chars long. Cuts fall
+    after a paragraph break if the window has one, else after a sentence end, else at
+    whitespace; a window with none of these is cut hard.
+    """
+    pos, n = 0, len(text)
+    while pos < n:
+        end = pos + chunk_chars
+        if end >= n:
+            yield pos, n
+            return
+        cut = next(filter(None, (_last_break(text, pos, end, breaks) for breaks in _CHUNK_BREAKS)), end)
+        yield pos, cut
+        pos = cut
+
+
+def _last_break(text: str, start: int, end: int, breaks: tuple[str, ...]) -> int:
+    """Offset just after the last of breaks inside text[start:end] (0 if none past start)."""
+    best = 0
+    for b in breaks:
+        i = text.rfind(b, start, end)
+        if i > start:
+            best = max(best, i + len(b))
+    return best
+
+
+_NON_CONTENT_RE = re.compile(r"(?is)<!--.*?-->|<(script|style|noscript|template|head|nav)\b[^>]*>.*?</\1\s*>")
+# Containers of a saved page's main content, best first (first opening tag to last closing tag)
+_CONTENT_CONTAINER_RES = tuple(
+    re.compile(rf"(?is)<{tag}\b[^>]*>(.*)</{tag}\s*>") for tag in ("article", "main", "body")
+)
+
+
+def main_content_html(page: str) -> str:
+    """
+    The article body of a saved HTML page: comments and <script>, <style>, <noscript>,
+    <template>, <head> and <nav> elements removed, then the inside of <article>, else <main>,
+    else <body>. A fragment with none of these containers comes back with only the removals.
+    """
+    page = _NON_CONTENT_RE.sub(" ", page)
+    for container in _CONTENT_CONTAINER_RES:
+        m = container.search(page)
+        if m:
+            return m.group(1).strip()
+    return page.strip()
+
+
+def html_to_plain(s: str) -> str:
+    """Strip tags and collapse whitespace (same normalization the API route has always used)."""
+    s = re.sub(r"<[^>]+>", " ", s)
+    s = re.sub(r"\s+", " ", s)
+    return s.strip()
+
+
+def as_document(value: Optional[TextOrDocument], html: Optional[str] = None) -> AnalyzedDocument:
+    """
+    Return value as an AnalyzedDocument. An existing document is reused (with its memoized
+    artifacts) unless a different html is supplied.
+    """
+    if isinstance(value, AnalyzedDocument):
+        if html is None or html is value.html or html == value.html:
+            return value
+        return AnalyzedDocument(value.text, html=html, title=value.title)
+    return AnalyzedDocument(value or "", html=html)
@@ -0,0 +1,439 @@
+"""
+Site-wide near-duplicate and cannibalization detection with MinHash / LSH.
+
+    cd tools && python -m content_audit.duplicates add ../content/posts/ --index-dir .audit-index
+    cd tools && python -m content_audit.duplicates add export.jsonl          # or one .html/.md file
+    cd tools && python -m content_audit.duplicates query draft.html [--threshold 0.5]
+    cd tools && python -m content_audit.duplicates pairs > overlaps.jsonl
+    cd tools && python -m content_audit.duplicates remove some-slug
+
+Each post's plain text (html_to_plain, as in run_audit.py) is shingled into overlapping
+word 5-grams and summarized by a 128-value MinHash signature. Each H2 section with at least
+MIN_SECTION_WORDS words gets its own signature too, so two posts that share one section
+show up even when the rest differs. Signatures are split into 32 bands of 4 rows. Entries
+that agree on a whole band share an LSH bucket, and only bucket mates are compared, so a
+query costs a few indexed lookups instead of a corpus scan.
+
+The index is a SQLite file (DIR/near_duplicates.sqlite3, DIR from --index-dir or
+CONTENT_AUDIT_INDEX_DIR). add() replaces a post's entries only when its text changed, so
+re-adding an edited post is incremental. numpy, when installed, computes signatures
+vectorized; the result is identical to the pure-Python path.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from . import assets
+from .document import html_to_plain
+from .incremental import split_sections
+from .serialize import JSONResult
+
+INDEX_DIR_ENV = "CONTENT_AUDIT_INDEX_DIR"
+INDEX_FILENAME = "near_duplicates.sqlite3"
+
+SHINGLE_WORDS = 5
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+DEFAULT_THRESHOLD = 0.5
+MIN_SECTION_WORDS = 40
+
+POST = "post"
+SECTION = "section"
+
+# MinHash permutations h -> (a * h + b) mod P. With a, b < 2**31 and 32-bit shingle
+# hashes, a * h + b stays below 2**63, so numpy uint64 arithmetic never overflows and
+# matches Python ints exactly.
+_PRIME = (1 << 61) - 1
+_SEED = 1
+
+
+def _permutations() -> tuple[list[int], list[int]]:
+    rng = random.Random(_SEED)
+    a = [rng.randrange(1, 1 << 31) for _ in range(NUM_PERM)]
+    b = [rng.randrange(0, 1 << 31) for _ in range(NUM_PERM)]
+    return a, b
+
+
+_PERM_A, _PERM_B = _permutations()
+_WORD_RE = re.compile(r"\w+")
+_HEADING_RE = re.compile(r"(?is)<h2\b[^>]*>(.*?)</h2>")
+_NUMPY_BLOCK = 4096  # shingles per vectorized block (bounds the NUM_PERM x block temporary)
+
+
+@dataclass(slots=True)
+class Overlap(JSONResult):
+    slug: str
+    similarity: float  # estimated Jaccard similarity of the shingle sets
+    kind: str  # "post" (whole posts) or "section" (one H2 section of each)
+    section: Optional[str] = None  # query post's section heading (kind "section")
+    other_section: Optional[str] = None  # indexed post's section heading (kind "section")
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> set[int]:
+    """32-bit hashes of the lowercased word size-grams of text (one shingle if shorter)."""
+    words = _WORD_RE.findall(text.lower())
+    if not words:
+        return set()
+    if len(words) <= size:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))}
+    return {zlib.crc32(" ".join(words[i : i + size]).encode("utf-8")) for i in range(len(words) - size + 1)}
+
+
+def minhash(hashes: Iterable[int]) -> list[int]:
+    """NUM_PERM-value MinHash signature of a set of 32-bit hashes (all _PRIME when empty)."""
+    hashes = list(hashes)
+    if not hashes:
+        return [_PRIME] * NUM_PERM
+    np = assets.load_numpy()
+    if np is None:
+        return [min((a * h + b) % _PRIME for h in hashes) for a, b in zip(_PERM_A, _PERM_B)]
+    a = np.array(_PERM_A, dtype=np.uint64)[:, None]
+    b = np.array(_PERM_B, dtype=np.uint64)[:, None]
+    values = np.array(hashes, dtype=np.uint64)
+    signature = np.full(NUM_PERM, _PRIME, dtype=np.uint64)
+    for i in range(0, len(values), _NUMPY_BLOCK):
+        block = (a * values[None, i : i + _NUMPY_BLOCK] + b) % np.uint64(_PRIME)
+        np.minimum(signature, block.min(axis=1), out=signature)
+    return [int(v) for v in signature]
+
+
+def similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    """Estimated Jaccard similarity: the share of signature positions that agree."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def band_keys(signature: list[int]) -> list[int]:
+    """One signed 64-bit bucket key per band of signature."""
+    keys = []
+    for band in range(BANDS):
+        rows = array("Q", signature[band * ROWS : (band + 1) * ROWS]).tobytes()
+        keys.append(int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), "big", signed=True))
+    return keys
+
+
+def post_texts(post: dict) -> tuple[str, list[tuple[Optional[str], str]]]:
+    """
+    Plain text and (H2 heading, plain text) sections of a run_audit.py-style payload,
+    normalized the way runner.AuditSession does ("markdown", else "content" / "html").
+    """
+    markdown = (post.get("markdown") or "").strip()
+    if markdown:
+        chunks = split_sections(markdown=markdown)
+        sections = []
+        for chunk in chunks:
+            first, _, rest = chunk.partition("\n")
+            if first.startswith("## "):
+                sections.append((first[3:].strip(), rest))
+            else:
+                sections.append((None, chunk))
+        return markdown, sections
+    content = (post.get("content") or "").strip()
+    html = (post.get("html") or content).strip()
+    sections = []
+    for chunk in split_sections(html=html):
+        m = _HEADING_RE.match(chunk)
+        sections.append((html_to_plain(m.group(1)) if m else None, html_to_plain(chunk)))
+    return (html_to_plain(content) if content else ""), sections
+
+
+def post_hash(post: dict) -> str:
+    """sha256 of a payload's plain text and H2 sections (the indexed posts' content_hash)."""
+    text, sections = post_texts(post)
+    return hashlib.sha256("\0".join([text] + [f"{h}\0{b}" for h, b in sections]).encode("utf-8")).hexdigest()
+
+
+def _signatures(post: dict) -> list[tuple[str, Optional[str], int, list[int]]]:
+    """(kind, section heading, word count, signature) for the post and each long enough section."""
+    text, sections = post_texts(post)
+    entries = []
+    if text.strip():
+        entries.append((POST, None, len(text.split()), minhash(shingles(text))))
+    if len(sections) > 1:
+        for heading, body in sections:
+            words = len(body.split())
+            if heading is not None and words >= MIN_SECTION_WORDS:
+                entries.append((SECTION, heading, words, minhash(shingles(body))))
+    return entries
+
+
+def _pack(signature: list[int]) -> bytes:
+    return array("Q", signature).tobytes()
+
+
+def _unpack(blob: bytes) -> list[int]:
+    return array("Q", blob).tolist()
+
+
+class DuplicateIndex:
+    """
+    Persistent MinHash/LSH index of posts and their H2 sections.
+    Safe to share between threads; separate processes can share the same directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        directory = directory or os.environ.get(INDEX_DIR_ENV)
+        if not directory:
+            raise ValueError(f"Index directory required (pass directory or set {INDEX_DIR_ENV})")
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS posts ("
+            " slug TEXT PRIMARY KEY, content_hash TEXT NOT NULL, title TEXT, updated REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " id INTEGER PRIMARY KEY, slug TEXT NOT NULL, kind TEXT NOT NULL, label TEXT,"
+            " words INTEGER NOT NULL, signature BLOB NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS entries_slug ON entries (slug);"
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            " band INTEGER NOT NULL, bucket INTEGER NOT NULL, entry_id INTEGER NOT NULL,"
+            " PRIMARY KEY (band, bucket, entry_id)) WITHOUT ROWID;"
+        )
+        params = json.dumps({"shingle_words": SHINGLE_WORDS, "num_perm": NUM_PERM, "bands": BANDS, "seed": _SEED})
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is None:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (params,))
+        elif row[0] != params:
+            raise ValueError(f"{self.path} was built with different MinHash parameters ({row[0]}); rebuild it")
+
+    def add(self, post: dict) -> str:
+        """
+        Index one post payload (needs "slug"). Returns "added", "updated", or "unchanged"
+        when the post's text is the same as the indexed version.
+        """
+        slug = post.get("slug")
+        if not slug:
+            raise ValueError("post needs a slug")
+        content_hash = post_hash(post)
+        with self._lock:
+            row = self._conn.execute("SELECT content_hash FROM posts WHERE slug = ?", (slug,)).fetchone()
+        if row is not None and row[0] == content_hash:
+            return "unchanged"
+        entries = _signatures(post)
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete(slug)
+                self._conn.execute(
+                    "INSERT INTO posts (slug, content_hash, title, updated) VALUES (?, ?, ?, ?)",
+                    (slug, content_hash, post.get("title") or "", time.time()),
+                )
+                for kind, label, words, signature in entries:
+                    entry_id = self._conn.execute(
+                        "INSERT INTO entries (slug, kind, label, words, signature) VALUES (?, ?, ?, ?, ?)",
+                        (slug, kind, label, words, _pack(signature)),
+                    ).lastrowid
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO buckets (band, bucket, entry_id) VALUES (?, ?, ?)",
+                        [(band, key, entry_id) for band, key in enumerate(band_keys(signature))],
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return "added" if row is None else "updated"
+
+    def remove(self, slug: str) -> bool:
+        """Drop a post from the index; False if it was not indexed."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                found = self._delete(slug)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return found
+
+    def _delete(self, slug: str) -> bool:
+        self._conn.execute("DELETE FROM buckets WHERE entry_id IN (SELECT id FROM entries WHERE slug = ?)", (slug,))
+        self._conn.execute("DELETE FROM entries WHERE slug = ?", (slug,))
+        return self._conn.execute("DELETE FROM posts WHERE slug = ?", (slug,)).rowcount > 0
+
+    def query(self, post: dict, threshold: float = DEFAULT_THRESHOLD, exclude_slug: Optional[str] = None) -> list[Overlap]:
+        """
+        Indexed posts that overlap a post payload, most similar first: whole-post
+        near-duplicates and pairs of similar H2 sections. The post's own slug (or
+        exclude_slug) is skipped, so an indexed post can be queried against the rest, and
+        so are indexed posts with exactly the post's content (its own entry when the
+        payload carries no slug; exact copies under other slugs still show up in pairs()).
+        """
+        exclude = {exclude_slug or post.get("slug")}
+        with self._lock:
+            same = self._conn.execute("SELECT slug FROM posts WHERE content_hash = ?", (post_hash(post),)).fetchall()
+        exclude.update(slug for (slug,) in same)
+        overlaps: list[Overlap] = []
+        for kind, label, _, signature in _signatures(post):
+            for slug, other_label, score in self._candidates(kind, signature, threshold, exclude):
+                if kind == POST:
+                    overlaps.append(Overlap(slug=slug, similarity=score, kind=POST))
+                else:
+                    overlaps.append(
+                        Overlap(slug=slug, similarity=score, kind=SECTION, section=label, other_section=other_label)
+                    )
+        overlaps.sort(key=lambda o: (-o.similarity, o.slug, o.section or "", o.other_section or ""))
+        return overlaps
+
+    def _candidates(
+        self, kind: str, signature: list[int], threshold: float, exclude: set[Optional[str]]
+    ) -> Iterator[tuple[str, Optional[str], float]]:
+        with self._lock:
+            ids: set[int] = set()
+            for band, key in enumerate(band_keys(signature)):
+                ids.update(
+                    entry_id
+                    for (entry_id,) in self._conn.execute(
+                        "SELECT entry_id FROM buckets WHERE band = ? AND bucket = ?", (band, key)
+                    )
+                )
+            rows = self._rows(ids)
+        for slug, row_kind, label, blob in rows:
+            if row_kind != kind or slug in exclude:
+                continue
+            score = similarity(signature, _unpack(blob))
+            if score >= threshold:
+                yield slug, label, round(score, 3)
+
+    def _rows(self, ids: Iterable[int]) -> list[tuple]:
+        ids = list(ids)
+        rows = []
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            rows.extend(
+                self._conn.execute(
+                    f"SELECT slug, kind, label, signature FROM entries WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return rows
+
+    def pairs(self, threshold: float = DEFAULT_THRESHOLD) -> Iterator[dict]:
+        """
+        Every pair of different posts whose posts or sections overlap, from shared LSH buckets:
+        {"kind", "similarity", "a", "b"} (plus "a_section" / "b_section" for sections).
+        """
+        with self._lock:
+            groups = self._conn.execute(
+                "SELECT group_concat(entry_id) FROM buckets GROUP BY band, bucket HAVING count(*) > 1"
+            ).fetchall()
+        seen: set[tuple[int, int]] = set()
+        cache: dict[int, tuple] = {}
+        for (members,) in groups:
+            ids = sorted(int(m) for m in members.split(","))
+            missing = [i for i in ids if i not in cache]
+            if missing:
+                with self._lock:
+                    for row in self._conn.execute(
+                        f"SELECT id, slug, kind, label, signature FROM entries WHERE id IN ({','.join('?' * len(missing))})",
+                        missing,
+                    ):
+                        cache[row[0]] = (row[1], row[2], row[3], _unpack(row[4]))
+            for x, left in enumerate(ids):
+                for right in ids[x + 1 :]:
+                    if (left, right) in seen:
+                        continue
+                    seen.add((left, right))
+                    a, b = cache[left], cache[right]
+                    if a[0] == b[0] or a[1] != b[1]:
+                        continue
+                    score = similarity(a[3], b[3])
+                    if score < threshold:
+                        continue
+                    pair = {"kind": a[1], "similarity": round(score, 3), "a": a[0], "b": b[0]}
+                    if a[1] == SECTION:
+                        pair.update(a_section=a[2], b_section=b[2])
+                    yield pair
+
+    def stats(self) -> dict:
+        with self._lock:
+            (posts,) = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()
+            (sections,) = self._conn.execute("SELECT COUNT(*) FROM entries WHERE kind = ?", (SECTION,)).fetchone()
+        return {"posts": posts, "sections": sections}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def overlaps_json(overlaps: list[Overlap]) -> list[dict]:
+    """JSON-ready overlaps; section fields only where they apply."""
+    return [{k: v for k, v in o.to_json_dict().items() if v is not None} for o in overlaps]
+
+
+def _iter_input(path: str) -> Iterator[dict]:
+    from .batch import HTML_EXTENSIONS, MARKDOWN_EXTENSIONS, _post_from_file, iter_posts
+
+    if os.path.isfile(path) and path.lower().endswith(HTML_EXTENSIONS + MARKDOWN_EXTENSIONS):
+        return iter([_post_from_file(path)])
+    return iter_posts(path)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Near-duplicate / overlapping-section index (MinHash LSH).")
+    parser.add_argument("--index-dir", default=None, help=f"Index directory (default: ${INDEX_DIR_ENV})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Index (or re-index edited) posts: a directory, JSONL export or one file")
+    add.add_argument("path")
+    query = sub.add_parser("query", help="Indexed posts overlapping the given post(s)")
+    query.add_argument("path")
+    query.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    pairs = sub.add_parser("pairs", help="All overlapping post / section pairs in the index (JSONL)")
+    pairs.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    remove = sub.add_parser("remove", help="Drop posts from the index")
+    remove.add_argument("slugs", nargs="+")
+    args = parser.parse_args(argv)
+
+    try:
+        index = DuplicateIndex(args.index_dir)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == "add":
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        for post in _iter_input(args.path):
+            try:
+                if post.get("error"):
+                    raise ValueError(post["error"])
+                counts[index.add(post)] += 1
+            except ValueError as e:
+                counts["failed"] += 1
+                print(json.dumps({"source": post.get("source"), "error": str(e)}), file=sys.stderr)
+        print(json.dumps({**counts, **index.stats()}))
+        return 2 if counts["failed"] else 0
+    if args.command == "query":
+        for post in _iter_input(args.path):
+            start = time.perf_counter()
+            overlaps = index.query(post, threshold=args.threshold)
+            print(json.dumps({
+                "slug": post.get("slug"),
+                "overlaps": overlaps_json(overlaps),
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            }))
+        return 0
+    if args.command == "pairs":
+        for pair in index.pairs(threshold=args.threshold):
+            print(json.dumps(pair))
+        return 0
+    missing = [slug for slug in args.slugs if not index.remove(slug)]
+    if missing:
+        print(f"Not indexed: {', '.join(missing)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
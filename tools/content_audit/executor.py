@@ -0,0 +1,124 @@
+"""
+Concurrent check execution with per-check time budgets.
+
+Every check runs in its own daemon thread, so all of them share the warm auditors,
+the loaded spacy model and one AnalyzedDocument. The caller waits for each check at
+most its own budget (and never past the overall deadline), then moves on: whatever
+finished is returned, the rest are reported as timed out.
+
+Python threads cannot be killed, so a timed-out check keeps running in the
+background until it returns. lingering_checks() counts those; the worker recycles
+itself when they pile up, and the one-shot CLI exits without waiting for them.
+"""
+
+import queue
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+OK = "ok"
+ERROR = "error"
+TIMED_OUT = "timed_out"
+
+DEFAULT_CHECK_TIMEOUT_S = 30.0
+# Below the Next.js route's 60 s SIGKILL, leaving time to serialize and exit
+DEFAULT_DEADLINE_S = 50.0
+
+THREAD_PREFIX = "content-audit-check:"
+
+
+@dataclass
+class CheckOutcome:
+    status: str  # "ok" | "error" | "timed_out"
+    value: Any = None
+    error: Optional[str] = None
+    elapsed_ms: float = 0.0
+    cpu_ms: Optional[float] = None
+    peak_kb: Optional[float] = None
+
+
+def _budget_end(start: float, timeout: Optional[float], deadline: Optional[float]) -> Optional[float]:
+    limits = [start + t for t in (timeout, deadline) if t is not None]
+    return min(limits) if limits else None
+
+
+def run_checks(
+    calls: dict[str, Callable[[], Any]],
+    default_timeout: Optional[float] = DEFAULT_CHECK_TIMEOUT_S,
+    timeouts: Optional[dict[str, float]] = None,
+    deadline: Optional[float] = DEFAULT_DEADLINE_S,
+    on_outcome: Optional[Callable[[str, CheckOutcome], None]] = None,
+) -> dict[str, CheckOutcome]:
+    """
+    Run calls concurrently. Each check gets timeouts[name] seconds (default_timeout when
+    absent; None means no limit), capped by the overall deadline measured from the start.
+    on_outcome(name, outcome) is called from the calling thread as each check finishes or
+    times out. Returns one CheckOutcome per name, in the order of calls.
+    """
+    timeouts = timeouts or {}
+    completed: "queue.SimpleQueue[tuple[str, CheckOutcome]]" = queue.SimpleQueue()
+
+    def target(name: str, fn: Callable[[], Any]) -> None:
+        completed.put((name, run_inline(fn, trace_memory=False)))
+
+    start = time.monotonic()
+    ends = {name: _budget_end(start, timeouts.get(name, default_timeout), deadline) for name in calls}
+    for name, fn in calls.items():
+        threading.Thread(target=target, args=(name, fn), name=THREAD_PREFIX + name, daemon=True).start()
+
+    outcomes: dict[str, CheckOutcome] = {}
+
+    def settle(name: str, outcome: CheckOutcome) -> None:
+        outcomes[name] = outcome
+        if on_outcome is not None:
+            on_outcome(name, outcome)
+
+    while len(outcomes) < len(calls):
+        pending_ends = [end for name, end in ends.items() if name not in outcomes and end is not None]
+        wait = max(min(pending_ends) - time.monotonic(), 0.0) if pending_ends else None
+        try:
+            arrived = [completed.get(timeout=wait)]
+        except queue.Empty:
+            arrived = []
+        while not completed.empty():
+            arrived.append(completed.get_nowait())
+        for name, outcome in arrived:
+            if name not in outcomes:
+                settle(name, outcome)
+        now = time.monotonic()
+        for name, end in ends.items():
+            if name not in outcomes and end is not None and end <= now:
+                budget = end - start
+                settle(name, CheckOutcome(
+                    TIMED_OUT, error=f"exceeded its {budget:.1f}s budget", elapsed_ms=round(budget * 1000, 1)
+                ))
+    return {name: outcomes[name] for name in calls}
+
+
+def run_inline(fn: Callable[[], Any], trace_memory: bool = True) -> CheckOutcome:
+    """
+    Run one check in the current thread, capturing errors, wall and CPU time, and (when
+    tracemalloc is tracing and trace_memory is set) the check's own allocation peak.
+    """
+    trace = trace_memory and tracemalloc.is_tracing()
+    if trace:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+    t0 = time.perf_counter()
+    c0 = time.thread_time()
+    try:
+        outcome = CheckOutcome(OK, value=fn())
+    except Exception as e:
+        outcome = CheckOutcome(ERROR, error=str(e))
+    outcome.elapsed_ms = round((time.perf_counter() - t0) * 1000, 1)
+    outcome.cpu_ms = round((time.thread_time() - c0) * 1000, 1)
+    if trace:
+        outcome.peak_kb = round(max(tracemalloc.get_traced_memory()[1] - base, 0) / 1024, 1)
+    return outcome
+
+
+def lingering_checks() -> int:
+    """Number of timed-out check threads still running in this process."""
+    return sum(1 for t in threading.enumerate() if t.name.startswith(THREAD_PREFIX) and t.is_alive())
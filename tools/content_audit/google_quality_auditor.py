@@ -1,61 +1,83 @@
 """
 GoogleQualityAuditor: E-E-A-T and content integrity checks based on Google's
-"Helpful Content" guidelines. Uses nltk, textblob/vader, regex, spacy, and BeautifulSoup.
+"Helpful Content" guidelines. Uses nltk, textblob/vader, regex, spacy, and html.parser.
+
+Heavy dependencies are imported on first use by the check that needs them (see assets.py);
+nothing is downloaded at import or request time.
 """
 
 import re
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
-from typing import Optional
-
-# Optional deps: fail with clear message if missing
-try:
-    import nltk
-except ImportError:
-    nltk = None
-try:
-    from textblob import TextBlob
-except ImportError:
-    TextBlob = None
-try:
-    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-except ImportError:
-    SentimentIntensityAnalyzer = None
-try:
-    from bs4 import BeautifulSoup
-except ImportError:
-    BeautifulSoup = None
-try:
-    import spacy
-except ImportError:
-    spacy = None
-
-# Ensure NLTK data (run once: nltk.download("punkt") and/or "punkt_tab" for newer nltk)
-if nltk is not None:
-    for resource in ("punkt", "punkt_tab"):
-        try:
-            nltk.data.find(f"tokenizers/{resource}")
-        except LookupError:
-            try:
-                nltk.download(resource, quiet=True)
-            except Exception:
-                pass
-
-# Lazy-load spacy model
-_nlp = None
-
-def _get_nlp():
-    global _nlp
-    if _nlp is None and spacy is not None:
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from . import assets, rhythm
+from .document import SPACY_CHUNK_CHARS, SPACY_MAX_CHARS, AnalyzedDocument, TextOrDocument, as_document, chunk_spans
+from .sampling import DEFAULT_SAMPLE_WORDS, FAST, FULL, MODES, SampleEstimate, SamplePlan, richness, shifted
+from .serialize import JSONResult
+from .signal_scanner import SignalFamily, SignalHit, SignalScanner
+
+# Optional deps, resolved lazily: module attributes nltk / TextBlob / SentimentIntensityAnalyzer /
+# BeautifulSoup / spacy are still available (None when not installed) for existing callers.
+_LAZY_DEPS = {
+    "nltk": assets.load_nltk,
+    "TextBlob": assets.load_textblob,
+    "SentimentIntensityAnalyzer": assets.load_vader,
+    "BeautifulSoup": assets.load_bs4,
+    "spacy": assets.load_spacy,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_DEPS:
+        return _LAZY_DEPS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Entity density only reads doc.ents and the token count, so the tagger/parser/lemmatizer
+# components of en_core_web_sm are not loaded by default (faster load, less memory per doc).
+SPACY_EXCLUDE = ("tagger", "parser", "attribute_ruler", "lemmatizer", "senter")
+ENTITY_LABELS = frozenset(("ORG", "PRODUCT", "GPE", "PERSON", "EVENT"))
+
+# Lazy-load spacy model, one pipeline per excluded-components tuple
+_nlp_by_exclude: dict[tuple[str, ...], object] = {}
+
+def _get_nlp(exclude: Iterable[str] = SPACY_EXCLUDE):
+    """Loaded en_core_web_sm pipeline, or None if spacy or the model is missing (never downloads)."""
+    exclude = tuple(exclude)
+    nlp = _nlp_by_exclude.get(exclude)
+    spacy = assets.load_spacy()
+    if nlp is None and spacy is not None:
         try:
-            _nlp = spacy.load("en_core_web_sm")
+            nlp = spacy.load(assets.SPACY_MODEL, exclude=list(exclude))
         except OSError:
-            try:
-                import subprocess
-                subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"], check=False)
-                _nlp = spacy.load("en_core_web_sm")
-            except Exception:
-                _nlp = None
-    return _nlp
+            return None
+        _nlp_by_exclude[exclude] = nlp
+    return nlp
+
+
+# A sentence as (text, start, end), offsets into the audited plain text
+SentenceHit = tuple[str, int, int]
+
+
+def _stripped_hit(sentence: str, start: int, end: int) -> SentenceHit:
+    """sentence.strip() with its span narrowed to match."""
+    text = sentence.strip()
+    if not text:
+        return text, start, start
+    lead = len(sentence) - len(sentence.lstrip())
+    return text, start + lead, start + lead + len(text)
+
+
+def _collect_entities(doc, seen: set, entities: list[tuple[str, str]]) -> None:
+    """Append doc's new unique (text, label) ENTITY_LABELS entities to entities, in order."""
+    for ent in doc.ents:
+        if ent.label_ in ENTITY_LABELS and ent.text.strip():
+            key = (ent.text.strip(), ent.label_)
+            if key not in seen:
+                seen.add(key)
+                entities.append(key)
 
 
 # --- Experience signals (E-E-A-T) ---
@@ -77,6 +99,7 @@ ACTION_PROOF_VERBS = {
 }
 # Phrase-level patterns that signal firsthand experience (match the blog prompt's signals)
 # Support both contractions ("who's", "you've") and expanded forms ("who has", "you have")
+# Each must start with \b and a letter (the scanner only tries them at word starts)
 EXPERIENCE_PHRASE_PATTERNS = [
     r"\banyone who(?:'s| has| has ever)\b",
     r"\bif you(?:'ve|'ve ever| have| have ever)\b",
@@ -101,7 +124,39 @@ CLICKBAIT_WORDS = [
     "insane", "shocking", "miracle", "secret", "dead", "killer", "ultimate",
 ]
 
-# --- Data density: citation markers ---
+# --- Readability variance: MONOTONY_WINDOW sentences in a row within MONOTONY_TOLERANCE words ---
+MONOTONY_WINDOW = 5
+MONOTONY_TOLERANCE = 2
+
+# Distinct normalized titles whose sentiment polarity each auditor remembers
+POLARITY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=8)
+def _clickbait_matcher(words: tuple[str, ...]) -> re.Pattern:
+    """
+    One regex for all clickbait words. The zero-width lookahead is tried at every word
+    start and its alternatives are in list order, so the best-ranked word found anywhere
+    in a title is the one an in-order per-word search would report first.
+    """
+    return re.compile(r"\b(?=(" + "|".join(re.escape(w) for w in words) + r")\b)")
+
+
+def _clickbait_trigger(title_lower: str) -> Optional[str]:
+    """First word of CLICKBAIT_WORDS (in list order) that appears in title_lower as a whole word."""
+    words = tuple(CLICKBAIT_WORDS)
+    found = {m.group(1) for m in _clickbait_matcher(words).finditer(title_lower)}
+    return next((w for w in words if w in found), None) if found else None
+
+# --- Data density: hard data, e.g. "45%", "$500", "3.5x", "3.5 million" ---
+NUMERIC_DATA_PATTERNS = {
+    "percent": r"\d+(?:\.\d+)?\s*%",
+    "currency": r"\$\s*\d+(?:,\d{3})*(?:\.\d+)?|\d+(?:,\d{3})*(?:\.\d+)?\s*\$",
+    "multiplier": r"\d+(?:\.\d+)?\s*x\b",
+    "magnitude": r"\b\d+(?:\.\d+)?\s*(?:million|billion|percent)",
+}
+
+# --- Data density: citation markers (each starts with \b and a letter, like the experience phrases) ---
 CITATION_PATTERNS = [
     r"\baccording to\b",
     r"\bstudy showed\b",
@@ -114,119 +169,260 @@ CITATION_PATTERNS = [
     r"\bfindings\s+(?:from|show)\b",
 ]
 
+# Signal kinds that count as data points
+DATA_POINT_KINDS = (*NUMERIC_DATA_PATTERNS, "citation")
+
+# Four-digit years checked by check_temporal_consistency
+YEAR_PATTERN = r"\b(19\d{2}|20\d{2})\b"
+
 
-@dataclass
-class ExperienceSignalsResult:
+@lru_cache(maxsize=8)
+def _signal_scanner(citations: tuple[str, ...], year_context: str, experience: tuple[str, ...]) -> SignalScanner:
+    """
+    One scanner for every regex signal the checks count: data points (data_density),
+    years and year-context phrases (temporal_consistency) and experience phrases
+    (experience_signals). Experience phrases are reported at every position they match
+    so each sentence can be tested on its own.
+    """
+    families = [SignalFamily(kind, [pattern], lead=r"[\d$]") for kind, pattern in NUMERIC_DATA_PATTERNS.items()]
+    families += [
+        SignalFamily("year", [YEAR_PATTERN], lead=r"[\d$]"),
+        SignalFamily("citation", list(citations), lead=r"\b[a-z]"),
+        SignalFamily("year_context", [year_context], lead=r"[a-z]"),
+        SignalFamily("experience_phrase", list(experience), overlapping=True, lead=r"\b[a-z]"),
+    ]
+    return SignalScanner(families)
+
+
+@dataclass(slots=True)
+class ExperienceSignalsResult(JSONResult):
     score: float
     experience_sentences: list[str] = field(default_factory=list)
+    # (start, end) of each experience sentence in the audited plain text
+    experience_spans: list[tuple[int, int]] = field(default_factory=list)
+    # Fast mode on a sampled document: whole-document estimates (score, experience_sentences)
+    estimates: list[SampleEstimate] = field(default_factory=list)
 
 
-@dataclass
-class TitleHyperboleResult:
+@dataclass(slots=True)
+class TitleHyperboleResult(JSONResult):
     is_clickbait: bool
     trigger_word: Optional[str] = None
     sentiment_polarity: Optional[float] = None
     sentiment_trigger: Optional[str] = None  # "too_positive" | "too_negative" | None
 
 
-@dataclass
-class DataDensityResult:
+@dataclass(slots=True)
+class DataDensityResult(JSONResult):
     density_score: float
     data_point_count: int
     word_count: int
 
 
-@dataclass
-class ProblematicSection:
+@dataclass(slots=True)
+class ProblematicSection(JSONResult):
     section_label: str
     word_count: int
     issue: str  # "too_thin" | "wall_of_text"
 
 
-@dataclass
-class SkimmabilityResult:
+@dataclass(slots=True)
+class SkimmabilityResult(JSONResult):
     pass_fail: str  # "pass" | "fail"
     problematic_sections: list[ProblematicSection] = field(default_factory=list)
 
 
-@dataclass
-class TemporalConsistencyResult:
+@dataclass(slots=True)
+class TemporalConsistencyResult(JSONResult):
     consistency_score: str  # "pass" | "fail"
     title_year: Optional[int] = None
     stale_year_references: list[str] = field(default_factory=list)
 
 
-@dataclass
-class BuriedAnswer:
+@dataclass(slots=True)
+class BuriedAnswer(JSONResult):
     heading_text: str
     first_sentence: str
     word_count: int
 
 
-@dataclass
-class AnswerFirstStructureResult:
+@dataclass(slots=True)
+class AnswerFirstStructureResult(JSONResult):
     direct_answer_ratio: float
     buried_answers: list[BuriedAnswer] = field(default_factory=list)
     total_questions: int = 0
 
 
-@dataclass
-class EntityDensityResult:
+@dataclass(slots=True)
+class EntityDensityResult(JSONResult):
     density_percent: float
     top_entities: list[tuple[str, str]] = field(default_factory=list)  # (text, label)
     unique_entity_count: int = 0
     skipped_reason: Optional[str] = None  # set when spacy not available
-
-
-@dataclass
-class ReadabilityVarianceResult:
+    chunks: int = 1  # spacy passes the text was split into
+    truncated: bool = False  # only a prefix of the text was analyzed
+    sampled: bool = False  # only evenly spaced chunks (or, in fast mode, sampled blocks) were analyzed
+    # Fast mode on a sampled document: the density estimate with its interval
+    estimates: list[SampleEstimate] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MonotonyRun(JSONResult):
+    first_sentence: int
+    end_sentence: int  # exclusive
+    min_words: int
+    max_words: int
+    # Offsets of the run in the audited plain text (first sentence start to last sentence end)
+    start: Optional[int] = None
+    end: Optional[int] = None
+
+
+@dataclass(slots=True)
+class SentenceLengthProfile(JSONResult):
+    sentences: int
+    mean: float
+    std: float  # population standard deviation
+    max: int
+    p10: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+
+
+@dataclass(slots=True)
+class ReadabilityVarianceResult(JSONResult):
     variance_score: str  # "pass" | "fail" or a brief summary
     fatigue_sentences: list[str] = field(default_factory=list)
     monotony_detected: bool = False
+    # (start, end) of each fatigue sentence in the audited plain text
+    fatigue_spans: list[tuple[int, int]] = field(default_factory=list)
+    # Every stretch of MONOTONY_WINDOW+ sentences within MONOTONY_TOLERANCE words, in order
+    monotony_runs: list[MonotonyRun] = field(default_factory=list)
+    length_profile: Optional[SentenceLengthProfile] = None
+    # Fast mode on a sampled document: whole-document fatigue_sentences / monotony_runs counts
+    estimates: list[SampleEstimate] = field(default_factory=list)
 
 
 class GoogleQualityAuditor:
     """
     Analyzes text for E-E-A-T and content integrity signals per Google Helpful Content guidelines.
+
+    mode="fast" (or mode="fast" on a single check call) runs entity_density,
+    experience_signals and readability_variance on a stratified sample of about
+    sample_words words of longer documents (sampling.py); their results then carry
+    estimates with confidence intervals. The other checks always read the whole text.
     """
 
-    def __init__(self):
-        self._vader = SentimentIntensityAnalyzer() if SentimentIntensityAnalyzer else None
+    def __init__(
+        self,
+        spacy_exclude: Iterable[str] = SPACY_EXCLUDE,
+        entity_chunk_chars: int = SPACY_CHUNK_CHARS,
+        entity_max_chars: Optional[int] = None,
+        mode: str = FULL,
+        sample_words: int = DEFAULT_SAMPLE_WORDS,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r} (expected one of {', '.join(MODES)})")
+        self.mode = mode
+        self.sample_words = sample_words
+        self._vader_analyzer = None
+        # spacy components not loaded for entity checks; pass () for the full pipeline
+        self.spacy_exclude = tuple(spacy_exclude)
+        # Chunked entity extraction: chunk size, and optional cap on the characters analyzed
+        # (longer texts are sampled as evenly spaced chunks)
+        self.entity_chunk_chars = entity_chunk_chars
+        self.entity_max_chars = entity_max_chars
+        # Title sentiment, memoized by whitespace-normalized title
+        self._polarity = lru_cache(maxsize=POLARITY_CACHE_SIZE)(self._title_polarity)
+
+    @property
+    def _vader(self):
+        """VADER analyzer, built on first use (None if vaderSentiment is not installed)."""
+        if self._vader_analyzer is None:
+            analyzer_cls = assets.load_vader()
+            self._vader_analyzer = analyzer_cls() if analyzer_cls else None
+        return self._vader_analyzer
 
     def _require_nltk(self):
-        if nltk is None:
+        if assets.load_nltk() is None:
             raise RuntimeError("nltk is required. Install with: pip install nltk")
+        if not assets.punkt_available():
+            raise RuntimeError("NLTK punkt data not found. Run: python3 tools/content_audit/run_audit.py --prefetch-assets")
+
+    @classmethod
+    def _signal_scanner(cls) -> SignalScanner:
+        return _signal_scanner(tuple(CITATION_PATTERNS), cls._YEAR_CONTEXT_RE.pattern, tuple(EXPERIENCE_PHRASE_PATTERNS))
+
+    @classmethod
+    def _signals(cls, doc: AnalyzedDocument, *kinds: str) -> list[SignalHit]:
+        """The document's signal hits of the given kinds, from its one shared scan."""
+        return [hit for hit in doc.signals(cls._signal_scanner()) if hit.kind in kinds]
+
+    def _sample_plan(self, doc: AnalyzedDocument, mode: Optional[str]) -> Optional[SamplePlan]:
+        """The document's fast-mode sample, or None when the check should read all of it."""
+        mode = mode or self.mode
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r} (expected one of {', '.join(MODES)})")
+        return doc.sample(self.sample_words) if mode == FAST else None
 
     def _require_sentiment(self):
-        if TextBlob is None and self._vader is None:
+        if assets.load_textblob() is None and self._vader is None:
             raise RuntimeError("textblob or vaderSentiment required. pip install textblob vaderSentiment")
 
-    def _require_bs4(self):
-        if BeautifulSoup is None:
-            raise RuntimeError("beautifulsoup4 is required. pip install beautifulsoup4")
-
     def _require_spacy(self):
-        if spacy is None:
+        if assets.load_spacy() is None:
             raise RuntimeError("spacy is required. pip install spacy && python -m spacy download en_core_web_sm")
-        nlp = _get_nlp()
+        nlp = _get_nlp(self.spacy_exclude)
         if nlp is None:
-            raise RuntimeError("spacy model en_core_web_sm not found. Run: python -m spacy download en_core_web_sm")
+            raise RuntimeError("spacy model en_core_web_sm not found. Run: python3 tools/content_audit/run_audit.py --prefetch-assets")
 
     # ---------- Prompt 1: Quality & Trust (E-E-A-T) ----------
 
-    def check_experience_signals(self, text: str) -> ExperienceSignalsResult:
+    def check_experience_signals(self, text: TextOrDocument, mode: Optional[str] = None) -> ExperienceSignalsResult:
         """
         Identify experience signals: sentences with (first-person OR second-person/anyone)
         + action/proof verbs, OR sentences matching known experience-signal phrase patterns.
         Score = % of sentences that qualify.
         """
         self._require_nltk()
-        if not text or not text.strip():
+        doc = as_document(text)
+        if not doc.text.strip():
             return ExperienceSignalsResult(score=0.0, experience_sentences=[])
 
-        sentences = nltk.sent_tokenize(text)
+        plan = self._sample_plan(doc, mode)
+        if plan is not None:
+            return self._experience_sampled(plan)
+        return self._experience_result(self._experience_sentences(doc))
+
+    @classmethod
+    def _experience_sampled(cls, plan: SamplePlan) -> ExperienceSignalsResult:
+        """Experience sentences of the sampled blocks; the score comes from the estimated whole-document count."""
+        hits: list[SentenceHit] = []
+        counts = []
+        for (offset, _), block in zip(plan.blocks, plan.docs):
+            found = cls._experience_sentences(block)
+            counts.append(len(found))
+            hits += [(text, start + offset, end + offset) for text, start, end in found]
+        result = cls._experience_result(hits)
+        count = plan.estimate_total("experience_sentences", counts)
+        result.score = cls._experience_score(count.value)
+        score = SampleEstimate(
+            metric="score",
+            value=result.score,
+            ci_low=cls._experience_score(count.ci_low),
+            ci_high=cls._experience_score(count.ci_high),
+            sample_fraction=count.sample_fraction,
+        )
+        result.estimates = [score, count]
+        return result
+
+    @classmethod
+    def _experience_sentences(cls, doc: AnalyzedDocument) -> list[SentenceHit]:
+        """(text, start, end) of sentences that carry an experience signal (pronoun + action verb, or a known phrase)."""
+        phrase_sentences = cls._phrase_sentences(doc)
         experience_sentences = []
-        for sent in sentences:
+        for i, (sent, (start, end)) in enumerate(zip(doc.sentences, doc.sentence_spans)):
             sent_lower = sent.lower()
             words = set(re.findall(r"\b[a-z']+\b", sent_lower))
 
@@ -236,38 +432,74 @@ class GoogleQualityAuditor:
             pronoun_verb_match = has_any_pronoun and has_verb
 
             # Check phrase-level patterns (e.g. "anyone who's tried", "if you've ever")
-            phrase_match = any(re.search(p, sent_lower) for p in EXPERIENCE_PHRASE_PATTERNS)
+            phrase_match = i in phrase_sentences
 
             if pronoun_verb_match or phrase_match:
-                experience_sentences.append(sent.strip())
+                experience_sentences.append(_stripped_hit(sent, start, end))
+        return experience_sentences
+
+    @classmethod
+    def _phrase_sentences(cls, doc: AnalyzedDocument) -> set[int]:
+        """Indices of sentences containing a whole EXPERIENCE_PHRASE_PATTERNS match."""
+        spans = doc.sentence_spans
+        starts = [start for start, _ in spans]
+        scanner = cls._signal_scanner()
+        found: set[int] = set()
+        for hit in cls._signals(doc, "experience_phrase"):
+            i = bisect_right(starts, hit.start) - 1
+            if i < 0 or i in found or hit.start >= spans[i][1]:
+                continue
+            # A match that runs past the sentence end only counts if a shorter one fits inside it
+            if scanner.matches_within(hit, doc.text, spans[i][1]):
+                found.add(i)
+        return found
 
+    @classmethod
+    def _experience_result(cls, experience_sentences: list[SentenceHit]) -> ExperienceSignalsResult:
         # Absolute scoring: 3 experience signals = 100%. Matches the prompt's "2-3 per article" target.
         # Old formula (percentage of all sentences) penalized long articles unfairly.
-        count = len(experience_sentences)
-        score = min(count, 3) / 3.0 * 100.0
-        return ExperienceSignalsResult(score=round(score, 1), experience_sentences=experience_sentences)
+        return ExperienceSignalsResult(
+            score=cls._experience_score(len(experience_sentences)),
+            experience_sentences=[text for text, _, _ in experience_sentences],
+            experience_spans=[(start, end) for _, start, end in experience_sentences],
+        )
 
-    def check_title_hyperbole(self, title: str) -> TitleHyperboleResult:
+    @staticmethod
+    def _experience_score(count: float) -> float:
+        return round(min(count, 3) / 3.0 * 100.0, 1)
+
+    def check_title_hyperbole(self, title: TextOrDocument) -> TitleHyperboleResult:
         """
         Sentiment: flag if polarity > 0.8 or < -0.8. Flag clickbait words.
+        Accepts the title string or an AnalyzedDocument (its title is used).
         """
         self._require_sentiment()
-        trigger_word = None
-        sentiment_polarity = None
-        sentiment_trigger = None
+        return self._title_result(title.title if isinstance(title, AnalyzedDocument) else title)
 
-        title_lower = title.lower()
-        for w in CLICKBAIT_WORDS:
-            if re.search(r"\b" + re.escape(w) + r"\b", title_lower):
-                trigger_word = w
-                break
+    def check_title_hyperbole_many(self, titles: Iterable[TextOrDocument]) -> list[TitleHyperboleResult]:
+        """
+        check_title_hyperbole for many titles (headline variants, every title on a site).
+        Results are in input order and match the single-title check; repeated titles reuse
+        the auditor's polarity cache.
+        """
+        self._require_sentiment()
+        return [self._title_result(t.title if isinstance(t, AnalyzedDocument) else t) for t in titles]
 
+    def _title_polarity(self, normalized_title: str) -> Optional[float]:
+        """Sentiment polarity from TextBlob (VADER compound as fallback), None without either."""
+        TextBlob = assets.load_textblob()
         if TextBlob is not None:
-            blob = TextBlob(title)
-            sentiment_polarity = blob.sentiment.polarity
-        elif self._vader is not None:
-            comp = self._vader.polarity_scores(title)
-            sentiment_polarity = comp["compound"]
+            # What TextBlob(title).sentiment computes, without building the blob
+            return TextBlob.analyzer.analyze(normalized_title).polarity
+        if self._vader is not None:
+            return self._vader.polarity_scores(normalized_title)["compound"]
+        return None
+
+    def _title_result(self, title: str) -> TitleHyperboleResult:
+        sentiment_trigger = None
+        trigger_word = _clickbait_trigger(title.lower())
+        # Both sentiment backends tokenize on whitespace, so collapsing it does not change the score
+        sentiment_polarity = self._polarity(" ".join(title.split()))
 
         if sentiment_polarity is not None:
             if sentiment_polarity > 0.8:
@@ -283,26 +515,20 @@ class GoogleQualityAuditor:
             sentiment_trigger=sentiment_trigger,
         )
 
-    def check_data_density(self, text: str) -> DataDensityResult:
+    def check_data_density(self, text: TextOrDocument) -> DataDensityResult:
         """
         Count numbers/stats and citation markers; density per 100 words.
         """
-        if not text or not text.strip():
+        doc = as_document(text)
+        text = doc.text
+        if not text.strip():
             return DataDensityResult(density_score=0.0, data_point_count=0, word_count=0)
 
-        words = re.findall(r"\S+", text)
-        word_count = len(words)
-
-        # Hard data: percentages, currency, "Nx" multipliers, standalone numbers (e.g. "45%", "$500", "3.5x")
-        stats = 0
-        stats += len(re.findall(r"\d+(?:\.\d+)?\s*%", text))
-        stats += len(re.findall(r"\$\s*\d+(?:,\d{3})*(?:\.\d+)?|\d+(?:,\d{3})*(?:\.\d+)?\s*\$", text))
-        stats += len(re.findall(r"\d+(?:\.\d+)?\s*x\b", text, re.I))
-        # Other numeric stats (e.g. "3.5 million", "2024")
-        stats += len(re.findall(r"\b\d+(?:\.\d+)?\s*(?:million|billion|percent)", text, re.I))
+        word_count = doc.word_count
 
-        for pat in CITATION_PATTERNS:
-            stats += len(re.findall(pat, text, re.I))
+        # Hard data (percentages, currency, "Nx" multipliers, "3.5 million") and citation markers;
+        # each pattern counts its own non-overlapping matches, so "$3 million" is two data points
+        stats = len(self._signals(doc, *DATA_POINT_KINDS))
 
         density_per_100 = (stats / word_count * 100) if word_count else 0.0
         return DataDensityResult(
@@ -342,54 +568,37 @@ class GoogleQualityAuditor:
         """Return True if the heading is a step/process/how-to section (often short intro before lists)."""
         return bool(GoogleQualityAuditor._STEP_HEADING_RE.search(label.strip()))
 
-    def check_skimmability(self, text: str, html_content: Optional[str] = None) -> SkimmabilityResult:
+    def check_skimmability(self, text: TextOrDocument, html_content: Optional[str] = None) -> SkimmabilityResult:
         """
         Split by H2/H3; flag sections < 50 words (too thin) or > 300 words (wall of text).
-        Uses html_content if provided (BeautifulSoup), else parses text as markdown-style (## / ###).
+        Uses html_content (or the document's HTML) if provided, else parses text as
+        markdown-style (## / ###); both via the document's section index.
         FAQ Q&A sections (H3s under an FAQ H2) are exempt from the too_thin check
         because short answers are by design.
         """
+        doc = as_document(text, html_content)
+        sections = [
+            (label, len(re.findall(r"\S+", body)), tag_name) for label, body, tag_name in self._skim_sections(doc)
+        ]
+        return self._evaluate_skimmability(sections)
+
+    def _skim_sections(self, doc: AnalyzedDocument) -> list[tuple[str, str, Optional[str]]]:
+        """(label, body, tag_name) per H2/H3 section; tag_name is "h2"/"h3", or None for a heading-less document."""
+        index = doc.section_index
+        sections: list[tuple[str, str, Optional[str]]] = [(s.heading, s.body, s.tag) for s in index.sections]
+        # If no headings, treat whole as one section
+        if not sections and index.text:
+            sections.append(("(no headings)", index.text, None))
+        return sections
+
+    def _evaluate_skimmability(self, sections: list[tuple[str, int, Optional[str]]]) -> SkimmabilityResult:
+        """Flag thin / wall-of-text sections from (label, word_count, tag_name) tuples in document order."""
         problematic = []
-        # (label, body, tag_name) — tag_name is "h2"/"h3" or None
-        sections: list[tuple[str, str, Optional[str]]] = []
-
-        if html_content and (BeautifulSoup is not None):
-            self._require_bs4()
-            soup = BeautifulSoup(html_content, "html.parser")
-            for tag in soup.find_all(["h2", "h3"]):
-                label = tag.get_text(strip=True)
-                body_parts = []
-                for sib in tag.find_next_siblings():
-                    if sib.name in ("h2", "h3"):
-                        break
-                    if sib.name == "p":
-                        body_parts.append(sib.get_text(separator=" ", strip=True))
-                body = " ".join(body_parts)
-                sections.append((label, body, tag.name))
-            # If no headings, treat whole as one section
-            if not sections and soup.get_text(strip=True):
-                sections.append(("(no headings)", soup.get_text(separator=" ", strip=True), None))
-        else:
-            # Markdown-style: split by ## or ###
-            parts = re.split(r"(?m)^#{2,3}\s+.+$", text)
-            heading_matches = list(re.finditer(r"(?m)^(#{2,3}\s+.+)$", text))
-            if heading_matches:
-                for i, m in enumerate(heading_matches):
-                    raw = m.group(1)
-                    label = raw.lstrip("#").strip()
-                    tag_name = "h2" if raw.startswith("## ") and not raw.startswith("### ") else "h3"
-                    body = parts[i + 1].strip() if i + 1 < len(parts) else ""
-                    sections.append((label, body, tag_name))
-            else:
-                if text.strip():
-                    sections.append(("(no headings)", text.strip(), None))
-
         # Track whether we're inside an FAQ block (H2 = FAQ heading; ends at next H2)
         in_faq = False
-        for label, body, tag_name in sections:
+        for label, wc, tag_name in sections:
             if tag_name == "h2":
                 in_faq = self._is_faq_heading(label)
-            wc = len(re.findall(r"\S+", body))
             if wc < 50:
                 # Skip too_thin for FAQ Q&A sections — short answers are by design
                 # Skip too_thin for summary/table/takeaway sections — concise by design
@@ -410,14 +619,16 @@ class GoogleQualityAuditor:
         re.I,
     )
 
-    def check_temporal_consistency(self, title: str, text: str) -> TemporalConsistencyResult:
+    def check_temporal_consistency(self, title: str, text: TextOrDocument) -> TemporalConsistencyResult:
         """
         Extract year from title; flag mentions of years 3+ years older than title year.
         Years within 2 years (e.g. 2023, 2024 in a 2025 article) are recent context, not stale.
         Years in known contextual patterns (founded in, since, fiscal year) are exempt.
         """
+        doc = as_document(text)
+        text = doc.text
         title_year = None
-        m = re.search(r"\b(19\d{2}|20\d{2})\b", title)
+        m = re.search(YEAR_PATTERN, title)
         if m:
             title_year = int(m.group(1))
 
@@ -425,16 +636,16 @@ class GoogleQualityAuditor:
         if title_year is not None and text:
             # Build set of years that appear in contextual patterns (exempt)
             context_years: set[int] = set()
-            for cm in self._YEAR_CONTEXT_RE.finditer(text):
-                ym = re.search(r"\b(19\d{2}|20\d{2})\b", cm.group())
+            for hit in self._signals(doc, "year_context"):
+                ym = re.search(YEAR_PATTERN, text[hit.start : hit.end])
                 if ym:
                     context_years.add(int(ym.group(1)))
 
             # Flag years 3+ years older than title year (allow 2 years back as recent context)
-            for m in re.finditer(r"\b(19\d{2}|20\d{2})\b", text):
-                y = int(m.group(1))
+            for hit in self._signals(doc, "year"):
+                y = int(text[hit.start : hit.end])
                 if y < title_year - 2 and y not in context_years:
-                    stale_refs.append(m.group(0))
+                    stale_refs.append(text[hit.start : hit.end])
 
         consistency_score = "fail" if stale_refs else "pass"
         return TemporalConsistencyResult(
@@ -443,30 +654,39 @@ class GoogleQualityAuditor:
             stale_year_references=stale_refs,
         )
 
-    def check_answer_first_structure(self, html_content: str) -> AnswerFirstStructureResult:
+    def check_answer_first_structure(self, html_content: TextOrDocument) -> AnswerFirstStructureResult:
         """
         Find H2/H3 that start with What/How/Who/Why/Where; check next <p> first sentence <= 30 words.
+        Accepts an HTML string or an AnalyzedDocument (its HTML is used).
         """
-        self._require_bs4()
-        if not html_content or not html_content.strip():
+        if isinstance(html_content, AnalyzedDocument):
+            doc = html_content
+        else:
+            doc = AnalyzedDocument(html=html_content)
+        if not doc.html or not doc.html.strip():
             return AnswerFirstStructureResult(direct_answer_ratio=0.0, buried_answers=[], total_questions=0)
 
-        soup = BeautifulSoup(html_content, "html.parser")
-        question_start = re.compile(r"^\s*(what|how|who|why|where)\b", re.I)
+        return self._evaluate_answer_first(self._question_answers(doc))
+
+    _QUESTION_START_RE = re.compile(r"^\s*(what|how|who|why|where)\b", re.I)
+
+    def _question_answers(self, doc: AnalyzedDocument) -> list[tuple[str, Optional[str]]]:
+        """(heading_text, text of the next <p> or None) for each question-style H2/H3."""
+        return [
+            (section.heading, section.next_paragraph)
+            for section in doc.section_index.sections
+            if self._QUESTION_START_RE.search(section.heading)
+        ]
+
+    @staticmethod
+    def _evaluate_answer_first(pairs: list[tuple[str, Optional[str]]]) -> AnswerFirstStructureResult:
+        """Score question headings by whether the first sentence of their answer paragraph is <= 30 words."""
         buried = []
         direct_count = 0
         total_questions = 0
 
-        for tag in soup.find_all(["h2", "h3"]):
-            heading_text = tag.get_text(strip=True)
-            if not question_start.search(heading_text):
-                continue
+        for heading_text, first_p_text in pairs:
             total_questions += 1
-            first_p = tag.find_next("p")
-            if first_p is None:
-                buried.append(BuriedAnswer(heading_text=heading_text, first_sentence="", word_count=0))
-                continue
-            first_p_text = first_p.get_text(separator=" ", strip=True)
             if not first_p_text:
                 buried.append(BuriedAnswer(heading_text=heading_text, first_sentence="", word_count=0))
                 continue
@@ -486,43 +706,157 @@ class GoogleQualityAuditor:
             total_questions=total_questions,
         )
 
-    def check_entity_density(self, text: str) -> EntityDensityResult:
+    def check_entity_density(
+        self, text: TextOrDocument, chunked: Optional[bool] = None, mode: Optional[str] = None
+    ) -> EntityDensityResult:
         """
         spacy NER: ORG, PRODUCT, GPE, PERSON, EVENT. Density = (unique entities / words) * 100.
         If spacy or en_core_web_sm is not installed, returns skipped_reason (optional check).
+
+        chunked=None (default) runs one spacy pass when the text fits in SPACY_MAX_CHARS and
+        entity_max_chars, and the chunked pass otherwise. chunked=True always streams
+        paragraph-aligned chunks of entity_chunk_chars through spacy one at a time, so peak
+        memory follows the chunk size rather than the document. chunked=False is the old
+        single pass, which analyzes only the first SPACY_MAX_CHARS (truncated=True).
+        In fast mode a sampled document runs only its sampled blocks (chunked is ignored).
         """
+        nlp = self._entity_nlp()
+        if nlp is None:
+            return self._entity_skipped()
+        document = as_document(text)
+        if not document.text.strip():
+            return EntityDensityResult(density_percent=0.0, top_entities=[], unique_entity_count=0)
+
+        plan = self._sample_plan(document, mode)
+        if plan is not None:
+            return self._entity_sampled(nlp, plan)
+
+        if chunked is None:
+            limit = min(SPACY_MAX_CHARS, self.entity_max_chars or SPACY_MAX_CHARS)
+            chunked = len(document.text) > limit
+        if chunked:
+            return self._entity_chunked(nlp, document.text)
+        result = self._entity_result(document.spacy(nlp))
+        result.truncated = len(document.text) > SPACY_MAX_CHARS
+        return result
+
+    def check_entity_density_many(
+        self,
+        texts: Iterable[TextOrDocument],
+        batch_size: int = 64,
+        n_process: int = 1,
+    ) -> list[EntityDensityResult]:
+        """
+        check_entity_density for many texts through spacy's nlp.pipe (batched, optionally
+        multi-process). Results are in input order and match the single-text check.
+        """
+        documents = [as_document(t) for t in texts]
+        nlp = self._entity_nlp()
+        if nlp is None:
+            return [self._entity_skipped() for _ in documents]
+
+        results: list[EntityDensityResult] = [
+            EntityDensityResult(density_percent=0.0, top_entities=[], unique_entity_count=0) for _ in documents
+        ]
+        limit = min(SPACY_MAX_CHARS, self.entity_max_chars or SPACY_MAX_CHARS)
+        pending = ((d.text, i) for i, d in enumerate(documents) if d.text.strip() and len(d.text) <= limit)
+        for doc, i in nlp.pipe(pending, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            results[i] = self._entity_result(doc)
+        for i, d in enumerate(documents):
+            if len(d.text) > limit and d.text.strip():
+                results[i] = self._entity_chunked(nlp, d.text)
+        return results
+
+    def _entity_nlp(self):
+        """Loaded spacy pipeline for entity checks, or None when spacy / en_core_web_sm is unavailable."""
         try:
             self._require_spacy()
-            nlp = _get_nlp()
-            if nlp is None:
-                return EntityDensityResult(
-                    density_percent=0.0,
-                    top_entities=[],
-                    unique_entity_count=0,
-                    skipped_reason="Install: pip install spacy && python -m spacy download en_core_web_sm",
-                )
-        except RuntimeError as e:
-            return EntityDensityResult(
-                density_percent=0.0,
-                top_entities=[],
-                unique_entity_count=0,
-                skipped_reason="Install: pip install spacy && python -m spacy download en_core_web_sm",
+        except RuntimeError:
+            return None
+        return _get_nlp(self.spacy_exclude)
+
+    @staticmethod
+    def _entity_skipped() -> EntityDensityResult:
+        return EntityDensityResult(
+            density_percent=0.0,
+            top_entities=[],
+            unique_entity_count=0,
+            skipped_reason="Install: pip install spacy && python -m spacy download en_core_web_sm",
+        )
+
+    def _entity_chunked(self, nlp, text: str) -> EntityDensityResult:
+        """
+        Entity density over paragraph-aligned chunks, one spacy Doc alive at a time. Unique
+        (text, label) pairs and token counts are merged across chunks. With entity_max_chars
+        set and exceeded, only evenly spaced chunks totalling about that many characters run.
+        """
+        chunk_chars = min(self.entity_chunk_chars, SPACY_MAX_CHARS)
+        spans = chunk_spans(text, chunk_chars)
+        sampled = False
+        if self.entity_max_chars is not None and len(text) > self.entity_max_chars:
+            all_spans = list(spans)
+            keep = max(min(self.entity_max_chars // chunk_chars, len(all_spans)), 1)
+            step = len(all_spans) / keep
+            spans = [all_spans[int(i * step)] for i in range(keep)]
+            sampled = keep < len(all_spans)
+
+        seen: set[tuple[str, str]] = set()
+        entities: list[tuple[str, str]] = []
+        words = chunks = 0
+        for start, end in spans:
+            doc = nlp(text[start:end])
+            words += len(doc)
+            chunks += 1
+            _collect_entities(doc, seen, entities)
+            del doc
+        result = self._entity_density(words, seen, entities)
+        result.chunks = chunks
+        result.sampled = sampled
+        return result
+
+    def _entity_sampled(self, nlp, plan: SamplePlan) -> EntityDensityResult:
+        """
+        Entity density estimated from the sampled blocks: unique entities in the whole text
+        (those seen plus an estimate of those missed, sampling.richness) per token, with the
+        token count scaled up by the sampled share of words. top_entities and
+        unique_entity_count are what the sample contains.
+        """
+        mentions: Counter = Counter()
+        seen: set[tuple[str, str]] = set()
+        entities: list[tuple[str, str]] = []
+        tokens = 0
+        for doc in nlp.pipe(plan.text[start:end] for start, end in plan.blocks):
+            mentions.update((ent.text.strip(), ent.label_) for ent in doc.ents if ent.label_ in ENTITY_LABELS and ent.text.strip())
+            tokens += len(doc)
+            _collect_entities(doc, seen, entities)
+        result = self._entity_density(tokens, seen, entities)
+        result.chunks = len(plan.blocks)
+        result.sampled = True
+        fraction = plan.fraction
+        per_token = 100 / (tokens / fraction) if tokens else 0.0
+        estimate, low, high = richness(mentions.values(), fraction)
+        result.density_percent = round(estimate * per_token, 2)
+        result.estimates = [
+            SampleEstimate(
+                metric="density_percent",
+                value=result.density_percent,
+                ci_low=round(low * per_token, 2),
+                ci_high=round(high * per_token, 2),
+                sample_fraction=fraction,
             )
-        if not text or not text.strip():
-            return EntityDensityResult(density_percent=0.0, top_entities=[], unique_entity_count=0)
+        ]
+        return result
 
-        doc = nlp(text[:1_000_000])
-        words = len(list(doc))
-        keep_labels = {"ORG", "PRODUCT", "GPE", "PERSON", "EVENT"}
-        seen = set()
+    @classmethod
+    def _entity_result(cls, doc) -> EntityDensityResult:
+        """Density of unique ORG/PRODUCT/GPE/PERSON/EVENT entities per token of a spacy Doc."""
+        seen: set[tuple[str, str]] = set()
         entities: list[tuple[str, str]] = []
-        for ent in doc.ents:
-            if ent.label_ in keep_labels and ent.text.strip():
-                key = (ent.text.strip(), ent.label_)
-                if key not in seen:
-                    seen.add(key)
-                    entities.append((ent.text.strip(), ent.label_))
+        _collect_entities(doc, seen, entities)
+        return cls._entity_density(len(doc), seen, entities)
 
+    @staticmethod
+    def _entity_density(words: int, seen: set, entities: list[tuple[str, str]]) -> EntityDensityResult:
         density = (len(seen) / words * 100) if words else 0.0
         top5 = entities[:5]
         return EntityDensityResult(
@@ -531,28 +865,90 @@ class GoogleQualityAuditor:
             unique_entity_count=len(seen),
         )
 
-    def check_readability_variance(self, text: str) -> ReadabilityVarianceResult:
+    def check_readability_variance(self, text: TextOrDocument, mode: Optional[str] = None) -> ReadabilityVarianceResult:
         """
         Sentence length variance: flag 5+ consecutive sentences within ±2 words (monotony);
-        flag any sentence > 40 words (fatigue).
+        flag any sentence > 40 words (fatigue). Also reports every monotony run with its
+        location and a sentence-length profile (mean, std, percentiles), from one pass
+        over the length series (rhythm.py).
         """
         self._require_nltk()
-        if not text or not text.strip():
+        doc = as_document(text)
+        if not doc.text.strip():
             return ReadabilityVarianceResult(variance_score="pass", fatigue_sentences=[], monotony_detected=False)
 
-        sentences = nltk.sent_tokenize(text)
-        lengths = [len(re.findall(r"\S+", s)) for s in sentences]
-        fatigue_sentences = [s for s, L in zip(sentences, lengths) if L > 40]
-        monotony = False
-        for i in range(len(lengths) - 4):
-            window = lengths[i : i + 5]
-            if max(window) - min(window) <= 2:
-                monotony = True
-                break
-
-        variance_score = "fail" if (fatigue_sentences or monotony) else "pass"
+        plan = self._sample_plan(doc, mode)
+        if plan is not None:
+            return self._readability_sampled(plan)
+        lengths = doc.sentence_word_counts
+        spans = doc.sentence_spans
+        return self._readability_result(self._fatigue_sentences(doc.sentences, lengths, spans), lengths, spans)
+
+    @classmethod
+    def _readability_sampled(cls, plan: SamplePlan) -> ReadabilityVarianceResult:
+        """
+        Readability of the sampled blocks, each analyzed on its own (no monotony run spans two
+        blocks). Run sentence indices count sampled sentences; spans are document offsets.
+        The length profile is that of the sampled sentences.
+        """
+        fatigue: list[SentenceHit] = []
+        runs: list[MonotonyRun] = []
+        lengths: list[int] = []
+        fatigue_counts = []
+        run_counts = []
+        for (offset, _), block in zip(plan.blocks, plan.docs):
+            block_lengths = block.sentence_word_counts
+            spans = shifted(block.sentence_spans, offset)
+            found = cls._fatigue_sentences(block.sentences, block_lengths, spans)
+            part = cls._readability_result(found, block_lengths, spans)
+            for run in part.monotony_runs:
+                run.first_sentence += len(lengths)
+                run.end_sentence += len(lengths)
+            fatigue += found
+            runs += part.monotony_runs
+            lengths += block_lengths
+            fatigue_counts.append(len(found))
+            run_counts.append(len(part.monotony_runs))
+        stats = rhythm.length_stats(lengths)
+        return ReadabilityVarianceResult(
+            variance_score="fail" if (fatigue or runs) else "pass",
+            fatigue_sentences=[text for text, _, _ in fatigue],
+            monotony_detected=bool(runs),
+            fatigue_spans=[(start, end) for _, start, end in fatigue],
+            monotony_runs=runs,
+            length_profile=SentenceLengthProfile(**stats) if stats else None,
+            estimates=[
+                plan.estimate_total("fatigue_sentences", fatigue_counts),
+                plan.estimate_total("monotony_runs", run_counts),
+            ],
+        )
+
+    @staticmethod
+    def _fatigue_sentences(sentences: list[str], lengths: list[int], spans: list[tuple[int, int]]) -> list[SentenceHit]:
+        """(text, start, end) of sentences longer than 40 words."""
+        return [(s, start, end) for s, L, (start, end) in zip(sentences, lengths, spans) if L > 40]
+
+    @staticmethod
+    def _readability_result(
+        fatigue_sentences: list[SentenceHit], lengths: list[int], spans: Optional[list[tuple[int, int]]] = None
+    ) -> ReadabilityVarianceResult:
+        """Combine fatigue sentences with the monotony runs and length profile of the sentence-length series."""
+        runs = []
+        for first, end in rhythm.monotony_runs(lengths, MONOTONY_WINDOW, MONOTONY_TOLERANCE):
+            run = MonotonyRun(
+                first_sentence=first, end_sentence=end, min_words=min(lengths[first:end]), max_words=max(lengths[first:end])
+            )
+            if spans is not None:
+                run.start, run.end = spans[first][0], spans[end - 1][1]
+            runs.append(run)
+        stats = rhythm.length_stats(lengths)
+
+        variance_score = "fail" if (fatigue_sentences or runs) else "pass"
         return ReadabilityVarianceResult(
             variance_score=variance_score,
-            fatigue_sentences=fatigue_sentences,
-            monotony_detected=monotony,
+            fatigue_sentences=[text for text, _, _ in fatigue_sentences],
+            monotony_detected=bool(runs),
+            fatigue_spans=[(start, end) for _, start, end in fatigue_sentences],
+            monotony_runs=runs,
+            length_profile=SentenceLengthProfile(**stats) if stats else None,
         )
@@ -0,0 +1,249 @@
+"""
+Incremental section-level re-audit for edited drafts.
+
+The document is split at H2 boundaries (HTML "<h2" tags or Markdown "## " lines). For each
+section-scoped check, a per-section piece is computed and stored under a hash of that
+section's source, then the document-level result is re-aggregated from the pieces. When an
+editor changes one section, only that section is re-analyzed.
+
+Section-scoped checks: skimmability, answer_first_structure, experience_signals,
+readability_variance (fatigue sentences + monotony over the joined length series) and
+lazy_phrasing. In this mode sentences never span an H2 boundary. Offsets in the pieces are
+section-relative; aggregation moves them by each section's start in the whole document's
+audited text (section_starts), so spans and matches point at the same characters as in a
+full audit (tests/test_incremental.py).
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from .cache import ResultCache, check_versions
+from .document import AnalyzedDocument, align_spans, html_to_plain
+from .google_quality_auditor import GoogleQualityAuditor
+from .lazy_writing_auditor import LazyWritingAuditor
+from .phrase_matcher import PhraseMatch
+
+SECTION_CHECKS = (
+    "skimmability",
+    "answer_first_structure",
+    "experience_signals",
+    "readability_variance",
+    "lazy_phrasing",
+)
+DEFAULT_MAX_SECTIONS = 4096
+
+_HTML_SPLIT_RE = re.compile(r"(?i)(?=<h2\b)")
+_MARKDOWN_SPLIT_RE = re.compile(r"(?m)(?=^##\s)")
+
+
+def split_sections(html: Optional[str] = None, markdown: Optional[str] = None) -> list[str]:
+    """Source chunks, each starting at an H2 (the first chunk may be a preamble)."""
+    if html:
+        chunks = _HTML_SPLIT_RE.split(html)
+    elif markdown:
+        chunks = _MARKDOWN_SPLIT_RE.split(markdown)
+    else:
+        return []
+    return [c for c in chunks if c.strip()]
+
+
+def section_starts(
+    chunks: list[str], html: Optional[str] = None, markdown: Optional[str] = None, text: Optional[str] = None
+) -> list[int]:
+    """
+    Offset of each chunk's text in the whole document's audited text: text when given (the
+    plain text the full audit reads), else html_to_plain of the HTML, else the Markdown. HTML
+    chunks are located by their own plain text, which may be empty.
+    """
+    if text is None:
+        text = html_to_plain(html) if html else markdown or ""
+    pieces = [html_to_plain(c) for c in chunks] if html else chunks
+    return [start for start, _ in align_spans(text, pieces)]
+
+
+class IncrementalAuditor:
+    """
+    Re-audits section-scoped checks, reusing per-section pieces for unchanged sections.
+    Pieces live in an in-memory LRU (max_sections entries) and, when given, a ResultCache
+    so they also survive across processes.
+    """
+
+    def __init__(
+        self,
+        auditor: Optional[GoogleQualityAuditor] = None,
+        lazy_auditor: Optional[LazyWritingAuditor] = None,
+        cache: Optional[ResultCache] = None,
+        max_sections: int = DEFAULT_MAX_SECTIONS,
+        versions: Optional[dict[str, str]] = None,
+    ):
+        self.auditor = auditor or GoogleQualityAuditor()
+        self.lazy_auditor = lazy_auditor or LazyWritingAuditor()
+        self.cache = cache
+        self.max_sections = max_sections
+        self.versions = versions or check_versions(self.auditor, self.lazy_auditor)
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _piece(self, check: str, chunk: str, compute: Callable[[], Any], stats: dict) -> Any:
+        key = ResultCache.key(f"section:{check}", self.versions[check], chunk)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                stats["reused"] += 1
+                return self._memory[key]
+        value = self.cache.get(key) if self.cache is not None else None
+        if value is None:
+            value = compute()
+            stats["computed"] += 1
+            if self.cache is not None:
+                self.cache.put(key, f"section:{check}", value)
+        else:
+            stats["reused"] += 1
+        with self._lock:
+            self._memory[key] = value
+            while len(self._memory) > self.max_sections:
+                self._memory.popitem(last=False)
+        return value
+
+    # ----- per-section pieces (JSON-ready so they can live in ResultCache) -----
+
+    def _skim_piece(self, doc: AnalyzedDocument) -> list:
+        return [[label, len(re.findall(r"\S+", body)), tag] for label, body, tag in self.auditor._skim_sections(doc)]
+
+    def _answer_piece(self, doc: AnalyzedDocument) -> dict:
+        if not doc.html:
+            return {"pairs": [], "first_p": None}
+        return {
+            "pairs": [list(p) for p in self.auditor._question_answers(doc)],
+            "first_p": doc.section_index.first_paragraph,
+        }
+
+    def _experience_piece(self, doc: AnalyzedDocument) -> dict:
+        self.auditor._require_nltk()
+        if not doc.text.strip():
+            return {"hits": []}
+        hits = self.auditor._experience_sentences(doc)
+        return {"hits": [list(h) for h in hits]}
+
+    def _readability_piece(self, doc: AnalyzedDocument) -> dict:
+        self.auditor._require_nltk()
+        if not doc.text.strip():
+            return {"fatigue": [], "lengths": [], "spans": []}
+        lengths = doc.sentence_word_counts
+        fatigue = self.auditor._fatigue_sentences(doc.sentences, lengths, doc.sentence_spans)
+        return {
+            "fatigue": [list(h) for h in fatigue],
+            "lengths": lengths,
+            "spans": [list(span) for span in doc.sentence_spans],
+        }
+
+    def _phrasing_piece(self, doc: AnalyzedDocument) -> dict:
+        matches = self.lazy_auditor._matcher.finditer(doc.text)
+        return {
+            "matches": [[m.category, m.phrase, m.text, m.start, m.end] for m in matches],
+            "word_count": doc.word_count,
+        }
+
+    # ----- aggregation -----
+
+    def audit(
+        self,
+        html: Optional[str] = None,
+        markdown: Optional[str] = None,
+        checks: tuple[str, ...] = SECTION_CHECKS,
+        text: Optional[str] = None,
+    ) -> dict:
+        """
+        Section-scoped results for one document, in the same JSON shape run_audit.py emits,
+        plus {"sections": {"total", "reused", "computed"}} where total counts sections and
+        reused/computed count (section, check) pieces. Per-check failures become {"error": ...}.
+        text is the plain text a full audit of the same payload reads (which may come from a
+        "content" that differs from html); offsets point into it.
+        """
+        chunks = split_sections(html=html, markdown=markdown)
+        starts = section_starts(chunks, html=html, markdown=markdown, text=text)
+        docs: dict[int, AnalyzedDocument] = {}
+        stats = {"total": len(chunks), "reused": 0, "computed": 0}
+
+        def doc_for(i: int) -> AnalyzedDocument:
+            if i not in docs:
+                if html:
+                    docs[i] = AnalyzedDocument(html_to_plain(chunks[i]), html=chunks[i])
+                else:
+                    docs[i] = AnalyzedDocument(chunks[i])
+            return docs[i]
+
+        builders = {
+            "skimmability": (self._skim_piece, self._aggregate_skimmability),
+            "answer_first_structure": (self._answer_piece, self._aggregate_answer_first),
+            "experience_signals": (self._experience_piece, self._aggregate_experience),
+            "readability_variance": (self._readability_piece, self._aggregate_readability),
+            "lazy_phrasing": (self._phrasing_piece, self._aggregate_phrasing),
+        }
+        results: dict[str, Any] = {}
+        for check in checks:
+            piece_fn, aggregate = builders[check]
+            try:
+                pieces = [
+                    self._piece(check, chunk, lambda i=i: piece_fn(doc_for(i)), stats)
+                    for i, chunk in enumerate(chunks)
+                ]
+                results[check] = aggregate(pieces, starts).to_json_dict()
+            except Exception as e:
+                results[check] = {"error": str(e)}
+        return {"results": results, "sections": stats}
+
+    def _aggregate_skimmability(self, pieces: list, starts: list[int]):
+        sections = []
+        for piece in pieces:
+            for label, wc, tag in piece:
+                # A heading-less preamble is only its own section when the whole document has no headings
+                if tag is None and len(pieces) > 1:
+                    continue
+                sections.append((label, wc, tag))
+        return self.auditor._evaluate_skimmability(sections)
+
+    def _aggregate_answer_first(self, pieces: list, starts: list[int]):
+        pairs = []
+        for i, piece in enumerate(pieces):
+            for heading, p_text in piece["pairs"]:
+                if p_text is None:
+                    # No <p> after the heading in its own section: the answer is the next section's first <p>
+                    p_text = next((later["first_p"] for later in pieces[i + 1:] if later["first_p"] is not None), None)
+                pairs.append((heading, p_text))
+        return self.auditor._evaluate_answer_first(pairs)
+
+    def _aggregate_experience(self, pieces: list, starts: list[int]):
+        self.auditor._require_nltk()
+        return self.auditor._experience_result(_shift_hits(pieces, starts, "hits"))
+
+    def _aggregate_readability(self, pieces: list, starts: list[int]):
+        self.auditor._require_nltk()
+        lengths = [n for piece in pieces for n in piece["lengths"]]
+        spans = [(start, end) for _, start, end in _shift_hits(pieces, starts, "spans")]
+        return self.auditor._readability_result(_shift_hits(pieces, starts, "fatigue"), lengths, spans)
+
+    def _aggregate_phrasing(self, pieces: list, starts: list[int]):
+        matches = []
+        word_count = 0
+        for piece, offset in zip(pieces, starts):
+            for category, phrase, text, start, end in piece["matches"]:
+                matches.append(PhraseMatch(category, phrase, text, start + offset, end + offset))
+            word_count += piece["word_count"]
+        return self.lazy_auditor._phrasing_result(matches, word_count)
+
+
+def _shift_hits(pieces: list, starts: list[int], key: str) -> list[tuple[Optional[str], int, int]]:
+    """
+    (text, start, end) sentence hits of every piece, moved by its section's start offset
+    (section_starts). Entries may also be bare (start, end) spans, which come back with text None.
+    """
+    hits = []
+    for piece, offset in zip(pieces, starts):
+        for entry in piece[key]:
+            text, start, end = entry if len(entry) == 3 else (None, *entry)
+            hits.append((text, start + offset, end + offset))
+    return hits
+
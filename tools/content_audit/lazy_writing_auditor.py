@@ -7,6 +7,12 @@ quality signals—Google penalizes low-value content, not AI authorship.
 import re
 from dataclasses import dataclass, field
 from typing import List, Optional
+
+from . import assets
+from .document import AnalyzedDocument, TextOrDocument, as_document
+from .phrase_matcher import PhraseCategory, PhraseMatch, PhraseMatcher
+from .serialize import JSONResult
+
 # AI models overuse these connector words; humans rarely write this formally in web content.
 ROBOTIC_TRANSITIONS = [
     "In conclusion",
@@ -44,23 +50,43 @@ AI_TELLS = [
     "Paramount",
 ]
 
-
-@dataclass
-class LazyPhrasingResult:
+# Forms that count as a hype / tell entry. Verbs list -s, -ed and -ing forms and nouns their
+# plural; adjectives and entries not listed match only as written (so "Landscape" never
+# matches "landscaping").
+PHRASE_VARIANTS = {
+    "Game-changer": ["game-changers"],
+    "Revolutionize": ["revolutionizes", "revolutionized", "revolutionizing"],
+    "Unleash": ["unleashes", "unleashed", "unleashing"],
+    "Unlock": ["unlocks", "unlocked", "unlocking"],
+    "Elevate": ["elevates", "elevated", "elevating"],
+    "Supercharge": ["supercharges", "supercharged", "supercharging"],
+    "Delve": ["delves", "delved", "delving"],
+    "Landscape": ["landscapes"],
+    "Tapestry": ["tapestries"],
+    "Realm": ["realms"],
+    "Foster": ["fosters", "fostered", "fostering"],
+}
+
+
+@dataclass(slots=True)
+class LazyPhrasingResult(JSONResult):
     """Result from check_lazy_phrasing."""
 
     score: float  # fluff_density_score = (total matches / word count) * 100
     found_transitions: list[str] = field(default_factory=list)
     found_hype: list[str] = field(default_factory=list)
     found_tells: list[str] = field(default_factory=list)
+    matches: list[PhraseMatch] = field(default_factory=list)  # every hit with offsets, in document order
 
 
-@dataclass
-class SentenceStartResult:
+@dataclass(slots=True)
+class SentenceStartResult(JSONResult):
     """Result from audit_sentence_starts."""
 
     is_repetitive: bool
     repeating_word: Optional[str] = None
+    # (start, end) in the plain text of the first three sentences that repeat the word
+    repeating_spans: list[tuple[int, int]] = field(default_factory=list)
 
 
 class LazyWritingAuditor:
@@ -75,17 +101,29 @@ class LazyWritingAuditor:
         robotic_transitions: Optional[List[str]] = None,
         hollow_hype: Optional[List[str]] = None,
         ai_tells: Optional[List[str]] = None,
+        phrase_variants: Optional[dict[str, List[str]]] = None,
     ):
         self.robotic_transitions = robotic_transitions or ROBOTIC_TRANSITIONS.copy()
         self.hollow_hype = hollow_hype or HOLLOW_HYPE.copy()
         self.ai_tells = ai_tells or AI_TELLS.copy()
-
-    def check_lazy_phrasing(self, text: str) -> LazyPhrasingResult:
+        self.phrase_variants = phrase_variants or PHRASE_VARIANTS.copy()
+        # Compiled once: one trie regex per lexicon (with its variants), each scanned independently.
+        # Transitions and hype match anywhere (e.g. "Seamless" in "seamlessly"); tells need word boundaries.
+        self._matcher = PhraseMatcher([
+            PhraseCategory("transition", self.robotic_transitions, word_boundary=False),
+            PhraseCategory("hype", self.hollow_hype, word_boundary=False, variants=self.phrase_variants),
+            PhraseCategory("tell", self.ai_tells, word_boundary=True, variants=self.phrase_variants),
+        ])
+
+    def check_lazy_phrasing(self, text: TextOrDocument) -> LazyPhrasingResult:
         """
         Scan text for robotic transitions, hollow hype, and AI-tell phrases.
         Returns density score and lists of matched phrases. Aim for score < 1%.
+        Hype and tell entries also match the forms listed in PHRASE_VARIANTS ("unlocking", "delves").
         """
-        if not text or not text.strip():
+        doc = as_document(text)
+        text = doc.text
+        if not text.strip():
             return LazyPhrasingResult(
                 score=0.0,
                 found_transitions=[],
@@ -93,28 +131,19 @@ class LazyWritingAuditor:
                 found_tells=[],
             )
 
-        words = re.findall(r"\S+", text)
-        word_count = len(words)
-        found_transitions: list[str] = []
-        found_hype: list[str] = []
-        found_tells: list[str] = []
-
-        for phrase in self.robotic_transitions:
-            pattern = re.escape(phrase)
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found_transitions.extend(matches)
+        return self._phrasing_result(list(self._matcher.finditer(text)), doc.word_count)
 
-        for phrase in self.hollow_hype:
-            pattern = re.escape(phrase)
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found_hype.extend(matches)
+    def _phrasing_result(self, matches: list[PhraseMatch], word_count: int) -> LazyPhrasingResult:
+        """Build the result from matches in document order and the text's word count."""
+        # found_* lists keep lexicon order (then document order) like the per-phrase scans did
+        by_category: dict[str, list[tuple[int, int, str]]] = {"transition": [], "hype": [], "tell": []}
+        for m in matches:
+            by_category[m.category].append((self._matcher.phrase_index(m), m.start, m.text))
+        found_transitions = [t for _, _, t in sorted(by_category["transition"])]
+        found_hype = [t for _, _, t in sorted(by_category["hype"])]
+        found_tells = [t for _, _, t in sorted(by_category["tell"])]
 
-        for phrase in self.ai_tells:
-            pattern = r"\b" + re.escape(phrase) + r"\b"
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            found_tells.extend(matches)
-
-        total_matches = len(found_transitions) + len(found_hype) + len(found_tells)
+        total_matches = len(matches)
         fluff_density_score = (total_matches / word_count * 100) if word_count else 0.0
 
         return LazyPhrasingResult(
@@ -122,32 +151,35 @@ class LazyWritingAuditor:
             found_transitions=found_transitions,
             found_hype=found_hype,
             found_tells=found_tells,
+            matches=matches,
         )
 
     # Common articles/pronouns that are hard to avoid in analytical content.
     # Only flag repetitive starts with more distinctive words.
     EXEMPT_STARTS = {"the", "it", "its", "this", "that", "these", "those", "a", "an"}
 
-    def audit_sentence_starts(self, text: str) -> SentenceStartResult:
+    def audit_sentence_starts(self, text: TextOrDocument) -> SentenceStartResult:
         """
         Check if 3+ sentences in a row start with the same word
         (e.g. "Apple... Apple... Apple..."). Indicates monotonous structure.
         Aligned with blog generator prompt: "Don't start more than 2 sentences in a row the same way."
         Common articles/pronouns (the, it, this, etc.) are exempt since they're unavoidable
-        in analytical writing.
+        in analytical writing. Sentences come from the document's punkt segmenter, the same
+        one the E-E-A-T checks use; without nltk punkt data the check falls back to splitting
+        on runs of .!? so it still runs dependency-free.
         """
-        if not text or not text.strip():
+        doc = as_document(text)
+        if not doc.text.strip():
             return SentenceStartResult(is_repetitive=False, repeating_word=None)
 
-        sentences = re.split(r"[.!?]+", text)
         sentence_starts: list[str] = []
-        for s in sentences:
-            s = s.strip()
-            if not s:
-                continue
+        start_spans: list[tuple[int, int]] = []
+        for start, end in _sentence_spans(doc):
+            s = doc.text[start:end]
             m = re.match(r"^[\"\"''\[\(]*([A-Za-z]+)", s)
             if m:
                 sentence_starts.append(m.group(1).lower())
+                start_spans.append((start, end))
 
         # Flag when 3 consecutive sentences start with the same word (> 2 in a row)
         # but exempt common articles/pronouns
@@ -157,6 +189,24 @@ class LazyWritingAuditor:
                 return SentenceStartResult(
                     is_repetitive=True,
                     repeating_word=window[0],
+                    repeating_spans=start_spans[i : i + 3],
                 )
 
         return SentenceStartResult(is_repetitive=False, repeating_word=None)
+
+
+# Fallback sentence splitter for audit_sentence_starts when punkt data is not installed
+_FRAGMENT_RE = re.compile(r"[^.!?]+")
+
+
+def _sentence_spans(doc: AnalyzedDocument) -> list[tuple[int, int]]:
+    """The document's punkt sentence spans, or whitespace-trimmed [.!?]-delimited fragments without punkt."""
+    if assets.punkt_available():
+        return doc.sentence_spans
+    spans = []
+    for m in _FRAGMENT_RE.finditer(doc.text):
+        lead = len(m.group()) - len(m.group().lstrip())
+        trail = len(m.group()) - len(m.group().rstrip())
+        if m.end() - trail > m.start() + lead:
+            spans.append((m.start() + lead, m.end() - trail))
+    return spans
@@ -0,0 +1,103 @@
+"""
+Opt-in instrumentation for audits.
+
+With metrics enabled (run_audit.py --metrics, or "metrics": true in a payload), responses
+gain a "_metrics" block:
+    checks:   {name: {wall_ms, cpu_ms, peak_kb}} per computed check ({"cache_hit": true} for
+              cache hits). peak_kb is the check's own tracemalloc peak and is only measured
+              when checks run sequentially; in parallel mode it is null.
+    total_ms, peak_kb: wall time and tracemalloc peak of the whole audit
+    process:  startup_ms (interpreter start to run_audit.main, Linux only), import_ms,
+              session_init_ms and rss_mb
+    profile:  path of the cProfile dump, when a profile directory is configured
+
+With a profile directory (--profile-dir or CONTENT_AUDIT_PROFILE_DIR), every request is run
+under cProfile and dumped as <dir>/<timestamp>-<request id>.prof (load with pstats). cProfile
+only sees the calling thread, so profiled requests run their checks sequentially.
+"""
+
+import cProfile
+import os
+import re
+import time
+import tracemalloc
+from typing import Any, Optional
+
+PROFILE_DIR_ENV = "CONTENT_AUDIT_PROFILE_DIR"
+
+_process_timings: dict[str, float] = {}
+
+
+def record_process_timing(name: str, ms: float) -> None:
+    """Remember a process-level timing (e.g. import_ms) for every later _metrics block."""
+    _process_timings[name] = round(ms, 1)
+
+
+def process_age_ms() -> Optional[float]:
+    """Milliseconds since this process started (Linux /proc; None elsewhere). 10 ms resolution."""
+    try:
+        with open("/proc/self/stat") as f:
+            # Fields after the parenthesised command name; starttime is field 22 overall
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime_s = float(f.read().split()[0])
+        return max(uptime_s - start_ticks / os.sysconf("SC_CLK_TCK"), 0.0) * 1000
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def process_metrics() -> dict:
+    from .worker import current_rss_mb
+
+    rss = current_rss_mb()
+    return {**_process_timings, "rss_mb": round(rss, 1) if rss is not None else None}
+
+
+def check_metrics(outcome) -> dict:
+    """_metrics entry for one executor CheckOutcome."""
+    return {"wall_ms": outcome.elapsed_ms, "cpu_ms": outcome.cpu_ms, "peak_kb": outcome.peak_kb}
+
+
+class AuditMetrics:
+    """Collects the _metrics block of one audit; starts tracemalloc for its duration if needed."""
+
+    def __init__(self):
+        self.checks: dict[str, dict] = {}
+        self._start = time.perf_counter()
+        self._owns_tracing = not tracemalloc.is_tracing()
+        if self._owns_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+
+    def finish(self, profile_path: Optional[str] = None) -> dict:
+        _, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        block: dict[str, Any] = {
+            "checks": self.checks,
+            "total_ms": round((time.perf_counter() - self._start) * 1000, 1),
+            "peak_kb": round(peak / 1024, 1),
+            "process": process_metrics(),
+        }
+        if profile_path:
+            block["profile"] = profile_path
+        return block
+
+
+class RequestProfiler:
+    """Context manager that runs one request under cProfile and dumps it to directory."""
+
+    def __init__(self, directory: str, request_id: Any = None):
+        os.makedirs(directory, exist_ok=True)
+        label = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(request_id)) if request_id is not None else str(os.getpid())
+        stamp = time.strftime("%Y%m%dT%H%M%S") + f"{time.time() % 1:.6f}"[1:]
+        self.path = os.path.join(directory, f"{stamp}-{label}.prof")
+        self._profile = cProfile.Profile()
+
+    def __enter__(self) -> "RequestProfiler":
+        self._profile.enable()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._profile.disable()
+        self._profile.dump_stats(self.path)
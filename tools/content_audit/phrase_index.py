@@ -0,0 +1,409 @@
+"""
+Site-wide phrase frequency index: word n-grams and sentence openers that recur across posts.
+
+    cd tools && python -m content_audit.phrase_index add ../content/posts/ --index-dir .audit-index
+    cd tools && python -m content_audit.phrase_index add export.jsonl          # or one .html/.md file
+    cd tools && python -m content_audit.phrase_index query draft.html
+    cd tools && python -m content_audit.phrase_index top [--kind opener] [--limit 50]
+    cd tools && python -m content_audit.phrase_index remove some-slug
+
+Posts are tokenized the way the auditors read them: the plain text (post_texts, as in
+duplicates.py) is split into nltk punkt sentences (AnalyzedDocument.sentence_spans), and
+each sentence into lowercase words. Every word 3-gram and 4-gram inside a sentence, and the
+first OPENER_WORDS words of each sentence, is a phrase; phrases made only of STOPWORDS are
+skipped. The index stores, per phrase, the posts it occurs in (an inverted index) and
+their count, so a post's phrases are looked up without rescanning the corpus.
+
+A phrase is overused when it occurs in at least min_posts other posts and min_share of
+them, and its post count is at least min_z standard deviations above the average phrase of
+its kind (a binomial z-score against the index-wide mean). Per-kind totals are kept up to
+date by triggers, so a query reads them instead of scanning the phrase table.
+
+The index is a SQLite file (DIR/phrase_index.sqlite3, DIR from --index-dir or
+CONTENT_AUDIT_INDEX_DIR, shared with the near-duplicate index). add() replaces a post's
+phrases only when its text changed, so re-adding an edited post is incremental.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .document import AnalyzedDocument
+from .duplicates import INDEX_DIR_ENV, _iter_input, post_texts
+from .serialize import JSONResult
+
+INDEX_FILENAME = "phrase_index.sqlite3"
+
+NGRAM_SIZES = (3, 4)
+OPENER_WORDS = 2
+OPENER = "opener"
+
+DEFAULT_MIN_POSTS = 3
+DEFAULT_MIN_SHARE = 0.02
+DEFAULT_MIN_Z = 3.0
+
+# Function words; a phrase needs at least one word outside this set
+STOPWORDS = frozenset(
+    "a about above after again against all am an and any are as at be because been before being below "
+    "between both but by can could did do does doing down during each few for from further had has have "
+    "having he her here hers herself him himself his how i if in into is it it's its itself just me more "
+    "most my myself no nor not now of off on once only or other our ours ourselves out over own same she "
+    "should so some such than that the their theirs them themselves then there these they this those "
+    "through to too under until up very was we were what when where which while who whom why will with "
+    "would you your yours yourself yourselves".split()
+)
+
+_WORD_RE = re.compile(r"[a-z0-9]+(?:['’][a-z]+)*")
+_SQL_CHUNK = 500
+
+
+@dataclass(slots=True)
+class OverusedPhrase(JSONResult):
+    kind: str  # "opener", "3-gram" or "4-gram"
+    phrase: str
+    posts: int  # other indexed posts that use it
+    share: float  # posts / other indexed posts
+    z: float  # binomial z-score against the average phrase of this kind
+    # (start, end) of each occurrence in the audited plain text
+    spans: list[tuple[int, int]] = field(default_factory=list)
+
+
+def ngram_kind(size: int) -> str:
+    return f"{size}-gram"
+
+
+def phrases(doc: AnalyzedDocument) -> dict[tuple[str, str], list[tuple[int, int]]]:
+    """(kind, phrase) -> (start, end) of each occurrence in doc.text, for every indexed phrase of the document."""
+    found: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    text = doc.text.lower()
+    for start, end in doc.sentence_spans:
+        words = [(m.group(0).replace("’", "'"), m.start(), m.end()) for m in _WORD_RE.finditer(text, start, end)]
+        if len(words) > OPENER_WORDS:
+            _add_phrase(found, OPENER, words[:OPENER_WORDS])
+        for size in NGRAM_SIZES:
+            kind = ngram_kind(size)
+            for i in range(len(words) - size + 1):
+                _add_phrase(found, kind, words[i : i + size])
+    return found
+
+
+def _add_phrase(found: dict, kind: str, words: list[tuple[str, int, int]]) -> None:
+    if all(w in STOPWORDS for w, _, _ in words):
+        return
+    key = (kind, " ".join(w for w, _, _ in words))
+    found.setdefault(key, []).append((words[0][1], words[-1][2]))
+
+
+def _binomial_z(posts: int, total: int, rate: float) -> float:
+    """How many standard deviations posts lies above total * rate."""
+    if not 0 < rate < 1:
+        return 0.0
+    return (posts - total * rate) / math.sqrt(total * rate * (1 - rate))
+
+
+def _covered(spans: list[tuple[int, int]], cover: list[tuple[int, int]]) -> bool:
+    """Whether every span lies inside some span of cover."""
+    return all(any(c0 <= s0 and s1 <= c1 for c0, c1 in cover) for s0, s1 in spans)
+
+
+class PhraseIndex:
+    """
+    Persistent inverted index of phrase -> posts across a site.
+    Safe to share between threads; separate processes can share the same directory.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        directory = directory or os.environ.get(INDEX_DIR_ENV)
+        if not directory:
+            raise ValueError(f"Index directory required (pass directory or set {INDEX_DIR_ENV})")
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS posts (slug TEXT PRIMARY KEY, content_hash TEXT NOT NULL, updated REAL NOT NULL);"
+            "CREATE TABLE IF NOT EXISTS phrases ("
+            " id INTEGER PRIMARY KEY, kind TEXT NOT NULL, phrase TEXT NOT NULL, posts INTEGER NOT NULL,"
+            " UNIQUE (kind, phrase));"
+            "CREATE INDEX IF NOT EXISTS phrases_posts ON phrases (posts);"
+            "CREATE TABLE IF NOT EXISTS postings ("
+            " phrase_id INTEGER NOT NULL, slug TEXT NOT NULL, PRIMARY KEY (phrase_id, slug)) WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS postings_slug ON postings (slug);"
+            # Distinct phrases and total postings per kind, maintained by the triggers below
+            "CREATE TABLE IF NOT EXISTS kinds ("
+            " kind TEXT PRIMARY KEY, phrases INTEGER NOT NULL, postings INTEGER NOT NULL);"
+            "CREATE TRIGGER IF NOT EXISTS phrases_insert AFTER INSERT ON phrases BEGIN"
+            " INSERT INTO kinds (kind, phrases, postings) VALUES (NEW.kind, 1, NEW.posts)"
+            " ON CONFLICT (kind) DO UPDATE SET phrases = phrases + 1, postings = postings + NEW.posts; END;"
+            "CREATE TRIGGER IF NOT EXISTS phrases_update AFTER UPDATE OF posts ON phrases BEGIN"
+            " UPDATE kinds SET postings = postings + NEW.posts - OLD.posts WHERE kind = NEW.kind; END;"
+            "CREATE TRIGGER IF NOT EXISTS phrases_delete AFTER DELETE ON phrases BEGIN"
+            " UPDATE kinds SET phrases = phrases - 1, postings = postings - OLD.posts WHERE kind = OLD.kind; END;"
+        )
+        params = json.dumps({
+            "ngram_sizes": NGRAM_SIZES,
+            "opener_words": OPENER_WORDS,
+            "word_re": _WORD_RE.pattern,
+            "stopwords": hashlib.sha256(" ".join(sorted(STOPWORDS)).encode("utf-8")).hexdigest()[:16],
+        })
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'params'").fetchone()
+        if row is None:
+            self._conn.execute("INSERT INTO meta (key, value) VALUES ('params', ?)", (params,))
+        elif row[0] != params:
+            raise ValueError(f"{self.path} was built with different tokenization ({row[0]}); rebuild it")
+
+    @staticmethod
+    def exists(directory: Optional[str] = None) -> bool:
+        """Whether directory (or CONTENT_AUDIT_INDEX_DIR) holds a phrase index."""
+        directory = directory or os.environ.get(INDEX_DIR_ENV)
+        return bool(directory) and os.path.isfile(os.path.join(directory, INDEX_FILENAME))
+
+    # ---------- updates ----------
+
+    def add(self, post: dict) -> str:
+        """
+        Index one post payload (needs "slug"). Returns "added", "updated", or "unchanged"
+        when the post's text is the same as the indexed version.
+        """
+        slug = post.get("slug")
+        if not slug:
+            raise ValueError("post needs a slug")
+        text, _ = post_texts(post)
+        content_hash = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+        with self._lock:
+            row = self._conn.execute("SELECT content_hash FROM posts WHERE slug = ?", (slug,)).fetchone()
+        if row is not None and row[0] == content_hash:
+            return "unchanged"
+        keys = list(phrases(AnalyzedDocument(text)))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._delete(slug)
+                self._conn.execute(
+                    "INSERT INTO posts (slug, content_hash, updated) VALUES (?, ?, ?)", (slug, content_hash, time.time())
+                )
+                self._conn.executemany(
+                    "INSERT INTO phrases (kind, phrase, posts) VALUES (?, ?, 1)"
+                    " ON CONFLICT (kind, phrase) DO UPDATE SET posts = posts + 1",
+                    keys,
+                )
+                self._conn.executemany(
+                    "INSERT INTO postings (phrase_id, slug) SELECT id, ? FROM phrases WHERE kind = ? AND phrase = ?",
+                    [(slug, kind, phrase) for kind, phrase in keys],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return "added" if row is None else "updated"
+
+    def remove(self, slug: str) -> bool:
+        """Drop a post from the index; False if it was not indexed."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                found = self._delete(slug)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return found
+
+    def _delete(self, slug: str) -> bool:
+        self._conn.execute(
+            "UPDATE phrases SET posts = posts - 1 WHERE id IN (SELECT phrase_id FROM postings WHERE slug = ?)", (slug,)
+        )
+        self._conn.execute("DELETE FROM postings WHERE slug = ?", (slug,))
+        self._conn.execute("DELETE FROM phrases WHERE posts <= 0")
+        return self._conn.execute("DELETE FROM posts WHERE slug = ?", (slug,)).rowcount > 0
+
+    # ---------- lookups ----------
+
+    def query(
+        self,
+        post: dict,
+        min_posts: int = DEFAULT_MIN_POSTS,
+        min_share: float = DEFAULT_MIN_SHARE,
+        min_z: float = DEFAULT_MIN_Z,
+        exclude_slug: Optional[str] = None,
+    ) -> list[OverusedPhrase]:
+        """Overused phrases of a post payload (see query_document)."""
+        text, _ = post_texts(post)
+        return self.query_document(
+            AnalyzedDocument(text), min_posts, min_share, min_z, exclude_slug=exclude_slug or post.get("slug")
+        )
+
+    def query_document(
+        self,
+        doc: AnalyzedDocument,
+        min_posts: int = DEFAULT_MIN_POSTS,
+        min_share: float = DEFAULT_MIN_SHARE,
+        min_z: float = DEFAULT_MIN_Z,
+        exclude_slug: Optional[str] = None,
+    ) -> list[OverusedPhrase]:
+        """
+        Phrases of doc that other indexed posts overuse, most widespread first. The post
+        itself (exclude_slug, when indexed) is not counted. A phrase whose every occurrence
+        lies inside a longer flagged phrase is left out.
+        """
+        found = phrases(doc)
+        if not found:
+            return []
+        with self._lock:
+            (total,) = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()
+            own = exclude_slug is not None and self._conn.execute(
+                "SELECT 1 FROM posts WHERE slug = ?", (exclude_slug,)
+            ).fetchone() is not None
+            baseline = {kind: (n, postings) for kind, n, postings in self._conn.execute("SELECT * FROM kinds")}
+            counts = self._counts(list(found), exclude_slug if own else None)
+        others = total - own
+        if others < 1:
+            return []
+        flagged: list[OverusedPhrase] = []
+        for (kind, phrase), posts in counts.items():
+            if posts < min_posts or posts / others < min_share:
+                continue
+            distinct, postings = baseline.get(kind, (0, 0))
+            rate = postings / distinct / total if distinct and total else 0.0
+            z = _binomial_z(posts, others, rate)
+            if z < min_z:
+                continue
+            flagged.append(
+                OverusedPhrase(
+                    kind=kind, phrase=phrase, posts=posts, share=round(posts / others, 3), z=round(z, 1),
+                    spans=found[(kind, phrase)],
+                )
+            )
+        # Drop n-grams that only ever occur inside a longer flagged n-gram
+        longer: dict[int, list[tuple[int, int]]] = {}
+        for p in flagged:
+            if p.kind != OPENER:
+                longer.setdefault(len(p.phrase.split()), []).extend(p.spans)
+        flagged = [
+            p for p in flagged
+            if p.kind == OPENER
+            or not _covered(p.spans, [s for size, spans in longer.items() if size > len(p.phrase.split()) for s in spans])
+        ]
+        flagged.sort(key=lambda p: (-p.posts, p.kind, p.phrase))
+        return flagged
+
+    def _counts(self, keys: list[tuple[str, str]], own_slug: Optional[str]) -> dict[tuple[str, str], int]:
+        """(kind, phrase) -> indexed posts using it, not counting own_slug. Caller holds _lock."""
+        counts: dict[tuple[str, str], int] = {}
+        by_kind: dict[str, list[str]] = {}
+        for kind, phrase in keys:
+            by_kind.setdefault(kind, []).append(phrase)
+        for kind, texts in by_kind.items():
+            for i in range(0, len(texts), _SQL_CHUNK):
+                chunk = texts[i : i + _SQL_CHUNK]
+                rows = self._conn.execute(
+                    "SELECT phrase, posts - EXISTS (SELECT 1 FROM postings WHERE phrase_id = id AND slug = ?)"
+                    f" FROM phrases WHERE kind = ? AND phrase IN ({','.join('?' * len(chunk))})",
+                    (own_slug, kind, *chunk),
+                )
+                counts.update(((kind, phrase), posts) for phrase, posts in rows)
+        return counts
+
+    def top(self, kind: Optional[str] = None, limit: int = 50) -> list[dict]:
+        """The phrases used by the most posts: {"kind", "phrase", "posts"}."""
+        where, args = ("WHERE kind = ?", (kind,)) if kind else ("", ())
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT kind, phrase, posts FROM phrases {where} ORDER BY posts DESC, kind, phrase LIMIT ?",
+                (*args, limit),
+            ).fetchall()
+        return [{"kind": k, "phrase": p, "posts": n} for k, p, n in rows]
+
+    def posts_using(self, kind: str, phrase: str) -> list[str]:
+        """Slugs of the indexed posts that use a phrase."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT slug FROM postings JOIN phrases ON phrases.id = phrase_id"
+                " WHERE kind = ? AND phrase = ? ORDER BY slug",
+                (kind, phrase),
+            ).fetchall()
+        return [slug for (slug,) in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            (posts,) = self._conn.execute("SELECT COUNT(*) FROM posts").fetchone()
+            (phrase_count,) = self._conn.execute("SELECT COUNT(*) FROM phrases").fetchone()
+        return {"posts": posts, "phrases": phrase_count}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def overused_json(flagged: list[OverusedPhrase]) -> list[dict]:
+    return [p.to_json_dict() for p in flagged]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Site-wide phrase / sentence-opener frequency index.")
+    parser.add_argument("--index-dir", default=None, help=f"Index directory (default: ${INDEX_DIR_ENV})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="Index (or re-index edited) posts: a directory, JSONL export or one file")
+    add.add_argument("path")
+    query = sub.add_parser("query", help="Phrases of the given post(s) that the indexed site overuses")
+    query.add_argument("path")
+    query.add_argument("--min-posts", type=int, default=DEFAULT_MIN_POSTS)
+    query.add_argument("--min-share", type=float, default=DEFAULT_MIN_SHARE)
+    query.add_argument("--min-z", type=float, default=DEFAULT_MIN_Z)
+    top = sub.add_parser("top", help="Phrases used by the most posts")
+    top.add_argument("--kind", choices=[OPENER] + [ngram_kind(n) for n in NGRAM_SIZES], default=None)
+    top.add_argument("--limit", type=int, default=50)
+    remove = sub.add_parser("remove", help="Drop posts from the index")
+    remove.add_argument("slugs", nargs="+")
+    args = parser.parse_args(argv)
+
+    try:
+        index = PhraseIndex(args.index_dir)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.command == "add":
+        counts = {"added": 0, "updated": 0, "unchanged": 0, "failed": 0}
+        for post in _iter_input(args.path):
+            try:
+                if post.get("error"):
+                    raise ValueError(post["error"])
+                counts[index.add(post)] += 1
+            except (ValueError, RuntimeError) as e:
+                counts["failed"] += 1
+                print(json.dumps({"source": post.get("source"), "error": str(e)}), file=sys.stderr)
+        print(json.dumps({**counts, **index.stats()}))
+        return 2 if counts["failed"] else 0
+    if args.command == "query":
+        for post in _iter_input(args.path):
+            start = time.perf_counter()
+            flagged = index.query(post, min_posts=args.min_posts, min_share=args.min_share, min_z=args.min_z)
+            print(json.dumps({
+                "slug": post.get("slug"),
+                "overused_phrases": overused_json(flagged),
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+            }))
+        return 0
+    if args.command == "top":
+        for row in index.top(kind=args.kind, limit=args.limit):
+            print(json.dumps(row))
+        return 0
+    missing = [slug for slug in args.slugs if not index.remove(slug)]
+    if missing:
+        print(f"Not indexed: {', '.join(missing)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+PhraseMatcher: compiles phrase lexicons (e.g. LazyWritingAuditor's transitions / hype / tells)
+into one regex per category.
+
+Each category's phrases (plus their listed variant forms, e.g. "unlocking" for "Unlock") are
+folded into a character trie and emitted as a nested alternation, e.g. ["unlock", "unlocks",
+"unleash"] -> "un(?:l(?:eash|ock(?:s)?))". The regex engine then only follows branches that
+match the text, so scan cost grows with document length x categories rather than lexicon
+size x document length.
+
+Categories are scanned independently, like the per-phrase scans they replace: text that hits
+entries of two categories (e.g. a hype word inside a longer AI tell) counts once in each.
+Within a category, matches do not overlap and the longest phrase at a position wins.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .serialize import JSONResult
+
+
+@dataclass(slots=True)
+class PhraseMatch(JSONResult):
+    category: str
+    phrase: str  # canonical lexicon entry that matched (e.g. "Unlock")
+    text: str  # matched text as written in the document (e.g. "unlocking")
+    start: int
+    end: int
+
+
+@dataclass
+class PhraseCategory:
+    name: str
+    phrases: list[str]
+    word_boundary: bool = True  # require \b on both sides
+    # phrase -> other forms that count as that phrase (e.g. "Unlock": ["unlocks", "unlocked", "unlocking"])
+    variants: dict[str, list[str]] = field(default_factory=dict)
+
+    def forms(self, phrase: str) -> list[str]:
+        """Lowercased phrase followed by its listed variants."""
+        return [phrase.lower()] + [v.lower() for v in self.variants.get(phrase, ())]
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex alternation equivalent to words, factored by common prefix; longer matches win."""
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # end-of-word marker
+
+    def build(node: dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if "" in node:
+            # A word ends here but may continue: greedy optional tries the longer form first
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class PhraseMatcher:
+    """
+    Case-insensitive matcher over several tagged phrase categories, one compiled trie regex
+    per category. Matches of different categories may overlap; within a category they do
+    not, and longer phrases win.
+    """
+
+    def __init__(self, categories: list[PhraseCategory]):
+        self.categories = categories
+        # (category, lowercased variant) -> (canonical phrase, index of phrase within its category)
+        self._variants: dict[tuple[str, str], tuple[str, int]] = {}
+        self._regexes: list[tuple[str, re.Pattern]] = []
+        for cat in categories:
+            cat_variants = []
+            for idx, phrase in enumerate(cat.phrases):
+                for v in cat.forms(phrase):
+                    if v and (cat.name, v) not in self._variants:
+                        self._variants[(cat.name, v)] = (phrase, idx)
+                        cat_variants.append(v)
+            if not cat_variants:
+                continue
+            body = _trie_pattern(cat_variants)
+            if cat.word_boundary:
+                body = r"\b" + body + r"\b"
+            self._regexes.append((cat.name, re.compile(body, re.IGNORECASE)))
+
+    def finditer(self, text: str) -> Iterable[PhraseMatch]:
+        """Yield matches in document order (by start, then category order)."""
+        if not text:
+            return
+        found = []
+        for order, (name, regex) in enumerate(self._regexes):
+            for m in regex.finditer(text):
+                matched = m.group(0)
+                phrase, _ = self._variants.get((name, matched.lower()), (matched, 0))
+                match = PhraseMatch(category=name, phrase=phrase, text=matched, start=m.start(), end=m.end())
+                found.append((m.start(), order, match))
+        found.sort(key=lambda item: item[:2])
+        for _, _, match in found:
+            yield match
+
+    def phrase_index(self, match: PhraseMatch) -> int:
+        """Position of the match's canonical phrase within its category's lexicon."""
+        return self._variants.get((match.category, match.text.lower()), (None, 0))[1]
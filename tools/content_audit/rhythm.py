@@ -0,0 +1,93 @@
+"""
+Sentence-length rhythm of a document: rolling windows, monotony runs and length statistics.
+
+Every function takes the whole sentence-length series at once. Series of at least
+VECTORIZE_MIN sentences are processed with numpy when it is installed; shorter ones (and
+all series without numpy) use the pure-Python path, which gives the same results. Below
+that size the Python loops are faster than converting to an array, and a one-shot audit
+does not pay for importing numpy.
+"""
+
+import math
+from typing import Optional
+
+from . import assets
+
+VECTORIZE_MIN = 2_000
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+def _numpy(lengths: list[int]):
+    return assets.load_numpy() if len(lengths) >= VECTORIZE_MIN else None
+
+
+def window_ranges(lengths: list[int], window: int) -> list[int]:
+    """max - min of every run of window consecutive lengths (len(lengths) - window + 1 values)."""
+    if len(lengths) < window:
+        return []
+    np = _numpy(lengths)
+    if np is not None:
+        views = np.lib.stride_tricks.sliding_window_view(np.asarray(lengths, dtype=np.int64), window)
+        return (views.max(axis=1) - views.min(axis=1)).tolist()
+    return [max(lengths[i : i + window]) - min(lengths[i : i + window]) for i in range(len(lengths) - window + 1)]
+
+
+def monotony_runs(lengths: list[int], window: int, tolerance: int) -> list[tuple[int, int]]:
+    """
+    (first, end) sentence index ranges, end exclusive, where every window of `window`
+    sentences has lengths within `tolerance` words of each other. Overlapping and adjacent
+    qualifying windows are merged into one run.
+    """
+    ranges = window_ranges(lengths, window)
+    if not ranges:
+        return []
+    np = _numpy(lengths)
+    if np is not None:
+        flags = np.concatenate(([0], (np.asarray(ranges) <= tolerance).astype(np.int8), [0]))
+        edges = np.diff(flags)
+        starts = np.flatnonzero(edges == 1)
+        stops = np.flatnonzero(edges == -1)  # one past the last qualifying window
+        return [(int(s), int(e) - 1 + window) for s, e in zip(starts, stops)]
+    runs = []
+    first: Optional[int] = None
+    for i, spread in enumerate(ranges):
+        if spread <= tolerance:
+            if first is None:
+                first = i
+        elif first is not None:
+            runs.append((first, i - 1 + window))
+            first = None
+    if first is not None:
+        runs.append((first, len(ranges) - 1 + window))
+    return runs
+
+
+def length_stats(lengths: list[int]) -> dict:
+    """count, mean, population std, max and linearly interpolated percentiles (p10 ... p90)."""
+    n = len(lengths)
+    if not n:
+        return {}
+    np = _numpy(lengths)
+    if np is not None:
+        values = np.asarray(lengths, dtype=np.float64)
+        mean = float(values.mean())
+        std = float(values.std())
+        quantiles = np.percentile(values, PERCENTILES).tolist()
+        peak = int(values.max())
+    else:
+        mean = sum(lengths) / n
+        std = math.sqrt(sum((x - mean) ** 2 for x in lengths) / n)
+        ordered = sorted(lengths)
+        quantiles = [_percentile(ordered, p) for p in PERCENTILES]
+        peak = ordered[-1]
+    stats = {"sentences": n, "mean": round(mean, 2), "std": round(std, 2), "max": peak}
+    stats.update({f"p{p}": round(q, 2) for p, q in zip(PERCENTILES, quantiles)})
+    return stats
+
+
+def _percentile(ordered: list[int], pct: float) -> float:
+    """numpy's default (linear) percentile of an already sorted list."""
+    pos = (len(ordered) - 1) * pct / 100
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
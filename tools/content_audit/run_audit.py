@@ -2,12 +2,52 @@
 """
 Run GoogleQualityAuditor from JSON stdin; print JSON result to stdout.
 Used by the Next.js API route POST /api/content-audit/quality.
+
+Worker mode keeps auditors and the spacy model loaded between requests:
+    python3 tools/content_audit/run_audit.py --worker [--socket /tmp/audit.sock]
+        [--max-jobs 500] [--max-rss-mb 1024]
+See worker.py for the newline-delimited JSON protocol.
+
+--prefetch-assets downloads NLTK punkt data and en_core_web_sm; --verify-assets checks them
+(and the import-time budget) without downloading, exiting 1 if anything is missing.
+
+--parallel runs the checks concurrently; each gets --check-timeout seconds (a number, or
+NAME=SECONDS for one check) and the response is written by --deadline seconds at the latest,
+with {"status": "timed_out"} for checks that had not finished (see executor.py).
+
+--stream writes NDJSON instead of one JSON object: a {"event": "check", "check", "status",
+"result", "elapsed_ms"} line as each check completes, then {"event": "summary", ...}.
+
+--metrics adds a "_metrics" block (per-check wall/CPU time and tracemalloc peak, process
+startup/import timings); --profile-dir DIR (or CONTENT_AUDIT_PROFILE_DIR) writes one cProfile
+dump per request. See metrics.py.
+
+--no-inline-sentences leaves out experience_sentences / fatigue_sentences; the
+experience_spans / fatigue_spans offsets into the plain text are always present.
+
+--mode fast (or "mode": "fast" in a payload) runs entity_density, experience_signals and
+readability_variance on a stratified sample of about --sample-words words of longer
+documents; their results then carry "estimates" (value, 95% interval, sampled fraction).
+See sampling.py.
+
+--checks NAME,NAME (or "checks": [...] in a payload) runs only the named checks, computing
+only the artifacts they declare (runner.CHECK_ARTIFACTS): --checks title_hyperbole never
+loads nltk, spacy or BeautifulSoup. "overlaps" / "overused_phrases" name the index lookups.
+
+--cache-dir DIR (or CONTENT_AUDIT_CACHE_DIR) enables the on-disk result cache (cache.py);
+responses then include {"cache": {"hits": N, "misses": M}}.
+
+--index-dir DIR (or CONTENT_AUDIT_INDEX_DIR) points at a near-duplicate index built with
+`python -m content_audit.duplicates add`; responses then include "overlaps", the indexed
+posts (other than the payload's "slug") that this post or its sections overlap. When DIR
+also holds a phrase index (`python -m content_audit.phrase_index add`), responses include
+"overused_phrases", the post's n-grams and sentence openers that other posts use too often.
 """
+import argparse
 import json
 import os
-import re
 import sys
-from dataclasses import asdict
+import time
 
 # When run as python3 tools/content_audit/run_audit.py, tools/ must be on path for content_audit import
 _script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -15,66 +55,171 @@ _root = os.path.dirname(_script_dir)  # tools/ - parent of content_audit package
 if _root not in sys.path:
     sys.path.insert(0, _root)
 
-if __name__ == "__main__":
-    try:
-        payload = json.load(sys.stdin)
-    except Exception as e:
-        json.dump({"ok": False, "error": f"Invalid JSON: {e}"}, sys.stdout)
-        sys.exit(1)
 
-    title = (payload.get("title") or "").strip()
-    content = (payload.get("content") or "").strip()
-    html = (payload.get("html") or content).strip()
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Content quality audit (E-E-A-T & integrity).")
+    parser.add_argument("--worker", action="store_true", help="Serve newline-delimited JSON requests until EOF")
+    parser.add_argument("--socket", metavar="PATH", help="Worker mode: listen on this Unix socket instead of stdin")
+    parser.add_argument("--max-jobs", type=int, default=None, help="Worker mode: recycle after this many requests")
+    parser.add_argument("--max-rss-mb", type=float, default=None, help="Worker mode: recycle once RSS exceeds this")
+    parser.add_argument("--cache-dir", metavar="DIR", default=None, help="Enable the SQLite result cache in DIR")
+    parser.add_argument("--cache-max-entries", type=int, default=None, help="LRU bound for the result cache")
+    parser.add_argument("--index-dir", metavar="DIR", default=None, help="Report overlaps with this near-duplicate index")
+    parser.add_argument("--parallel", action="store_true", help="Run checks concurrently with per-check deadlines")
+    parser.add_argument(
+        "--check-timeout", action="append", default=[], metavar="[NAME=]SECONDS",
+        help="--parallel: budget for every check, or NAME=SECONDS for one check (repeatable)",
+    )
+    parser.add_argument("--deadline", type=float, default=None, help="--parallel: overall budget in seconds")
+    parser.add_argument("--stream", action="store_true", help="Write one NDJSON line per check as it completes")
+    parser.add_argument("--metrics", action="store_true", help="Add per-check timing/memory in _metrics")
+    parser.add_argument(
+        "--no-inline-sentences", dest="inline_sentences", action="store_false",
+        help="Report sentence-level hits as spans only, without copying their text",
+    )
+    parser.add_argument(
+        "--mode", choices=("full", "fast"), default="full",
+        help="fast: sample long documents for the expensive checks (payload \"mode\" overrides)",
+    )
+    parser.add_argument(
+        "--sample-words", type=int, default=None, help="--mode fast: words analyzed per document (default 20000)"
+    )
+    parser.add_argument(
+        "--checks", default=None, metavar="NAME,NAME",
+        help="Run only these checks (payload \"checks\" overrides); default: all",
+    )
+    parser.add_argument("--profile-dir", metavar="DIR", default=None, help="Write a cProfile dump per request here")
+    parser.add_argument("--prefetch-assets", action="store_true", help="Download NLTK punkt data and en_core_web_sm")
+    parser.add_argument("--verify-assets", action="store_true", help="Check dependencies/data offline and exit")
+    parser.add_argument("--skip-spacy", action="store_true", help="Assets: do not require spacy / en_core_web_sm")
+    parser.add_argument(
+        "--import-budget-ms", type=float, default=None,
+        help="--verify-assets: fail if `import content_audit` is slower (<= 0 disables)",
+    )
+    args = parser.parse_args(argv)
+    args.check_timeouts = {}
+    args.default_check_timeout = None
+    for value in args.check_timeout:
+        name, _, seconds = value.rpartition("=")
+        try:
+            seconds = float(seconds)
+        except ValueError:
+            parser.error(f"--check-timeout: invalid seconds in {value!r}")
+        if name:
+            args.check_timeouts[name] = seconds
+        else:
+            args.default_check_timeout = seconds
+    return args
 
-    def html_to_plain(s: str) -> str:
-        s = re.sub(r"<[^>]+>", " ", s)
-        s = re.sub(r"\s+", " ", s)
-        return s.strip()
 
-    plain_text = html_to_plain(content) if content else ""
+def main(argv=None) -> int:
+    args = _parse_args(argv)
 
+    import_start = time.perf_counter()
     try:
-        from content_audit.google_quality_auditor import GoogleQualityAuditor
-        from content_audit.lazy_writing_auditor import LazyWritingAuditor
+        from content_audit.cache import CACHE_DIR_ENV, DEFAULT_MAX_ENTRIES, ResultCache
+        from content_audit.duplicates import INDEX_DIR_ENV, DuplicateIndex
+        from content_audit.executor import DEFAULT_CHECK_TIMEOUT_S, DEFAULT_DEADLINE_S, lingering_checks
+        from content_audit.metrics import PROFILE_DIR_ENV, process_age_ms, record_process_timing
+        from content_audit.phrase_index import PhraseIndex
+        from content_audit.runner import CHECK_ARTIFACTS, LOOKUPS, AuditSession, check_event, summary_event
+        from content_audit.sampling import DEFAULT_SAMPLE_WORDS
+        from content_audit.serialize import dumps
+        from content_audit.worker import DEFAULT_MAX_JOBS, DEFAULT_MAX_RSS_MB, run_worker
     except ImportError:
-        try:
-            from google_quality_auditor import GoogleQualityAuditor
-            from lazy_writing_auditor import LazyWritingAuditor
-        except ImportError:
-            json.dump({"ok": False, "error": "GoogleQualityAuditor not found. Install content_audit deps."}, sys.stdout)
-            sys.exit(1)
+        json.dump({"ok": False, "error": "GoogleQualityAuditor not found. Install content_audit deps."}, sys.stdout)
+        return 1
 
-    auditor = GoogleQualityAuditor()
-    lazy_auditor = LazyWritingAuditor()
-    out = {}
+    import_ms = (time.perf_counter() - import_start) * 1000
+    startup_ms = process_age_ms()
+    if startup_ms is not None:
+        # Interpreter start until main() began
+        record_process_timing("startup_ms", max(startup_ms - import_ms, 0.0))
+    record_process_timing("import_ms", import_ms)
 
-    def run(name: str, fn, *args, **kwargs):
-        try:
-            r = fn(*args, **kwargs)
-            out[name] = asdict(r) if hasattr(r, "__dataclass_fields__") else r
-        except Exception as e:
-            out[name] = {"error": str(e)}
-
-    # Quality & Trust
-    run("experience_signals", auditor.check_experience_signals, plain_text)
-    run("title_hyperbole", auditor.check_title_hyperbole, title)
-    run("data_density", auditor.check_data_density, plain_text)
-    run("skimmability", auditor.check_skimmability, plain_text, html or None)
-
-    # Integrity & Architecture
-    run("temporal_consistency", auditor.check_temporal_consistency, title, plain_text)
-    run("answer_first_structure", auditor.check_answer_first_structure, html or content)
-    run("entity_density", auditor.check_entity_density, plain_text)
-    run("readability_variance", auditor.check_readability_variance, plain_text)
-
-    # Lazy Writing Auditor (replaces AI detection; flags robotic phrasing)
-    run("lazy_phrasing", lazy_auditor.check_lazy_phrasing, plain_text)
-    run("sentence_starts", lazy_auditor.audit_sentence_starts, plain_text)
-
-    # entity_density has top_entities as list of [text, label]; asdict makes them lists
-    if "entity_density" in out and "top_entities" in out["entity_density"]:
-        out["entity_density"]["top_entities"] = [
-            [t, l] for t, l in out["entity_density"]["top_entities"]
-        ]
-
-    json.dump({"ok": True, "results": out}, sys.stdout)
+    if args.prefetch_assets or args.verify_assets:
+        from content_audit import assets
+
+        if args.prefetch_assets:
+            report = assets.prefetch(skip_spacy=args.skip_spacy)
+        else:
+            budget = assets.DEFAULT_IMPORT_BUDGET_MS if args.import_budget_ms is None else args.import_budget_ms
+            report = assets.verify(skip_spacy=args.skip_spacy, import_budget_ms=budget if budget > 0 else None)
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return 0 if report["ok"] else 1
+
+    cache = None
+    cache_dir = args.cache_dir or os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        cache = ResultCache(cache_dir, max_entries=args.cache_max_entries or DEFAULT_MAX_ENTRIES)
+    index_dir = args.index_dir or os.environ.get(INDEX_DIR_ENV)
+
+    # Responses are UTF-8 JSON (serialize.dumps writes non-ASCII text as-is)
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8")
+
+    session_options = {
+        "cache": cache,
+        "parallel": args.parallel,
+        "check_timeout": args.default_check_timeout if args.default_check_timeout is not None else DEFAULT_CHECK_TIMEOUT_S,
+        "check_timeouts": args.check_timeouts,
+        "deadline": args.deadline if args.deadline is not None else DEFAULT_DEADLINE_S,
+        "metrics": args.metrics,
+        "profile_dir": args.profile_dir or os.environ.get(PROFILE_DIR_ENV),
+        "inline_sentences": args.inline_sentences,
+        "duplicate_index": DuplicateIndex(index_dir) if index_dir else None,
+        "phrase_index": PhraseIndex(index_dir) if index_dir and PhraseIndex.exists(index_dir) else None,
+        "mode": args.mode,
+        "sample_words": args.sample_words or DEFAULT_SAMPLE_WORDS,
+        "checks": [c.strip() for c in args.checks.split(",") if c.strip()] if args.checks else None,
+    }
+
+    unknown = [c for c in session_options["checks"] or () if c not in CHECK_ARTIFACTS and c not in LOOKUPS]
+    if unknown:
+        print(f"--checks: unknown check(s) {', '.join(unknown)}; expected {', '.join([*CHECK_ARTIFACTS, *LOOKUPS])}", file=sys.stderr)
+        return 2
+
+    if args.worker:
+        session_start = time.perf_counter()
+        session = AuditSession(**session_options)
+        record_process_timing("session_init_ms", (time.perf_counter() - session_start) * 1000)
+        return run_worker(
+            session=session,
+            socket_path=args.socket,
+            max_jobs=args.max_jobs if args.max_jobs is not None else DEFAULT_MAX_JOBS,
+            max_rss_mb=args.max_rss_mb if args.max_rss_mb is not None else DEFAULT_MAX_RSS_MB,
+        )
+
+    try:
+        payload = json.load(sys.stdin)
+    except Exception as e:
+        error = {"ok": False, "error": f"Invalid JSON: {e}"}
+        json.dump({"event": "summary", **error} if args.stream else error, sys.stdout)
+        return 1
+
+    session_start = time.perf_counter()
+    session = AuditSession(preload_spacy=False, **session_options)
+    record_process_timing("session_init_ms", (time.perf_counter() - session_start) * 1000)
+    if args.stream:
+        def emit(name, status, result, elapsed_ms):
+            sys.stdout.write(dumps(check_event(name, status, result, elapsed_ms)) + "\n")
+            sys.stdout.flush()
+
+        start = time.perf_counter()
+        response = session.audit(payload, on_result=emit)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        sys.stdout.write(dumps(summary_event(response, elapsed_ms)) + "\n")
+    else:
+        sys.stdout.write(dumps(session.audit(payload)))
+    if lingering_checks():
+        # Timed-out checks are still running in daemon threads; do not wait for them
+        sys.stdout.flush()
+        if cache is not None:
+            cache.close()
+        os._exit(0)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+"""
+Shared audit runner: turns a run_audit.py payload ({title, content, html}) into the
+JSON-ready results dict. Used by run_audit.py (one-shot and worker modes) and batch.py.
+
+A payload may carry "markdown" instead of content/html: the text is audited as-is so
+skimmability can use its ## / ### fallback (HTML-only checks see no HTML).
+With "incremental": true, section-scoped checks reuse per-section results from earlier
+audits in this session (see incremental.py); the response then includes "sections".
+With "mode": "fast", entity_density / experience_signals / readability_variance analyze a
+stratified sample of long documents and report estimates with confidence intervals
+(see sampling.py); the response then includes "mode": "fast". Section-scoped checks of an
+incremental audit are not sampled.
+
+A payload may name the checks it wants ("checks": ["lazy_phrasing", ...]); only those run,
+and only the artifacts they declare in CHECK_ARTIFACTS are computed (and their libraries
+imported), e.g. title_hyperbole alone never loads nltk, spacy or BeautifulSoup. The
+site-level lookups ("overlaps", "overused_phrases") then run only when named too.
+
+Streaming callers pass on_result to audit() and write check_event() lines as checks
+complete, then summary_event() (the response without "results") once audit() returns.
+"""
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Optional
+
+from .cache import ResultCache, check_versions
+from .document import AnalyzedDocument, html_to_plain
+from .duplicates import DuplicateIndex, overlaps_json
+from .executor import (
+    DEFAULT_CHECK_TIMEOUT_S,
+    DEFAULT_DEADLINE_S,
+    ERROR,
+    OK,
+    TIMED_OUT,
+    CheckOutcome,
+    run_checks,
+    run_inline,
+)
+from .google_quality_auditor import GoogleQualityAuditor, _get_nlp
+from .incremental import SECTION_CHECKS, IncrementalAuditor
+from .lazy_writing_auditor import LazyWritingAuditor
+from .metrics import AuditMetrics, RequestProfiler, check_metrics
+from .phrase_index import PhraseIndex, overused_json
+from .sampling import DEFAULT_SAMPLE_WORDS, FAST, FULL, MODES, SAMPLED_CHECKS
+from .serialize import JSONResult
+
+# Pseudo-check name for the incremental section audit when it runs alongside the other checks
+_SECTIONS = "_sections"
+
+
+# Results whose sentence text can be dropped in favour of their *_spans offsets
+_SENTENCE_TEXT_FIELDS = {
+    "experience_signals": "experience_sentences",
+    "readability_variance": "fatigue_sentences",
+}
+
+# on_result(check name, "ok" | "error" | "timed_out", JSON-ready result, elapsed ms)
+ResultCallback = Callable[[str, str, dict, float], None]
+
+# Payload inputs, in the order they enter cache keys
+INPUTS = ("title", "text", "html")
+
+
+@dataclass(frozen=True)
+class Artifact:
+    """A shared analysis artifact of AnalyzedDocument: what it is computed from and what it imports."""
+
+    inputs: tuple[str, ...]  # payload inputs (INPUTS) it reads
+    libraries: tuple[str, ...] = ()  # optional dependencies it loads (assets.py)
+
+
+ARTIFACTS = {
+    "title": Artifact(("title",)),
+    "text": Artifact(("text",)),
+    "words": Artifact(("text",)),
+    "sentences": Artifact(("text",), ("nltk",)),  # punkt sentence_spans and everything derived from them
+    "signals": Artifact(("text",)),  # one SignalScanner pass
+    "section_index": Artifact(("text", "html")),  # HTML headings, else the ## / ### split of the text
+    "html_sections": Artifact(("html",)),  # section index of the HTML only
+    "sentiment": Artifact(("title",), ("textblob", "vaderSentiment")),
+    "spacy_doc": Artifact(("text",), ("spacy", "en_core_web_sm")),
+}
+
+# Artifacts each check (run_audit.py result name) reads; a check is computed from nothing else
+CHECK_ARTIFACTS = {
+    "experience_signals": ("sentences", "signals"),
+    "title_hyperbole": ("title", "sentiment"),
+    "data_density": ("words", "signals"),
+    "skimmability": ("section_index",),
+    "temporal_consistency": ("title", "signals"),
+    "answer_first_structure": ("html_sections",),
+    "entity_density": ("spacy_doc",),
+    "readability_variance": ("sentences",),
+    "lazy_phrasing": ("text", "words"),
+    "sentence_starts": ("sentences",),
+}
+
+# Site-level lookups added to responses (with the indexes configured); not cached
+LOOKUPS = ("overlaps", "overused_phrases")
+
+
+def check_inputs(name: str) -> tuple[str, ...]:
+    """Payload inputs a check's result depends on (its cache key inputs), in INPUTS order."""
+    used = {i for artifact in CHECK_ARTIFACTS[name] for i in ARTIFACTS[artifact].inputs}
+    return tuple(i for i in INPUTS if i in used)
+
+
+def check_libraries(names) -> list[str]:
+    """Optional dependencies the named checks may import, in first-use order."""
+    libraries: dict[str, None] = {}
+    for name in names:
+        for artifact in CHECK_ARTIFACTS[name]:
+            libraries.update(dict.fromkeys(ARTIFACTS[artifact].libraries))
+    return list(libraries)
+
+
+def check_calls(
+    auditor: GoogleQualityAuditor, lazy_auditor: LazyWritingAuditor, doc: AnalyzedDocument, mode: Optional[str] = None
+) -> list[tuple[str, Callable, tuple]]:
+    """(result name, check method, args) for every check, in response order; mode applies to SAMPLED_CHECKS."""
+
+    def sampled(fn: Callable) -> Callable:
+        return partial(fn, mode=mode) if mode is not None else fn
+
+    return [
+        # Quality & Trust
+        ("experience_signals", sampled(auditor.check_experience_signals), (doc,)),
+        ("title_hyperbole", auditor.check_title_hyperbole, (doc.title,)),
+        ("data_density", auditor.check_data_density, (doc,)),
+        ("skimmability", auditor.check_skimmability, (doc,)),
+        # Integrity & Architecture
+        ("temporal_consistency", auditor.check_temporal_consistency, (doc.title, doc)),
+        ("answer_first_structure", auditor.check_answer_first_structure, (doc,)),
+        ("entity_density", sampled(auditor.check_entity_density), (doc,)),
+        ("readability_variance", sampled(auditor.check_readability_variance), (doc,)),
+        # Lazy Writing Auditor (replaces AI detection; flags robotic phrasing)
+        ("lazy_phrasing", lazy_auditor.check_lazy_phrasing, (doc,)),
+        ("sentence_starts", lazy_auditor.audit_sentence_starts, (doc,)),
+    ]
+
+
+def check_event(name: str, status: str, result: dict, elapsed_ms: float) -> dict:
+    """One NDJSON progress line for a completed check."""
+    return {"event": "check", "check": name, "status": status, "result": result, "elapsed_ms": elapsed_ms}
+
+
+def summary_event(response: dict, elapsed_ms: float) -> dict:
+    """Final NDJSON line: the audit response minus the per-check results already streamed."""
+    summary = {k: v for k, v in response.items() if k != "results"}
+    return {"event": "summary", **summary, "checks": len(response.get("results", {})), "elapsed_ms": elapsed_ms}
+
+
+def _as_json(fn: Callable, *args) -> Callable[[], Any]:
+    """Zero-argument call of fn(*args) returning a JSON-ready value (results become dicts)."""
+
+    def call():
+        r = fn(*args)
+        return r.to_json_dict() if isinstance(r, JSONResult) else r
+
+    return call
+
+
+def _without_sentence_text(name: str, result: dict) -> dict:
+    """result without its copied sentence text (spans only)."""
+    field_name = _SENTENCE_TEXT_FIELDS.get(name)
+    if field_name is None or field_name not in result:
+        return result
+    return {k: v for k, v in result.items() if k != field_name}
+
+
+def _unknown_checks(names: Optional[list]) -> list:
+    return [n for n in names or () if not isinstance(n, str) or (n not in CHECK_ARTIFACTS and n not in LOOKUPS)]
+
+
+class AuditSession:
+    """
+    Holds warm GoogleQualityAuditor / LazyWritingAuditor instances (and the spacy model)
+    so repeated audits in the same process skip the import and model-load cost.
+    With a ResultCache, each check is looked up by content hash before it is computed.
+
+    With parallel=True the checks run concurrently (executor.py). Each gets check_timeout
+    seconds (or its entry in check_timeouts), and audit() returns by the overall deadline
+    with {"status": "timed_out", ...} for checks that had not finished.
+
+    metrics=True adds a "_metrics" block to every response and profile_dir dumps a
+    cProfile file per request (metrics.py).
+
+    With a DuplicateIndex, responses gain "overlaps": indexed posts (other than the
+    payload's "slug") that the post or one of its H2 sections nearly duplicates.
+    With a PhraseIndex, responses gain "overused_phrases": n-grams and sentence openers of
+    the post that the other indexed posts use statistically often (phrase_index.py).
+
+    Sentence-level results always carry (start, end) spans into the audited plain text.
+    inline_sentences=False (or "inline_sentences": false in a payload) drops the copied
+    sentence text next to them.
+
+    checks (or "checks" in a payload) limits audits to the named checks and lookups;
+    None runs everything.
+
+    mode="fast" (or "mode": "fast" in a payload) samples documents longer than sample_words
+    words for the expensive checks (sampling.py); "mode": "full" in a payload overrides it.
+    """
+
+    def __init__(
+        self,
+        preload_spacy: bool = True,
+        cache: Optional[ResultCache] = None,
+        parallel: bool = False,
+        check_timeout: Optional[float] = DEFAULT_CHECK_TIMEOUT_S,
+        check_timeouts: Optional[dict[str, float]] = None,
+        deadline: Optional[float] = DEFAULT_DEADLINE_S,
+        metrics: bool = False,
+        profile_dir: Optional[str] = None,
+        inline_sentences: bool = True,
+        duplicate_index: Optional[DuplicateIndex] = None,
+        phrase_index: Optional[PhraseIndex] = None,
+        mode: str = FULL,
+        sample_words: int = DEFAULT_SAMPLE_WORDS,
+        checks: Optional[list[str]] = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode {mode!r} (expected one of {', '.join(MODES)})")
+        unknown = _unknown_checks(checks)
+        if unknown:
+            raise ValueError(f"Unknown checks: {', '.join(unknown)}")
+        self.auditor = GoogleQualityAuditor(sample_words=sample_words)
+        self.lazy_auditor = LazyWritingAuditor()
+        self.cache = cache
+        self.parallel = parallel
+        self.check_timeout = check_timeout
+        self.check_timeouts = check_timeouts or {}
+        self.deadline = deadline
+        self.metrics = metrics
+        self.profile_dir = profile_dir
+        self.inline_sentences = inline_sentences
+        self.duplicate_index = duplicate_index
+        self.phrase_index = phrase_index
+        self.mode = mode
+        self.checks = checks
+        self.check_versions = check_versions(self.auditor, self.lazy_auditor) if cache is not None else {}
+        self._incremental: Optional[IncrementalAuditor] = None
+        if preload_spacy and "spacy" in check_libraries(checks or CHECK_ARTIFACTS):
+            # Load en_core_web_sm now rather than on the first entity_density check
+            _get_nlp(self.auditor.spacy_exclude)
+
+    @property
+    def incremental(self) -> IncrementalAuditor:
+        """Section-level re-auditor sharing this session's auditors and cache (created on first use)."""
+        if self._incremental is None:
+            self._incremental = IncrementalAuditor(
+                self.auditor, self.lazy_auditor, cache=self.cache, versions=self.check_versions or None
+            )
+        return self._incremental
+
+    def audit(self, payload: dict, on_result: Optional[ResultCallback] = None) -> dict:
+        """
+        Run every check for one payload; per-check failures are reported inline as {"error": ...}.
+        In parallel mode, checks past their budget are listed in response["timed_out"].
+        on_result(name, status, result, elapsed_ms) is called as each check completes
+        (cache hits first, then in completion order).
+        With metrics (session-wide or "metrics": true in the payload) the response gains "_metrics".
+        """
+        audit_metrics = AuditMetrics() if self.metrics or payload.get("metrics") else None
+        if not self.profile_dir:
+            response = self._audit(payload, on_result, audit_metrics, self.parallel)
+            profile_path = None
+        else:
+            with RequestProfiler(self.profile_dir, payload.get("id")) as profiler:
+                response = self._audit(payload, on_result, audit_metrics, parallel=False)
+            profile_path = profiler.path
+        if audit_metrics is not None:
+            response["_metrics"] = audit_metrics.finish(profile_path)
+        elif profile_path:
+            response["_metrics"] = {"profile": profile_path}
+        return response
+
+    def _audit(
+        self,
+        payload: dict,
+        on_result: Optional[ResultCallback],
+        audit_metrics: Optional[AuditMetrics],
+        parallel: bool,
+    ) -> dict:
+        mode = payload.get("mode") or self.mode
+        if mode not in MODES:
+            return {"ok": False, "error": f"Unknown mode {mode!r} (expected one of {', '.join(MODES)})"}
+        selected = payload.get("checks")
+        if selected is None:
+            selected = self.checks
+        if selected is not None:
+            if isinstance(selected, str) or not isinstance(selected, list):
+                return {"ok": False, "error": "checks must be a list of check names"}
+            unknown = _unknown_checks(selected)
+            if unknown:
+                return {"ok": False, "error": f"Unknown checks: {', '.join(map(str, unknown))}"}
+            selected = set(selected)
+        title = (payload.get("title") or "").strip()
+        markdown = (payload.get("markdown") or "").strip()
+        if markdown:
+            html, plain_text = "", markdown
+        else:
+            content = (payload.get("content") or "").strip()
+            html = (payload.get("html") or content).strip()
+            plain_text = html_to_plain(content) if content else ""
+        # One shared document: each check reuses its tokens, sentences, section index and spacy doc
+        doc = AnalyzedDocument(plain_text, html=html or None, title=title)
+
+        cache = self.cache
+        cache_stats = {"hits": 0, "misses": 0}
+
+        # Cache key inputs per check: only what the check's declared artifacts read
+        values = {"title": title, "text": plain_text, "html": html}
+        cache_inputs = {name: tuple(values[i] for i in check_inputs(name)) for name in CHECK_ARTIFACTS}
+        if mode == FAST:
+            # Sampled results differ from exhaustive ones (the sample size is part of the key)
+            for name in SAMPLED_CHECKS:
+                cache_inputs[name] += (f"{FAST}:{self.auditor.sample_words}",)
+        checks = [
+            call for call in check_calls(self.auditor, self.lazy_auditor, doc, mode)
+            if selected is None or call[0] in selected
+        ]
+
+        incremental = bool(payload.get("incremental"))
+        inline_sentences = payload.get("inline_sentences", self.inline_sentences)
+        out = {}
+        keys = {}
+        calls = {}
+        sections = None
+        timed_out = set()
+
+        def record(name: str, outcome: CheckOutcome) -> None:
+            if audit_metrics is not None:
+                audit_metrics.checks["sections" if name == _SECTIONS else name] = check_metrics(outcome)
+            settle(name, outcome)
+
+        def settle(name: str, outcome: CheckOutcome) -> None:
+            nonlocal sections
+            if name == _SECTIONS:
+                if outcome.status == OK:
+                    sections = outcome.value["sections"]
+                for section_check in SECTION_CHECKS:
+                    if selected is not None and section_check not in selected:
+                        continue
+                    if outcome.status == OK:
+                        value = outcome.value["results"][section_check]
+                        if "error" in value:
+                            settle(section_check, CheckOutcome(ERROR, error=value["error"], elapsed_ms=outcome.elapsed_ms))
+                        else:
+                            settle(section_check, CheckOutcome(OK, value=value, elapsed_ms=outcome.elapsed_ms))
+                    else:
+                        settle(section_check, outcome)
+                return
+            if outcome.status == OK:
+                out[name] = outcome.value
+                if name in keys:
+                    cache.put(keys[name], name, out[name])
+                if not inline_sentences:
+                    out[name] = _without_sentence_text(name, out[name])
+            elif outcome.status == TIMED_OUT:
+                out[name] = {"status": TIMED_OUT, "error": outcome.error}
+                timed_out.add(name)
+            else:
+                out[name] = {"error": outcome.error}
+            if on_result is not None:
+                on_result(name, outcome.status, out[name], outcome.elapsed_ms)
+
+        section_checks = tuple(name for name, _, _ in checks if name in SECTION_CHECKS)
+        if incremental and section_checks:
+            # Section-scoped checks come from the incremental auditor as one unit of work
+            calls[_SECTIONS] = lambda: self.incremental.audit(
+                html=html or None, markdown=None if html else plain_text, checks=section_checks, text=plain_text
+            )
+        for name, fn, args in checks:
+            if incremental and name in SECTION_CHECKS:
+                continue
+            if cache is not None:
+                keys[name] = cache.key(name, self.check_versions[name], *cache_inputs[name])
+                cached = cache.get(keys[name])
+                if cached is not None:
+                    cache_stats["hits"] += 1
+                    out[name] = cached if inline_sentences else _without_sentence_text(name, cached)
+                    if audit_metrics is not None:
+                        audit_metrics.checks[name] = {"cache_hit": True}
+                    if on_result is not None:
+                        on_result(name, OK, out[name], 0.0)
+                    continue
+                cache_stats["misses"] += 1
+            calls[name] = _as_json(fn, *args)
+
+        if parallel:
+            run_checks(
+                calls, default_timeout=self.check_timeout, timeouts=self.check_timeouts,
+                deadline=self.deadline, on_outcome=record,
+            )
+        else:
+            for name, fn in calls.items():
+                record(name, run_inline(fn))
+        out = {name: out[name] for name, _, _ in checks}
+
+        response = {"ok": True, "results": out}
+        if mode == FAST:
+            response["mode"] = FAST
+        if timed_out:
+            response["timed_out"] = [name for name in out if name in timed_out]
+        if cache is not None:
+            response["cache"] = cache_stats
+        if sections is not None:
+            response["sections"] = sections
+        if self.duplicate_index is not None and (selected is None or "overlaps" in selected):
+            try:
+                response["overlaps"] = overlaps_json(self.duplicate_index.query(payload))
+            except Exception as e:
+                response["overlaps"] = {"error": str(e)}
+        if self.phrase_index is not None and (selected is None or "overused_phrases" in selected):
+            try:
+                response["overused_phrases"] = overused_json(
+                    self.phrase_index.query_document(doc, exclude_slug=payload.get("slug"))
+                )
+            except Exception as e:
+                response["overused_phrases"] = {"error": str(e)}
+        return response
@@ -0,0 +1,173 @@
+"""
+Stratified block sampling for the fast audit mode.
+
+In fast mode (payload "mode": "fast") the expensive checks (entity_density,
+experience_signals, readability_variance) analyze a sample of a long document rather
+than all of it, so their cost stays bounded as documents grow:
+
+- the plain text is cut into paragraph-aligned blocks of about BLOCK_CHARS (chunk_spans);
+- consecutive blocks are grouped into STRATA strata by position, so every part of the
+  document (intro, body, conclusion) is represented;
+- each stratum contributes the same share of its blocks (at least two), picked at random
+  with a seed derived from the text, so the same document always gets the same sample.
+
+Documents of at most sample_words words are never sampled: fast mode then gives the
+exhaustive result. Estimates carry a 95% confidence interval: counts are stratified totals
+with the usual normal-approximation interval (a rule-of-three upper bound when the sample
+has none); entity density estimates the entities the sample missed from those it saw once
+or twice (richness). Intervals cover
+sampling variation only (not the checks' own error).
+"""
+
+import math
+import random
+import zlib
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from .document import AnalyzedDocument, chunk_spans
+from .serialize import JSONResult
+
+FULL = "full"
+FAST = "fast"
+MODES = (FULL, FAST)
+# Checks (run_audit.py result names) that fast mode samples; the rest always read the whole text
+SAMPLED_CHECKS = ("experience_signals", "entity_density", "readability_variance")
+
+# Words analyzed per document in fast mode (bounds the latency of the sampled checks)
+DEFAULT_SAMPLE_WORDS = 20_000
+BLOCK_CHARS = 2_000
+STRATA = 10
+CONFIDENCE = 0.95
+_Z = 1.959964  # two-sided normal quantile for CONFIDENCE
+
+
+@dataclass(slots=True)
+class SampleEstimate(JSONResult):
+    metric: str  # what is estimated, e.g. "score" or "fatigue_sentences" (whole-document count)
+    value: float
+    ci_low: float
+    ci_high: float
+    sample_fraction: float  # share of the document's words that were analyzed
+    confidence: float = CONFIDENCE
+
+
+@dataclass
+class SamplePlan:
+    """Blocks chosen from one document, in document order, with their strata."""
+
+    text: str
+    total_words: int
+    blocks: list[tuple[int, int]]  # (start, end) offsets into text
+    block_strata: list[int]  # stratum of each sampled block
+    stratum_sizes: list[int]  # blocks in each stratum
+    seed: int
+    # One AnalyzedDocument per sampled block (offsets relative to the block start), shared by the checks
+    docs: list[AnalyzedDocument] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        if not self.docs:
+            self.docs = [AnalyzedDocument(self.text[start:end]) for start, end in self.blocks]
+
+    @property
+    def fraction(self) -> float:
+        sampled = sum(d.word_count for d in self.docs)
+        return round(sampled / self.total_words, 4) if self.total_words else 1.0
+
+    def by_stratum(self, values: list[float]) -> list[list[float]]:
+        """values (one per sampled block) grouped by stratum."""
+        groups: list[list[float]] = [[] for _ in self.stratum_sizes]
+        for stratum, value in zip(self.block_strata, values):
+            groups[stratum].append(value)
+        return groups
+
+    def estimate_total(self, metric: str, values: list[float]) -> SampleEstimate:
+        """
+        Whole-document total of a per-block count (stratified expansion estimator).
+        The interval never drops below what the sample itself contains.
+        """
+        total = variance = 0.0
+        for size, group in zip(self.stratum_sizes, self.by_stratum(values)):
+            n = len(group)
+            mean = sum(group) / n
+            total += size * mean
+            if 1 < n < size:
+                s2 = sum((v - mean) ** 2 for v in group) / (n - 1)
+                variance += size * size * (1 - n / size) * s2 / n
+        half = _Z * math.sqrt(variance)
+        observed = sum(values)
+        high = total + half
+        if not observed:
+            # Nothing in the sample, so no variance either: the rule of three bounds the
+            # share of blocks that could hold a hit at 3 / sampled blocks
+            high = 3 * sum(self.stratum_sizes) / len(values)
+        return SampleEstimate(
+            metric=metric,
+            value=round(total, 2),
+            ci_low=round(max(total - half, observed), 2),
+            ci_high=round(max(high, observed), 2),
+            sample_fraction=self.fraction,
+        )
+
+
+def plan_sample(text: str, total_words: int, sample_words: int = DEFAULT_SAMPLE_WORDS) -> Optional[SamplePlan]:
+    """Stratified block sample of text with about sample_words words, or None when the whole text fits."""
+    if total_words <= sample_words:
+        return None
+    spans = list(chunk_spans(text, BLOCK_CHARS))
+    # At least two blocks per stratum (for a variance estimate)
+    strata = min(STRATA, len(spans) // 2)
+    if strata < 2:
+        return None
+    fraction = sample_words / total_words
+    seed = zlib.crc32(text.encode("utf-8", "surrogatepass"))
+    rng = random.Random(seed)
+    blocks: list[tuple[int, int]] = []
+    block_strata: list[int] = []
+    sizes: list[int] = []
+    for stratum in range(strata):
+        first = stratum * len(spans) // strata
+        end = (stratum + 1) * len(spans) // strata
+        size = end - first
+        take = min(size, max(2, round(fraction * size)))
+        for i in sorted(rng.sample(range(first, end), take)):
+            blocks.append(spans[i])
+            block_strata.append(stratum)
+        sizes.append(size)
+    return SamplePlan(
+        text=text, total_words=total_words, blocks=blocks, block_strata=block_strata, stratum_sizes=sizes, seed=seed
+    )
+
+
+def richness(frequencies: Iterable[int], fraction: float) -> tuple[float, float, float]:
+    """
+    (estimate, low, high): number of distinct items (e.g. entities) in a whole document from
+    how often each one occurs in a sample holding `fraction` of the document. The estimate is
+    the bias-corrected Chao1 lower bound for sampling without replacement (Chao & Lin 2012),
+    driven by the items seen once (f1) and twice (f2); the interval is Chao's log-normal one.
+    Being a lower bound, it reads low for documents with a long tail of one-off items.
+    """
+    counts = [c for c in frequencies if c > 0]
+    observed = float(len(counts))
+    n = sum(counts)
+    f1 = sum(1 for c in counts if c == 1)
+    if n < 2 or not f1 or fraction >= 1:
+        return observed, observed, observed
+    f2 = sum(1 for c in counts if c == 2)
+    a = (n - 1) / n
+    unseen = f1 * (f1 - 1) / (2 * (f2 + 1) / a + fraction / (1 - fraction) * f1)
+    if not unseen:
+        return observed, observed, observed
+    if f2:
+        ratio = f1 / f2
+        variance = f2 * (a / 2 * ratio**2 + a**2 * ratio**3 + a**2 / 4 * ratio**4)
+    else:
+        variance = a * f1 * (f1 - 1) / 2 + a**2 * f1 * (2 * f1 - 1) ** 2 / 4 - a**2 * f1**4 / (4 * (observed + unseen))
+    k = math.exp(_Z * math.sqrt(math.log(1 + max(variance, 0.0) / unseen**2)))
+    return observed + unseen, observed + unseen / k, observed + unseen * k
+
+
+def shifted(spans: list[tuple[int, int]], offset: int) -> list[tuple[int, int]]:
+    """spans moved by offset (block-relative offsets to document offsets)."""
+    return [(start + offset, end + offset) for start, end in spans]
+
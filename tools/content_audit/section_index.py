@@ -0,0 +1,254 @@
+"""
+Linear-time section index of an article, shared by skimmability and answer-first.
+
+build_html_index() makes one streaming html.parser pass. For every H2/H3 it records:
+    - the heading text and level
+    - the <p> and <ul>/<ol> siblings that follow it, up to the next H2/H3 sibling
+    - the first <p> anywhere after it in document order
+    - the section's character offsets in the source
+It mirrors how BeautifulSoup's "html.parser" builder nests elements: unclosed tags nest,
+stray end tags are ignored, and script/style/template text and comments are not text.
+Because no tree is built and no sibling lists are rescanned, pages with hundreds of
+headings (glossaries, large FAQs) stay linear.
+
+build_markdown_index() is the ## / ### fallback for text without HTML.
+"""
+
+import re
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Optional
+
+HEADING_TAGS = ("h2", "h3")
+LIST_TAGS = ("ul", "ol")
+# Tags bs4 treats as empty (never pushed on the open-element stack)
+VOID_TAGS = frozenset(
+    "area base br col embed hr img input keygen link menuitem meta param source track wbr "
+    "basefont bgsound command frame image isindex nextid spacer".split()
+)
+# Text inside these is not part of get_text()
+NON_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+_MD_HEADING_RE = re.compile(r"(?m)^(#{2,3}\s+.+)$")
+_MD_LIST_ITEM_RE = re.compile(r"(?m)^\s*(?:[-*+]|\d+[.)])\s+(.+)$")
+
+
+@dataclass
+class Section:
+    tag: str  # "h2" or "h3"
+    heading: str
+    start: int  # offset of the heading in the source
+    end: int  # offset of the next H2/H3 (or end of source)
+    paragraphs: list[str] = field(default_factory=list)
+    lists: list[list[str]] = field(default_factory=list)
+    # Text of the first <p> after the heading in document order (HTML only; None if there is none)
+    next_paragraph: Optional[str] = None
+
+    @property
+    def level(self) -> int:
+        return int(self.tag[1])
+
+    @property
+    def body(self) -> str:
+        return " ".join(self.paragraphs)
+
+
+@dataclass
+class SectionIndex:
+    source: str  # "html" or "markdown"
+    sections: list[Section]
+    # Whole-document text (get_text(" ", strip=True) for HTML, stripped text for Markdown)
+    text: str
+    # Text of the first <p> in the document (HTML only)
+    first_paragraph: Optional[str] = None
+
+
+class _Node:
+    __slots__ = ("name", "start", "end", "section", "items")
+
+    def __init__(self, name: str, start: int):
+        self.name = name
+        self.start = start  # index into the builder's text pieces
+        self.end: Optional[int] = None
+        self.section: Optional[Section] = None
+        self.items: Optional[list["_Node"]] = None  # <li> children of an indexed list
+
+
+class _HTMLSectionBuilder(HTMLParser):
+    def __init__(self, html: str):
+        super().__init__(convert_charrefs=True)
+        self._line_starts = [0] + [m.end() for m in re.finditer("\n", html)]
+        self._length = len(html)
+        self.pieces: list[str] = []  # text runs, in document order
+        self._run: list[str] = []
+        self.root = _Node("[document]", 0)
+        self._stack: list[_Node] = []
+        self._open_counts: dict[str, int] = {}
+        self._non_text = 0
+        # Void tags opened as <img> (not <img/>): bs4 ignores one matching </img> for each
+        self._closed_void: dict[str, int] = {}
+        # Per parent element: the heading whose following siblings we are collecting
+        self._active: dict[_Node, Section] = {}
+        self._pending: list[Section] = []  # headings still waiting for their next <p>
+        self.sections: list[Section] = []
+        self._headings: list[_Node] = []
+        self._section_p: dict[int, list[_Node]] = {}
+        self._section_lists: dict[int, list[_Node]] = {}
+        self._next_p: dict[int, _Node] = {}
+        self.first_p: Optional[_Node] = None
+
+    def _offset(self) -> int:
+        line, col = self.getpos()
+        return self._line_starts[line - 1] + col
+
+    def _flush(self) -> None:
+        if self._run:
+            if not self._non_text:
+                self.pieces.append("".join(self._run))
+            self._run = []
+
+    def handle_starttag(self, tag, attrs):
+        self._start(tag)
+        if tag in VOID_TAGS:
+            self._closed_void[tag] = self._closed_void.get(tag, 0) + 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._start(tag)
+        self._end(tag)
+
+    def _start(self, tag: str) -> None:
+        self._flush()
+        parent = self._stack[-1] if self._stack else self.root
+        node = _Node(tag, len(self.pieces))
+        if tag in HEADING_TAGS:
+            start = self._offset()
+            if self.sections:
+                self.sections[-1].end = start
+            section = Section(tag=tag, heading="", start=start, end=self._length)
+            node.section = section
+            self.sections.append(section)
+            self._headings.append(node)
+            self._active[parent] = section
+            self._pending.append(section)
+        elif tag == "p":
+            if self.first_p is None:
+                self.first_p = node
+            for section in self._pending:
+                self._next_p[id(section)] = node
+            self._pending = []
+            section = self._active.get(parent)
+            if section is not None:
+                self._section_p.setdefault(id(section), []).append(node)
+        elif tag in LIST_TAGS:
+            section = self._active.get(parent)
+            if section is not None:
+                node.items = []
+                self._section_lists.setdefault(id(section), []).append(node)
+        elif tag == "li" and parent.items is not None:
+            parent.items.append(node)
+
+        if tag in VOID_TAGS:
+            node.end = node.start
+            return
+        self._stack.append(node)
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+        if tag in NON_TEXT_TAGS:
+            self._non_text += 1
+
+    def handle_endtag(self, tag):
+        if self._closed_void.get(tag):
+            self._closed_void[tag] -= 1
+            return
+        self._end(tag)
+
+    def _end(self, tag: str) -> None:
+        self._flush()
+        if not self._open_counts.get(tag):
+            return  # stray end tag: ignored, like bs4
+        while True:
+            node = self._stack.pop()
+            self._close(node)
+            if node.name == tag:
+                return
+
+    def _close(self, node: _Node) -> None:
+        node.end = len(self.pieces)
+        self._open_counts[node.name] -= 1
+        if node.name in NON_TEXT_TAGS:
+            self._non_text -= 1
+        self._active.pop(node, None)
+
+    def handle_data(self, data):
+        self._run.append(data)
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.startswith("CDATA["):
+            # bs4 keeps CDATA as text even inside <template>
+            self.pieces.append(data[len("CDATA["):])
+
+    def finish(self) -> SectionIndex:
+        self.close()
+        self._flush()
+        while self._stack:
+            self._close(self._stack.pop())
+        for node in self._headings:
+            section = node.section
+            section.heading = _join(self.pieces[node.start:node.end], "")
+            section.paragraphs = [self._text(p) for p in self._section_p.get(id(section), [])]
+            section.lists = [[self._text(li) for li in ul.items] for ul in self._section_lists.get(id(section), [])]
+            next_p = self._next_p.get(id(section))
+            section.next_paragraph = self._text(next_p) if next_p is not None else None
+        return SectionIndex(
+            source="html",
+            sections=self.sections,
+            text=_join(self.pieces),
+            first_paragraph=self._text(self.first_p) if self.first_p is not None else None,
+        )
+
+    def _text(self, node: _Node) -> str:
+        return _join(self.pieces[node.start:node.end])
+
+
+def _join(pieces: list[str], separator: str = " ") -> str:
+    """get_text(separator, strip=True) over text runs."""
+    return separator.join(s for s in (p.strip() for p in pieces) if s)
+
+
+def build_html_index(html: str) -> SectionIndex:
+    """Index H2/H3 sections of html in one pass."""
+    builder = _HTMLSectionBuilder(html)
+    builder.feed(html)
+    return builder.finish()
+
+
+def build_markdown_index(text: str) -> SectionIndex:
+    """
+    Index ## / ### sections of Markdown-style text. A section's paragraphs are its
+    blank-line-separated blocks (list lines included); lists holds its list items.
+    """
+    sections = []
+    matches = list(_MD_HEADING_RE.finditer(text))
+    for i, m in enumerate(matches):
+        raw = m.group(1)
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        chunk = text[m.end():end]
+        items = [item.strip() for item in _MD_LIST_ITEM_RE.findall(chunk)]
+        sections.append(Section(
+            tag="h2" if raw.startswith("## ") and not raw.startswith("### ") else "h3",
+            heading=raw.lstrip("#").strip(),
+            start=m.start(),
+            end=end,
+            paragraphs=[block.strip() for block in re.split(r"\n\s*\n", chunk) if block.strip()],
+            lists=[items] if items else [],
+        ))
+    return SectionIndex(source="markdown", sections=sections, text=text.strip())
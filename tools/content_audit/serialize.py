@@ -0,0 +1,112 @@
+"""
+Result types' JSON conversion and the JSON writer for audit responses.
+
+Check results are slotted dataclasses deriving from JSONResult. to_json_dict() turns one
+into a plain dict without dataclasses.asdict's deep copy: field values are used as-is
+(lists and tuples are shared with the result, not copied), and only nested results are
+converted.
+
+dumps() uses orjson when it is installed and the stdlib json module otherwise; set
+CONTENT_AUDIT_JSON=stdlib to force the latter. Both produce the same bytes: compact
+separators, non-ASCII text as UTF-8 rather than \\u escapes, floats in orjson's shortest
+form (1e16, 0.00001 and 2.5e-7 rather than 1e+16, 1e-05 and 2.5e-07), and null for NaN and
+infinities. Values orjson rejects (integers over 64 bits, non-string keys, strings with lone
+surrogates) go through the stdlib path on both backends; lone surrogates are then written
+as \\u escapes, with the whole response ASCII-escaped.
+"""
+
+import json
+import math
+import os
+import re
+from typing import Any
+
+from . import assets
+
+JSON_BACKEND_ENV = "CONTENT_AUDIT_JSON"
+
+
+class JSONResult:
+    """Base of the check result dataclasses (declared with slots=True)."""
+
+    __slots__ = ()
+
+    def to_json_dict(self) -> dict:
+        """Field name -> value, in declaration order; nested results become dicts, nothing else is copied."""
+        return {name: _json_value(getattr(self, name)) for name in self.__slots__}
+
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, JSONResult):
+        return value.to_json_dict()
+    if isinstance(value, list) and value and isinstance(value[0], JSONResult):
+        return [v.to_json_dict() for v in value]
+    return value
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, JSONResult):
+        return value.to_json_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_default)
+_ASCII_ENCODER = json.JSONEncoder(ensure_ascii=True, separators=(",", ":"), default=_default)
+
+# Quick test for the exponent of a float the stdlib writes differently from orjson ("1e-05",
+# "1e+16"); kept to one literal-led pattern so the regex engine can skip ahead between "e"s
+_EXPONENT_HINT_RE = re.compile(r"e[-+]\d")
+# A JSON string (skipped) or an exponent-form / non-finite number token
+_FLOAT_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|(-?(?:\d+(?:\.\d+)?[eE][-+]?\d+|Infinity)|NaN)')
+
+
+def _orjson_float(token: str) -> str:
+    """orjson's spelling of a float that Python's repr wrote as token."""
+    value = float(token)
+    if not math.isfinite(value):
+        return "null"
+    sign = "-" if token.startswith("-") else ""
+    mantissa, exponent = token.lstrip("-").split("e")
+    digits = mantissa.replace(".", "")
+    # Decimal exponent of the first significant digit
+    point = int(exponent) + 1
+    if -4 <= point <= 0:
+        return f"{sign}0.{'0' * -point}{digits}"
+    return f"{sign}{mantissa}e{int(exponent)}"
+
+
+def _fix_floats(text: str) -> str:
+    if not _EXPONENT_HINT_RE.search(text) and "NaN" not in text and "Infinity" not in text:
+        return text
+    return _FLOAT_TOKEN_RE.sub(lambda m: _orjson_float(m.group(1)) if m.group(1) else m.group(0), text)
+
+
+def _stdlib_dumps(value: Any) -> str:
+    text = _ENCODER.encode(value)
+    try:
+        text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be written as UTF-8
+        text = _ASCII_ENCODER.encode(value)
+    return _fix_floats(text)
+
+
+def backend() -> str:
+    """"orjson" or "stdlib": the serializer dumps() uses."""
+    if os.environ.get(JSON_BACKEND_ENV, "").lower() == "stdlib":
+        return "stdlib"
+    return "orjson" if assets.load_orjson() is not None else "stdlib"
+
+
+def dumps(value: Any) -> str:
+    """Compact JSON text for value (results, responses, events); identical for both backends."""
+    if backend() == "orjson":
+        orjson = assets.load_orjson()
+        try:
+            return orjson.dumps(
+                value, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+            ).decode("utf-8")
+        except TypeError:
+            # orjson.JSONEncodeError: fall through to the stdlib rules
+            pass
+    return _stdlib_dumps(value)
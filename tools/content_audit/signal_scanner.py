@@ -0,0 +1,109 @@
+"""
+SignalScanner: compiles several families of signal regexes (e.g. GoogleQualityAuditor's
+percentages, currency, citation markers, years, experience phrases) into one regex and
+walks the text once, emitting typed hits with offsets.
+
+Each pattern becomes a named group inside a zero-width lookahead, and the lookaheads are
+joined as an alternation, so the engine visits every position once and stops at the first
+pattern that matches there. The later patterns are then tried at that position only.
+Because nothing is consumed, overlapping hits from different patterns are all reported,
+e.g. "$3 million" is both a currency hit and a magnitude hit. A family's lead (e.g. "\d"
+for numbers, "\b[a-z]" for phrases) is tested once before its patterns, so positions that
+cannot start a match are skipped without trying every alternative.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class SignalFamily:
+    name: str  # hit kind, e.g. "percent"
+    patterns: list[str]
+    overlapping: bool = False  # report every start position, not just re.finditer's non-overlapping matches
+    lead: Optional[str] = None  # regex every match starts with, e.g. r"\d"; None tries the patterns everywhere
+
+
+@dataclass
+class SignalHit:
+    kind: str
+    pattern: int  # index of the matching pattern within its family
+    start: int
+    end: int
+
+
+class SignalScanner:
+    """
+    Single-pass, case-insensitive scanner over several tagged pattern families.
+    Per pattern, hits are exactly what re.finditer(pattern, text, re.I) would return
+    (or every position the pattern matches at, for overlapping families); hits from
+    different patterns may overlap. Hits are in document order, then family/pattern order.
+    """
+
+    def __init__(self, families: list[SignalFamily]):
+        self.families = families
+        # (kind, index within family, overlapping, standalone regex, branch) in scan order
+        self._patterns: list[tuple[str, int, bool, re.Pattern, int]] = []
+        # Consecutive families with the same lead share one (?=lead)(?:...) branch; order is kept
+        branches: list[tuple[Optional[str], list[str]]] = []
+        for fam in families:
+            if not branches or branches[-1][0] != fam.lead:
+                branches.append((fam.lead, []))
+            for idx, pattern in enumerate(fam.patterns):
+                branches[-1][1].append(f"(?=(?P<{fam.name}_{idx}>{pattern}))")
+                self._patterns.append(
+                    (fam.name, idx, fam.overlapping, re.compile(pattern, re.IGNORECASE), len(branches) - 1)
+                )
+        self._leads = [re.compile(lead, re.IGNORECASE) if lead is not None else None for lead, _ in branches]
+        groups = [
+            "|".join(alts) if lead is None else f"(?={lead})(?:{'|'.join(alts)})" for lead, alts in branches if alts
+        ]
+        self._regex: Optional[re.Pattern] = re.compile("|".join(groups), re.IGNORECASE) if groups else None
+        # regex group number -> position in _patterns
+        self._group_pattern: dict[int, int] = {}
+        if self._regex is not None:
+            names = [f"{kind}_{idx}" for kind, idx, _, _, _ in self._patterns]
+            self._group_pattern = {self._regex.groupindex[name]: i for i, name in enumerate(names)}
+
+    def scan(self, text: str) -> list[SignalHit]:
+        hits: list[SignalHit] = []
+        if self._regex is None or not text:
+            return hits
+        patterns = self._patterns
+        # End of each pattern's last non-overlapping hit: re.finditer resumes its search there
+        resume = [0] * len(patterns)
+        for m in self._regex.finditer(text):
+            pos = m.start()
+            first = self._group_pattern[m.lastindex]
+            # Whether each later branch's lead holds here (None: not tested yet)
+            lead_ok: list[Optional[bool]] = [None] * len(self._leads)
+            for i in range(first, len(patterns)):
+                kind, idx, overlapping, regex, branch = patterns[i]
+                if pos < resume[i] and not overlapping:
+                    continue
+                if i != first:
+                    if lead_ok[branch] is None:
+                        lead = self._leads[branch]
+                        lead_ok[branch] = lead is None or lead.match(text, pos) is not None
+                    if not lead_ok[branch]:
+                        continue
+                if i == first:
+                    end = m.end(m.lastindex)
+                else:
+                    pm = regex.match(text, pos)
+                    if pm is None:
+                        continue
+                    end = pm.end()
+                resume[i] = end
+                hits.append(SignalHit(kind=kind, pattern=idx, start=pos, end=end))
+        return hits
+
+    def matches_within(self, hit: SignalHit, text: str, endpos: int) -> bool:
+        """Whether hit's pattern still matches at hit.start when text is cut off at endpos."""
+        if hit.end <= endpos:
+            return True
+        for kind, idx, _, regex, _ in self._patterns:
+            if kind == hit.kind and idx == hit.pattern:
+                return regex.match(text, hit.start, endpos) is not None
+        return False
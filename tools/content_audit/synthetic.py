@@ -0,0 +1,162 @@
+"""
+Deterministic synthetic articles for benchmarking the audit checks.
+
+    from content_audit.synthetic import ArticleSpec, generate_article
+
+    article = generate_article(ArticleSpec(words=50_000, faq_sections=3, seed=7))
+    article.html, article.text, article.title
+    titles = generate_titles(500, distinct=250, seed=7)
+
+The same spec (including seed) always yields the same article. Knobs:
+    words            approximate body word count (1k-200k is the benchmarked range)
+    headings         number of H2 sections (default: one per ~300 words)
+    faq_sections     sections whose H2 is a question, plus that many Q&A pairs under an "FAQ" H2
+    numeric_density  share of words replaced by numbers, percentages, prices or years
+    lexicon_hit_rate share of sentences that contain a lexicon phrase (robotic transitions,
+                     hype words, AI tells, experience phrases)
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+from .document import html_to_plain
+from .google_quality_auditor import CLICKBAIT_WORDS
+from .lazy_writing_auditor import AI_TELLS, HOLLOW_HYPE, ROBOTIC_TRANSITIONS
+
+_VOCABULARY = (
+    "the a of to and in that it for on with as is was be by this are from or have an they "
+    "which one you were all we when there can more if has will each about how up out them "
+    "then she many some so these would other into time could two like him see number no way "
+    "people my than first water been call who its now find long down day did get come made "
+    "may part garden soil light budget kitchen camera lens battery engine route recipe oven "
+    "schedule client invoice server query cache latency review project team workflow price "
+    "plan result sample growth season market storage network design layout metric report"
+).split()
+
+_EXPERIENCE_PHRASES = (
+    "in my experience", "after testing", "hands-on", "from our experience",
+    "once you try", "you'll notice", "I tested", "we measured",
+)
+
+_TITLE_OPENERS = ("Best", "Amazing", "Terrible", "Why", "How to", "10 Great", "The Worst", "Love These")
+
+_QUESTION_STARTS = ("What is", "How do", "Why does", "When should", "Can you", "Is it")
+
+
+@dataclass
+class ArticleSpec:
+    words: int = 1_000
+    headings: Optional[int] = None
+    faq_sections: int = 2
+    numeric_density: float = 0.02
+    lexicon_hit_rate: float = 0.05
+    seed: int = 0
+
+
+@dataclass
+class SyntheticArticle:
+    spec: ArticleSpec
+    title: str
+    html: str
+
+    @property
+    def text(self) -> str:
+        """Plain text the way the API route derives it from HTML."""
+        return html_to_plain(self.html)
+
+    def payload(self) -> dict:
+        """run_audit.py / AuditSession payload for this article."""
+        return {"title": self.title, "content": self.html, "html": self.html}
+
+
+def _number(rng: random.Random) -> str:
+    kind = rng.randrange(4)
+    if kind == 0:
+        return f"{rng.randint(1, 99)}%"
+    if kind == 1:
+        return f"${rng.randint(5, 5000):,}"
+    if kind == 2:
+        return str(rng.randint(2015, 2026))
+    return f"{rng.randint(2, 500)}"
+
+
+def _sentence(rng: random.Random, spec: ArticleSpec, lexicon: list[str]) -> tuple[str, int]:
+    """One sentence and its word count."""
+    n = rng.randint(6, 28)
+    words = [_number(rng) if rng.random() < spec.numeric_density else rng.choice(_VOCABULARY) for _ in range(n)]
+    if lexicon and rng.random() < spec.lexicon_hit_rate:
+        phrase = rng.choice(lexicon)
+        words.insert(rng.randint(0, len(words)), phrase)
+        n += len(phrase.split())
+    words[0] = words[0][:1].upper() + words[0][1:]
+    return " ".join(words) + rng.choice(".....?!"), n
+
+
+def _paragraph(rng: random.Random, spec: ArticleSpec, lexicon: list[str], budget: int) -> tuple[str, int]:
+    sentences, used = [], 0
+    while used < budget:
+        s, n = _sentence(rng, spec, lexicon)
+        sentences.append(s)
+        used += n
+    return " ".join(sentences), used
+
+
+def _question(rng: random.Random) -> str:
+    return f"{rng.choice(_QUESTION_STARTS)} {' '.join(rng.choice(_VOCABULARY) for _ in range(rng.randint(2, 5)))}?"
+
+
+def generate_titles(count: int, distinct: Optional[int] = None, seed: int = 0) -> list[str]:
+    """
+    count headline variants drawn from distinct different titles (default: all different),
+    some with clickbait words, numbers or strong sentiment.
+    """
+    rng = random.Random(seed)
+    pool = []
+    for _ in range(max(distinct or count, 1)):
+        words = [rng.choice(_VOCABULARY).title() for _ in range(rng.randint(3, 8))]
+        if rng.random() < 0.3:
+            words.insert(rng.randint(0, len(words)), rng.choice(CLICKBAIT_WORDS).title())
+        if rng.random() < 0.3:
+            words.insert(0, rng.choice(_TITLE_OPENERS))
+        if rng.random() < 0.3:
+            words.append(str(rng.randint(2020, 2026)))
+        pool.append(" ".join(words))
+    return [pool[i % len(pool)] if i < len(pool) else rng.choice(pool) for i in range(count)]
+
+
+def generate_article(spec: Optional[ArticleSpec] = None) -> SyntheticArticle:
+    """Build one deterministic HTML article matching spec."""
+    spec = spec or ArticleSpec()
+    rng = random.Random(spec.seed)
+    lexicon = list(ROBOTIC_TRANSITIONS) + list(HOLLOW_HYPE) + list(AI_TELLS) + list(_EXPERIENCE_PHRASES)
+    headings = spec.headings if spec.headings is not None else max(spec.words // 300, 1)
+    faq = min(spec.faq_sections, headings)
+    title = f"{rng.choice(CLICKBAIT_WORDS).title()} Guide to {rng.choice(_VOCABULARY).title()} in {rng.randint(2020, 2026)}"
+
+    parts = [f"<h1>{title}</h1>"]
+    remaining = spec.words
+    intro, used = _paragraph(rng, spec, lexicon, min(80, remaining))
+    parts.append(f"<p>{intro}</p>")
+    remaining -= used
+    per_section = max(remaining // max(headings + (1 if faq else 0), 1), 1)
+
+    for i in range(headings):
+        heading = _question(rng) if i < faq else f"Section {i + 1}: {rng.choice(_VOCABULARY).title()} tips"
+        parts.append(f"<h2>{heading}</h2>")
+        section_left = per_section
+        while section_left > 0:
+            para, used = _paragraph(rng, spec, lexicon, min(rng.randint(40, 160), section_left))
+            parts.append(f"<p>{para}</p>")
+            section_left -= used
+        if i % 3 == 2:
+            items = "".join(f"<li>{rng.choice(_VOCABULARY)} {_number(rng)}</li>" for _ in range(4))
+            parts.append(f"<ul>{items}</ul>")
+
+    if faq:
+        parts.append("<h2>FAQ</h2>")
+        for _ in range(faq):
+            answer, _ = _paragraph(rng, spec, lexicon, max(per_section // faq, 20))
+            parts.append(f"<h3>{_question(rng)}</h3><p>{answer}</p>")
+
+    return SyntheticArticle(spec=spec, title=title, html="\n".join(parts))
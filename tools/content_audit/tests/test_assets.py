@@ -0,0 +1,10 @@
+"""`import content_audit` stays within its import-time budget and loads no heavy dependency."""
+
+from content_audit import assets
+
+
+def test_import_within_budget_without_heavy_modules():
+    timing = assets.measure_import()
+    assert timing.get("error") is None, timing.get("error")
+    assert timing["heavy_modules_loaded"] == []
+    assert timing["import_ms"] <= assets.DEFAULT_IMPORT_BUDGET_MS
@@ -0,0 +1,55 @@
+"""Incremental section audits report the same offsets as full-document audits."""
+
+import pytest
+
+from content_audit import assets
+from content_audit.runner import AuditSession
+
+pytestmark = pytest.mark.skipif(not assets.punkt_available(), reason="needs nltk punkt data (--prefetch-assets)")
+
+# Every section ends its last sentence before the next H2, so both modes segment alike
+BODY = (
+    "Furthermore, I tested this for {n} weeks and we measured the results. Moreover, it is a "
+    "game-changer. Let's delve into step {n}. "
+    + "This is a long sentence that keeps going with many more words in it than a reader wants to hold at once " * 2
+    + "before it ends."
+)
+# No text before the first H2
+HTML = "<article>" + "".join(f"<h2>Part {n}?</h2>\n<p>{BODY.format(n=n)}</p>\n" for n in range(4)) + "</article>"
+MARKDOWN = "Intro text here.\n\n" + "".join(f"## Part {n}\n\n{BODY.format(n=n)}\n\n" for n in range(4))
+
+OFFSET_FIELDS = (
+    ("lazy_phrasing", "matches"),
+    ("experience_signals", "experience_spans"),
+    ("readability_variance", "fatigue_spans"),
+    ("readability_variance", "monotony_runs"),
+)
+
+
+@pytest.fixture(scope="module")
+def session():
+    return AuditSession(preload_spacy=False, checks=["lazy_phrasing", "experience_signals", "readability_variance"])
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"content": HTML},
+        {"markdown": MARKDOWN},
+        # The route sends both; the audited text comes from content
+        {"content": "<div><p>Lead-in paragraph.</p>" + HTML + "</div>", "html": HTML},
+    ],
+    ids=["html-empty-preamble", "markdown", "content-differs-from-html"],
+)
+def test_incremental_offsets_match_full_audit(session, payload):
+    full = session.audit(dict(payload))["results"]
+    sections = session.audit(dict(payload, incremental=True))["results"]
+    for check, field in OFFSET_FIELDS:
+        assert sections[check][field] == full[check][field], f"{check}.{field}"
+    assert sections["lazy_phrasing"]["matches"]
+
+
+def test_incremental_matches_slice_to_their_text(session):
+    text = MARKDOWN.strip()
+    for match in session.audit({"markdown": MARKDOWN, "incremental": True})["results"]["lazy_phrasing"]["matches"]:
+        assert text[match["start"]:match["end"]] == match["text"]
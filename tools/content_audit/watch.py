@@ -0,0 +1,367 @@
+"""
+Watch mode: re-audit Markdown/HTML drafts in a directory as they are saved.
+
+    cd tools && python -m content_audit.watch path/to/drafts/ [--text] [--checks lazy_phrasing,skimmability]
+    cd tools && python -m content_audit.watch path/to/drafts/ --poll --interval 0.5
+
+Every .html/.htm/.md/.markdown file under the directory is audited once at start-up, then
+again whenever it changes. Changes come from inotify on Linux (through libc, no extra
+dependency) or, elsewhere or with --poll, from comparing file mtimes and sizes every
+--interval seconds. Saves are debounced: files are re-audited once nothing has changed for
+--debounce seconds, so an editor writing a file in several steps costs one audit. A file
+whose content hash is unchanged (touch, save without edits) is not re-audited.
+
+Audits run in one warm AuditSession with "incremental": true, so after the first load a
+save re-analyzes only the edited H2 sections plus the document-level checks. Output is one
+JSON line per event (--text prints a short line per changed value instead):
+
+    {"event": "audit", "source": ..., "slug": ..., "results": {...}, "elapsed_ms": ...}
+    {"event": "diff", "source": ..., "slug": ..., "changed": {"lazy_phrasing": {"score": [72, 80]}}, ...}
+    {"event": "removed", "source": ..., "slug": ...}
+
+"audit" carries the full results of a file's first audit; "diff" carries, per check whose
+result changed, each changed field as [before, after] (an empty "changed" means the edit did
+not move any result).
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import time
+from typing import IO, Any, Callable, Iterable, Optional
+
+from .batch import HTML_EXTENSIONS, MARKDOWN_EXTENSIONS, _post_from_file
+from .cache import CACHE_DIR_ENV, ResultCache
+from .runner import CHECK_ARTIFACTS, LOOKUPS, AuditSession
+from .serialize import dumps
+
+DEFAULT_INTERVAL_S = 0.25
+DEFAULT_DEBOUNCE_S = 0.2
+WATCHED_EXTENSIONS = HTML_EXTENSIONS + MARKDOWN_EXTENSIONS
+
+# inotify(7) event bits
+_IN_MODIFY = 0x2
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_ISDIR = 0x40000000
+_IN_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def is_watched(path: str) -> bool:
+    return path.lower().endswith(WATCHED_EXTENSIONS)
+
+
+def _walk(root: str) -> Iterable[tuple[str, list[str]]]:
+    """(directory, watched file paths) for root and every directory below it."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        yield dirpath, [os.path.join(dirpath, name) for name in sorted(filenames) if is_watched(name)]
+
+
+class PollingSource:
+    """Finds changed files by comparing (mtime, size) snapshots of the tree every interval seconds."""
+
+    name = "polling"
+
+    def __init__(self, root: str, interval: float = DEFAULT_INTERVAL_S):
+        self.root = root
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot = {}
+        for _, paths in _walk(self.root):
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def files(self) -> list[str]:
+        return sorted(self._snapshot)
+
+    def changes(self, timeout: float) -> set[str]:
+        """Paths added, modified or removed since the last call (waits up to timeout first)."""
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = {p for p in snapshot.keys() | self._snapshot.keys() if snapshot.get(p) != self._snapshot.get(p)}
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+class InotifySource:
+    """Linux inotify watches on root and its subdirectories (new subdirectories are watched as they appear)."""
+
+    name = "inotify"
+
+    def __init__(self, root: str):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.root = root
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, str] = {}
+        self._files: set[str] = set()
+        self._watch_tree(root)
+
+    def _watch_tree(self, root: str) -> set[str]:
+        """Watch root and the directories below it; returns the watched files found there."""
+        found = set()
+        for dirpath, paths in _walk(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), _IN_WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {dirpath}")
+            self._dirs[wd] = dirpath
+            found.update(paths)
+        self._files |= found
+        return found
+
+    def files(self) -> list[str]:
+        return sorted(self._files)
+
+    def changes(self, timeout: float) -> set[str]:
+        """Paths named by the events that arrive within timeout seconds."""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buf = os.read(self._fd, 1 << 16)
+        except BlockingIOError:
+            return set()
+        changed: set[str] = set()
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+            name = os.fsdecode(buf[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b"\0"))
+            offset += _EVENT_HEADER.size + length
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped: treat everything as changed (content hashes filter it down)
+                return self._files | self._rescan()
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed |= self._watch_tree(path)
+                continue
+            if is_watched(name):
+                changed.add(path)
+                if mask & (_IN_DELETE | _IN_MOVED_FROM):
+                    self._files.discard(path)
+                else:
+                    self._files.add(path)
+        return changed
+
+    def _rescan(self) -> set[str]:
+        self._files = {path for _, paths in _walk(self.root) for path in paths}
+        return set(self._files)
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+def open_source(root: str, poll: bool = False, interval: float = DEFAULT_INTERVAL_S):
+    """InotifySource for root where the platform has it (and poll is False), else PollingSource."""
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifySource(root)
+        except OSError:
+            pass
+    return PollingSource(root, interval)
+
+
+def diff_results(before: dict, after: dict) -> dict:
+    """
+    {check: {field: [before, after]}} for the fields that differ between two results dicts;
+    a check present on one side only, or whose result is not a dict, maps to [before, after].
+    """
+    changed: dict[str, Any] = {}
+    for check in {**before, **after}:
+        old, new = before.get(check), after.get(check)
+        if old == new:
+            continue
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            changed[check] = [old, new]
+            continue
+        changed[check] = {
+            field: [old.get(field), new.get(field)]
+            for field in {**old, **new}
+            if old.get(field) != new.get(field)
+        }
+    return changed
+
+
+def _text_value(value: Any) -> str:
+    if isinstance(value, (list, dict)):
+        return f"{len(value)} items"
+    return dumps(value)
+
+
+def format_text(event: dict) -> str:
+    """Short human-readable lines for one watch event."""
+    source = event["source"]
+    if event["event"] == "removed":
+        return f"{source}: removed"
+    if event["event"] == "error":
+        return f"{source}: error: {event['error']}"
+    if event["event"] == "audit":
+        failing = [name for name, r in event["results"].items() if isinstance(r, dict) and r.get("pass_fail") == "fail"]
+        return f"{source}: audited in {event['elapsed_ms']} ms; failing: {', '.join(failing) or 'none'}"
+    lines = [f"{source}: re-audited in {event['elapsed_ms']} ms" + ("" if event["changed"] else ", no changes")]
+    for check, fields in event["changed"].items():
+        if isinstance(fields, list):
+            lines.append(f"  {check}: {_text_value(fields[0])} -> {_text_value(fields[1])}")
+            continue
+        for field, (old, new) in fields.items():
+            lines.append(f"  {check}.{field}: {_text_value(old)} -> {_text_value(new)}")
+    return "\n".join(lines)
+
+
+class Watcher:
+    """
+    Keeps the last content hash and results per file and turns file changes into watch events.
+    emit is called with each event dict.
+    """
+
+    def __init__(
+        self,
+        source,
+        session: AuditSession,
+        emit: Callable[[dict], None],
+        debounce: float = DEFAULT_DEBOUNCE_S,
+    ):
+        self.source = source
+        self.session = session
+        self.emit = emit
+        self.debounce = debounce
+        self._hashes: dict[str, str] = {}
+        self._results: dict[str, dict] = {}
+
+    def refresh(self, paths: Iterable[str]) -> None:
+        """Re-audit the paths whose content hash changed; report the ones that were removed."""
+        for path in sorted(paths):
+            slug = os.path.splitext(os.path.basename(path))[0]
+            try:
+                with open(path, "rb") as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except FileNotFoundError:
+                if self._hashes.pop(path, None) is not None:
+                    self._results.pop(path, None)
+                    self.emit({"event": "removed", "source": path, "slug": slug})
+                continue
+            except OSError as e:
+                self.emit({"event": "error", "source": path, "slug": slug, "error": str(e)})
+                continue
+            if self._hashes.get(path) == digest:
+                continue
+            self._hashes[path] = digest
+            self._audit(path, slug)
+
+    def _audit(self, path: str, slug: str) -> None:
+        start = time.perf_counter()
+        try:
+            response = self.session.audit({**_post_from_file(path), "incremental": True})
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        if not response.get("ok"):
+            self._results.pop(path, None)
+            self.emit({"event": "error", "source": path, "slug": slug, "error": response.get("error")})
+            return
+        results = response["results"]
+        previous = self._results.get(path)
+        self._results[path] = results
+        event: dict[str, Any] = {"source": path, "slug": slug}
+        if previous is None:
+            event = {"event": "audit", **event, "results": results}
+        else:
+            event = {"event": "diff", **event, "changed": diff_results(previous, results)}
+        event["sections"] = response.get("sections")
+        event["elapsed_ms"] = elapsed_ms
+        self.emit(event)
+
+    def run(self, max_batches: Optional[int] = None) -> None:
+        """Audit every file, then re-audit changes until interrupted (or after max_batches change batches)."""
+        self.refresh(self.source.files())
+        pending: set[str] = set()
+        last_change = 0.0
+        batches = 0
+        while max_batches is None or batches < max_batches:
+            wait = max(self.debounce - (time.monotonic() - last_change), 0.0) if pending else 1.0
+            changed = self.source.changes(wait)
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= self.debounce:
+                self.refresh(pending)
+                pending.clear()
+                batches += 1
+
+
+def _writer(out: IO[str], text: bool) -> Callable[[dict], None]:
+    def emit(event: dict) -> None:
+        out.write((format_text(event) if text else dumps(event)) + "\n")
+        out.flush()
+
+    return emit
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Re-audit Markdown/HTML drafts in a directory as they change.")
+    parser.add_argument("directory", help="Directory of .html/.md drafts (watched recursively)")
+    parser.add_argument("--poll", action="store_true", help="Poll file mtimes instead of using inotify")
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL_S,
+        help=f"Polling interval in seconds (default {DEFAULT_INTERVAL_S})",
+    )
+    parser.add_argument(
+        "--debounce", type=float, default=DEFAULT_DEBOUNCE_S,
+        help=f"Quiet time in seconds before changed files are re-audited (default {DEFAULT_DEBOUNCE_S})",
+    )
+    parser.add_argument("--checks", default=None, metavar="NAME,NAME", help="Run only these checks; default: all")
+    parser.add_argument("--cache-dir", default=None, help="Share the SQLite result cache in this directory")
+    parser.add_argument("--text", action="store_true", help="Print short text lines instead of JSON events")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Directory not found: {args.directory}", file=sys.stderr)
+        return 1
+    checks = [c.strip() for c in args.checks.split(",") if c.strip()] if args.checks else None
+    unknown = [c for c in checks or () if c not in CHECK_ARTIFACTS and c not in LOOKUPS]
+    if unknown:
+        print(f"--checks: unknown check(s) {', '.join(unknown)}; expected {', '.join([*CHECK_ARTIFACTS, *LOOKUPS])}", file=sys.stderr)
+        return 2
+    cache_dir = args.cache_dir or os.environ.get(CACHE_DIR_ENV)
+    session = AuditSession(cache=ResultCache(cache_dir) if cache_dir else None, checks=checks)
+    source = open_source(args.directory, poll=args.poll, interval=args.interval)
+    print(dumps({"event": "watching", "directory": args.directory, "source": source.name}), file=sys.stderr)
+    try:
+        Watcher(source, session, _writer(sys.stdout, args.text), debounce=args.debounce).run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        source.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
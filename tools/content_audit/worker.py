@@ -0,0 +1,173 @@
+"""
+Long-lived audit worker: keeps auditors and the spacy model warm across requests.
+
+Protocol (newline-delimited JSON, one object per line, on stdin or a Unix socket):
+    request:  {"id": "abc", "title": "...", "content": "...", "html": "..."}
+    response: {"id": "abc", "ok": true, "results": {...}}
+
+With "stream": true in the request, the worker instead answers with one
+{"id", "event": "check", ...} line per check as it completes, then {"id", "event": "summary", ...}.
+
+The worker recycles itself after max_jobs requests, once RSS exceeds max_rss_mb, or once
+max_lingering timed-out checks (parallel mode, see executor.py) are still running:
+    - stdin mode: writes {"event": "recycle", "reason": ..., "jobs": N} and exits 0;
+      the parent that owns the pipe should spawn a fresh worker.
+    - socket mode: closes the listener and re-execs itself on the same socket path.
+"""
+
+import json
+import os
+import socket
+import sys
+import time
+from typing import IO, Callable, Optional
+
+from .executor import lingering_checks
+from .runner import AuditSession, check_event, summary_event
+from .serialize import dumps
+
+DEFAULT_MAX_JOBS = 500
+DEFAULT_MAX_RSS_MB = 1024
+DEFAULT_MAX_LINGERING = 2
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process in MB (None if it cannot be measured)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is peak RSS: kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def handle_line(session: AuditSession, line: str, emit: Optional[Callable[[dict], None]] = None) -> dict:
+    """
+    Decode one request line and run the audit; always returns a response dict tagged with the request id.
+    For streaming requests, per-check lines go to emit and the returned dict is the summary line.
+    """
+    try:
+        payload = json.loads(line)
+    except ValueError as e:
+        return {"id": None, "ok": False, "error": f"Invalid JSON: {e}"}
+    if not isinstance(payload, dict):
+        return {"id": None, "ok": False, "error": "Invalid JSON: request must be an object"}
+
+    request_id = payload.get("id")
+    stream = bool(payload.get("stream")) and emit is not None
+    on_result = None
+    if stream:
+        def on_result(name, status, result, elapsed_ms):
+            emit({"id": request_id, **check_event(name, status, result, elapsed_ms)})
+
+    start = time.perf_counter()
+    try:
+        response = session.audit(payload, on_result=on_result)
+    except Exception as e:
+        response = {"ok": False, "error": str(e)}
+    if stream:
+        return {"id": request_id, **summary_event(response, round((time.perf_counter() - start) * 1000, 1))}
+    return {"id": request_id, **response}
+
+
+class AuditWorker:
+    """Serves audit requests from one warm AuditSession until a recycle limit is hit."""
+
+    def __init__(
+        self,
+        session: Optional[AuditSession] = None,
+        max_jobs: int = DEFAULT_MAX_JOBS,
+        max_rss_mb: Optional[float] = DEFAULT_MAX_RSS_MB,
+        max_lingering: Optional[int] = DEFAULT_MAX_LINGERING,
+    ):
+        self.session = session or AuditSession()
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.max_lingering = max_lingering
+        self.jobs = 0
+
+    def recycle_reason(self) -> Optional[str]:
+        """Return "max_jobs" / "max_rss" / "lingering_checks" when the worker should be replaced, else None."""
+        if self.max_jobs and self.jobs >= self.max_jobs:
+            return "max_jobs"
+        if self.max_rss_mb:
+            rss = current_rss_mb()
+            if rss is not None and rss >= self.max_rss_mb:
+                return "max_rss"
+        if self.max_lingering and lingering_checks() >= self.max_lingering:
+            return "lingering_checks"
+        return None
+
+    def serve_stream(self, infile: IO[str], outfile: IO[str]) -> Optional[str]:
+        """
+        Answer NDJSON requests from infile until EOF or a recycle limit.
+        Returns the recycle reason, or None on EOF.
+        """
+        def emit(message: dict) -> None:
+            outfile.write(dumps(message) + "\n")
+            outfile.flush()
+
+        for line in infile:
+            if not line.strip():
+                continue
+            emit(handle_line(self.session, line, emit))
+            self.jobs += 1
+            reason = self.recycle_reason()
+            if reason:
+                outfile.write(dumps({"event": "recycle", "reason": reason, "jobs": self.jobs}) + "\n")
+                outfile.flush()
+                return reason
+        return None
+
+    def serve_socket(self, path: str) -> Optional[str]:
+        """
+        Listen on a Unix socket; each connection may send any number of NDJSON requests.
+        Returns the recycle reason once a limit is hit (the listener is closed first).
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(path)
+            server.listen()
+            while True:
+                conn, _ = server.accept()
+                with conn, conn.makefile("r", encoding="utf-8") as rf, conn.makefile("w", encoding="utf-8") as wf:
+                    try:
+                        reason = self.serve_stream(rf, wf)
+                    except (BrokenPipeError, ConnectionResetError):
+                        reason = self.recycle_reason()
+                if reason:
+                    return reason
+        finally:
+            server.close()
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def run_worker(
+    session: Optional[AuditSession] = None,
+    socket_path: Optional[str] = None,
+    max_jobs: int = DEFAULT_MAX_JOBS,
+    max_rss_mb: Optional[float] = DEFAULT_MAX_RSS_MB,
+) -> int:
+    """Entry point for run_audit.py --worker. Returns the process exit code."""
+    worker = AuditWorker(session=session, max_jobs=max_jobs, max_rss_mb=max_rss_mb)
+    if socket_path is None:
+        worker.serve_stream(sys.stdin, sys.stdout)
+        return 0
+
+    reason = worker.serve_socket(socket_path)
+    if reason:
+        # Fresh interpreter on the same socket path: drops all accumulated memory
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(sys.executable, [sys.executable] + sys.argv)
+    return 0